@@ -0,0 +1,390 @@
+"""Tiered archival of closed intake and backlog history.
+
+Closed entries older than a cutoff move out of the hot files into
+gzip-compressed monthly archives:
+
+    intake-log.md              processed/actioned  -> data/research/archive/intake-YYYY-MM.md.gz
+    implementation-backlog.md  done/rejected       -> data/portfolio/archive/backlog-YYYY-MM.md.gz
+
+Archives are ordinary markdown once decompressed (intake lines, or
+BUILD/ADOPT/OFFER tables), so the hubdata parsers read them unchanged. Each
+archive directory has a manifest.json with every month's date range, entry
+count and counts per status, so totals and date-bounded reads don't need to
+open the archives at all.
+
+Backlog rows have no date column. A row's date is the newest YYYY-MM-DD in
+its cells, else the date its Source URL was last logged in the intake log, else
+the first day an archive run saw it closed (tracked in .closed-since.json).
+
+Archives are written before the hot file is rewritten, and merging into an
+existing month skips lines it already holds, so a run interrupted halfway
+is simply repeated.
+
+Usage (via generate.py):
+    python3 scripts/generate.py archive run [--older-than 90] [--dry-run]
+    python3 scripts/generate.py archive status
+    python3 scripts/generate.py archive search "pool heater" [--file backlog]
+"""
+
+import functools
+import gzip
+import json
+import logging
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import hubdata
+import hublock
+
+
+SOURCES = {
+    "intake": Path("data/research/intake-log.md"),
+    "backlog": Path("data/portfolio/implementation-backlog.md"),
+}
+ARCHIVE_DIRS = {
+    "intake": Path("data/research/archive"),
+    "backlog": Path("data/portfolio/archive"),
+}
+CLOSED_STATUSES = {
+    "intake": {"processed", "actioned"},
+    "backlog": {"done", "rejected"},
+}
+TITLES = {"intake": "Research Intake Archive", "backlog": "Implementation Backlog Archive"}
+PARSERS = {"intake": hubdata.parse_intake, "backlog": hubdata.parse_backlog}
+MANIFEST_NAME = "manifest.json"
+CLOSED_SINCE_NAME = ".closed-since.json"
+MANIFEST_VERSION = 1
+DEFAULT_DAYS = 90
+EMPTY_ROW = "| *(none yet)* | — | — | — | — |"
+DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+
+logger = logging.getLogger("intel-hub")
+
+
+def archive_name(kind: str, month: str) -> str:
+    return f"{kind}-{month}.md.gz"
+
+
+def read_gz(path: Path) -> str:
+    if not path.exists():
+        return ""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_manifest(archive_dir: Path) -> dict:
+    manifest = hubdata.load_json(archive_dir / MANIFEST_NAME)
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "updated": None, "files": {}}
+    return manifest
+
+
+# --- Splitting hot files ----------------------------------------------------
+
+
+def split_intake(text: str, cutoff: date) -> tuple[list[str], dict[str, list[tuple[str, str]]]]:
+    """Hot lines to keep, and closed entries before cutoff as {month: [(timestamp, line)]}."""
+    keep, moved = [], defaultdict(list)
+    closed = CLOSED_STATUSES["intake"]
+    for line in text.split("\n"):
+        entry = next(hubdata.parse_intake([line]), None)
+        when = hubdata.parse_date(entry["timestamp"]) if entry else None
+        if entry and when and entry["status"].lower() in closed and when < cutoff:
+            moved[when.strftime("%Y-%m")].append((entry["timestamp"], line))
+        else:
+            keep.append(line)
+    return keep, moved
+
+
+def backlog_tables(lines: list[str]) -> Iterator[tuple[int, int, str, list[str], list[str]]]:
+    """Yield (line index, table start, section, header cells, row cells) for every backlog data row."""
+    section = None
+    header = None
+    start = 0
+    for i, line in enumerate(lines):
+        if line.startswith("## "):
+            section, header = line[3:].strip(), None
+            continue
+        if not line.lstrip().startswith("|"):
+            header = None
+            continue
+        cells = hubdata.split_row(line)
+        if header is None:
+            header, start = [c.lower() for c in cells], i
+            continue
+        if hubdata.is_separator_row(cells) or hubdata.is_placeholder(cells[0]):
+            continue
+        yield i, start, section, header, cells
+
+
+def backlog_row_date(cells: list[str], source: str, intake_dates) -> date | None:
+    """Newest date written in the row, else when its source URL was last logged in the intake."""
+    dates = [d for d in (hubdata.parse_date(m) for cell in cells for m in DATE_RE.findall(cell)) if d]
+    if dates:
+        return max(dates)
+    urls = hubdata.find_urls(source)
+    if urls:
+        logged = intake_dates()
+        found = [logged[u] for u in map(hubdata.normalize_url, urls) if u in logged]
+        if found:
+            return max(found)
+    return None
+
+
+def split_backlog(text: str, cutoff: date, intake_dates, closed_since: dict[str, str],
+                  today: date) -> tuple[list[str], dict[str, dict[str, dict]]]:
+    """Hot lines to keep, and closed rows before cutoff as {month: {section: {header, rows, dates}}}.
+
+    closed_since is updated in place: closed rows with no date of their own
+    are stamped with today and archive once that stamp passes the cutoff.
+    """
+    lines = text.split("\n")
+    closed = CLOSED_STATUSES["backlog"]
+    drop = set()
+    moved: dict[str, dict[str, dict]] = defaultdict(dict)
+    still_closed = set()
+    for i, table_start, section, header, cells in backlog_tables(lines):
+        row = dict(zip(header, cells))
+        if row.get("status", "").lower() not in closed:
+            continue
+        key = f"{section}:{cells[0]}"
+        when = backlog_row_date(cells, row.get("source", ""), intake_dates)
+        if when is None:
+            when = hubdata.parse_date(closed_since.setdefault(key, today.isoformat()))
+            still_closed.add(key)
+        if when >= cutoff:
+            continue
+        drop.add(i)
+        still_closed.discard(key)
+        bucket = moved[when.strftime("%Y-%m")].setdefault(
+            section, {"header": lines[table_start:table_start + 2], "rows": [], "dates": []})
+        bucket["rows"].append(lines[i])
+        bucket["dates"].append(when.isoformat())
+
+    for key in list(closed_since):
+        if key not in still_closed:
+            del closed_since[key]
+
+    keep = []
+    remaining = [line for i, line in enumerate(lines) if i not in drop]
+    for j, line in enumerate(remaining):
+        keep.append(line)
+        # Leave the placeholder row behind when a table is emptied
+        if line.lstrip().startswith("|") and hubdata.is_separator_row(hubdata.split_row(line)):
+            nxt = remaining[j + 1] if j + 1 < len(remaining) else ""
+            if not nxt.lstrip().startswith("|"):
+                keep.append(EMPTY_ROW)
+    return keep, moved
+
+
+# --- Writing archives -------------------------------------------------------
+
+
+def merge_intake_archive(path: Path, month: str, entries: list[tuple[str, str]]) -> str:
+    """Merge entries into a month's archive (newest first). Returns the archive's new text."""
+    existing = []
+    for line in read_gz(path).split("\n"):
+        entry = next(hubdata.parse_intake([line]), None)
+        if entry:
+            existing.append((entry["timestamp"], line))
+    seen = {line for _, line in existing}
+    merged = existing + [(ts, line) for ts, line in entries if line not in seen]
+    merged.sort(key=lambda e: e[0], reverse=True)
+    text = f"# {TITLES['intake']} — {month}\n\n---\n\n" + "\n".join(line for _, line in merged) + "\n"
+    hubdata.write_atomic(path, gzip.compress(text.encode(), mtime=0))
+    return text
+
+
+def merge_backlog_archive(path: Path, month: str, sections: dict[str, dict]) -> str:
+    """Merge rows into a month's archive, one table per section. Returns the archive's new text."""
+    tables: dict[str, dict] = {}
+    lines = read_gz(path).split("\n")
+    for i, start, section, _, _ in backlog_tables(lines):
+        table = tables.setdefault(section, {"header": lines[start:start + 2], "rows": []})
+        table["rows"].append(lines[i])
+    for section, bucket in sections.items():
+        table = tables.setdefault(section, {"header": bucket["header"], "rows": []})
+        seen = set(table["rows"])
+        table["rows"] += [row for row in bucket["rows"] if row not in seen]
+
+    out = [f"# {TITLES['backlog']} — {month}", ""]
+    for section, table in tables.items():
+        out += [f"## {section}", "", *table["header"], *table["rows"], ""]
+    text = "\n".join(out)
+    hubdata.write_atomic(path, gzip.compress(text.encode(), mtime=0))
+    return text
+
+
+def manifest_entry(kind: str, month: str, previous: dict | None, text: str, dates: list[str]) -> dict:
+    """Date range, count and statuses for one month's archive."""
+    records = list(PARSERS[kind](text.split("\n")))
+    statuses = Counter(r.get("status", "").lower() for r in records)
+    if previous and previous["first"]:
+        dates = dates + [previous["first"], previous["last"]]
+    return {
+        "month": month,
+        "first": min(dates) if dates else None,
+        "last": max(dates) if dates else None,
+        "count": len(records),
+        "by_status": dict(sorted(statuses.items())),
+    }
+
+
+# --- Running ----------------------------------------------------------------
+
+
+def intake_date_lookup(output_dir: Path):
+    """A lazy loader for {normalized URL: date last logged}, over hot and archived intake."""
+
+    @functools.cache
+    def load() -> dict[str, date]:
+        logged = {}
+        for entry in iter_records(output_dir, "intake"):
+            when = hubdata.parse_date(entry["timestamp"])
+            for url in hubdata.find_urls(entry["url"]):
+                key = hubdata.normalize_url(url)
+                if when and (key not in logged or when > logged[key]):
+                    logged[key] = when
+        return logged
+
+    return load
+
+
+def split_kind(output_dir: Path, kind: str, text: str, cutoff: date, closed_since: dict[str, str],
+               today: date) -> tuple[list[str], dict, dict[str, int]]:
+    """Split a hot file's text. Returns (lines to keep, moved entries by month, {month: entries moved})."""
+    if kind == "intake":
+        keep, moved = split_intake(text, cutoff)
+    else:
+        keep, moved = split_backlog(text, cutoff, intake_date_lookup(output_dir), closed_since, today)
+    counts = {month: (len(entries) if kind == "intake" else sum(len(b["rows"]) for b in entries.values()))
+              for month, entries in sorted(moved.items())}
+    return keep, moved, counts
+
+
+def archive_kind(output_dir: Path, kind: str, cutoff: date, dry_run: bool = False,
+                 today: date | None = None) -> dict[str, int]:
+    """Archive one hot file. Returns {month: entries moved}."""
+    today = today or date.today()
+    rel = SOURCES[kind].as_posix()
+    source = output_dir / rel
+    if not source.exists():
+        return {}
+    archive_dir = output_dir / ARCHIVE_DIRS[kind]
+    closed_since_path = archive_dir / CLOSED_SINCE_NAME
+
+    if dry_run:
+        # Preview with unmerged journal entries overlaid; nothing is merged, locked or written
+        text = hublock.read_text(output_dir, rel, include_pending=True)
+        return split_kind(output_dir, kind, text, cutoff, hubdata.load_json(closed_since_path), today)[2]
+
+    # Apply journaled writes first, then hold the file's merge lock so no session edits it mid-archive
+    hublock.merge(output_dir, rel)
+    with hublock.FileLock(hublock.journal_paths(output_dir, rel)["target_lock"]):
+        text = source.read_text()
+        closed_since = hubdata.load_json(closed_since_path)
+        keep, moved, counts = split_kind(output_dir, kind, text, cutoff, closed_since, today)
+
+        manifest = load_manifest(archive_dir)
+        for month, entries in sorted(moved.items()):
+            name = archive_name(kind, month)
+            if kind == "intake":
+                archived = merge_intake_archive(archive_dir / name, month, entries)
+                dates = [ts[:10] for ts, _ in entries]
+            else:
+                archived = merge_backlog_archive(archive_dir / name, month, entries)
+                dates = [d for bucket in entries.values() for d in bucket["dates"]]
+            manifest["files"][name] = {"kind": kind, "source": rel,
+                                       **manifest_entry(kind, month, manifest["files"].get(name), archived, dates)}
+        if moved:
+            manifest["updated"] = datetime.now().isoformat(timespec="seconds")
+            manifest["files"] = dict(sorted(manifest["files"].items()))
+            hubdata.write_atomic(archive_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+            hubdata.write_atomic(source, "\n".join(keep))
+        if kind == "backlog" and (closed_since or closed_since_path.exists()):
+            hubdata.write_atomic(closed_since_path, json.dumps(closed_since, indent=2, sort_keys=True).encode())
+
+    logger.debug(f"Archived {sum(counts.values())} {kind} entries from {rel}")
+    return counts
+
+
+def run(output_dir: Path, days: int = DEFAULT_DAYS, before: date | None = None,
+        dry_run: bool = False, today: date | None = None) -> dict[str, dict[str, int]]:
+    """Archive closed intake and backlog entries older than the cutoff. Returns {kind: {month: moved}}.
+
+    The backlog goes first so rows can still be dated from intake entries
+    that this same run is about to archive.
+    """
+    today = today or date.today()
+    cutoff = before or today - timedelta(days=days)
+    return {kind: archive_kind(output_dir, kind, cutoff, dry_run=dry_run, today=today)
+            for kind in ("backlog", "intake")}
+
+
+# --- Reading ----------------------------------------------------------------
+
+
+def archive_files(archive_dir: Path, kind: str, since: date | None = None,
+                  until: date | None = None) -> list[Path]:
+    """Archive files for kind whose date range overlaps [since, until], newest month first."""
+    files = []
+    for name, entry in load_manifest(archive_dir)["files"].items():
+        if entry["kind"] != kind:
+            continue
+        if since and entry["last"] and entry["last"][:10] < since.isoformat():
+            continue
+        if until and entry["first"] and entry["first"][:10] > until.isoformat():
+            continue
+        files.append(archive_dir / name)
+    return sorted(files, reverse=True)
+
+
+def iter_archived(archive_dir: Path, kind: str, since: date | None = None,
+                  until: date | None = None) -> Iterator[dict]:
+    """Parsed entries from the archives alone, tagged with an `archive` key (the file name)."""
+    parser = PARSERS[kind]
+    for path in archive_files(archive_dir, kind, since, until):
+        for record in parser(read_gz(path).split("\n")):
+            record["archive"] = path.name
+            yield record
+
+
+def iter_records(output_dir: Path, kind: str, include_archive: bool = True,
+                 since: date | None = None, until: date | None = None) -> Iterator[dict]:
+    """Parsed entries from the hot file, then (optionally) from the archives.
+
+    since/until only prune which archives are opened; hot entries are all yielded.
+    """
+    source = output_dir / SOURCES[kind]
+    if source.exists():
+        with open(source, encoding="utf-8", errors="replace") as f:
+            yield from PARSERS[kind](f)
+    if include_archive:
+        yield from iter_archived(output_dir / ARCHIVE_DIRS[kind], kind, since, until)
+
+
+def archived_counts(output_dir: Path, kind: str) -> dict[str, int]:
+    """Archived entries per status, from the manifest alone."""
+    counts = Counter()
+    for entry in load_manifest(output_dir / ARCHIVE_DIRS[kind])["files"].values():
+        if entry["kind"] == kind:
+            counts.update(entry["by_status"])
+    return dict(counts)
+
+
+def search(output_dir: Path, kind: str, pattern: str) -> Iterator[tuple[str, str]]:
+    """(where, line) for hot and archived lines containing pattern (case-insensitive)."""
+    needle = pattern.lower()
+    source = output_dir / SOURCES[kind]
+    if source.exists():
+        with open(source, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if needle in line.lower():
+                    yield SOURCES[kind].name, line.rstrip("\n")
+    for path in archive_files(output_dir / ARCHIVE_DIRS[kind], kind):
+        for line in read_gz(path).split("\n"):
+            if needle in line.lower() and not line.startswith("#"):
+                yield path.name, line
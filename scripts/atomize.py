@@ -0,0 +1,305 @@
+"""Batch /atomize stage: many sources, every configured platform, in parallel.
+
+Each source is split once into chunks (one per `##` section, long sections
+split on paragraph boundaries). Every chunk x platform pair becomes a draft
+variant built from the chunk's strongest sentences and shaped by the local
+PLATFORM_RULES table (length limit, hashtags, layout). Drafts are written to
+data/portfolio/atomized/ and added to content-pipeline.md in the Idea stage,
+where /atomize or the user polishes them. When an edit changes or removes a
+chunk, the Ideas (and drafts) for its old hash are retired; items already
+moved past Idea are left alone.
+
+Chunks and variants are cached by content hash in
+data/portfolio/.atomize-cache.json, so re-atomizing an edited post only
+regenerates the chunks that actually changed.
+
+Usage (via generate.py):
+    python3 scripts/generate.py atomize posts/*.md [--platforms X LinkedIn]
+"""
+
+import hashlib
+import json
+import logging
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import hubdata
+import pipeline
+
+
+CACHE_PATH = Path("data/portfolio/.atomize-cache.json")
+OUTPUT_DIR = Path("data/portfolio/atomized")
+CACHE_VERSION = 1
+CHUNK_CHARS = 1500
+
+# Bump when PLATFORM_RULES or the variant layout changes so cached drafts are rebuilt
+RULES_VERSION = 1
+PLATFORM_RULES = {
+    "X": {"max_chars": 280, "hashtags": 2, "layout": "single"},
+    "Threads": {"max_chars": 500, "hashtags": 1, "layout": "single"},
+    "Bluesky": {"max_chars": 300, "hashtags": 0, "layout": "single"},
+    "LinkedIn": {"max_chars": 1300, "hashtags": 3, "layout": "bullets"},
+    "Facebook": {"max_chars": 600, "hashtags": 0, "layout": "question"},
+    "Instagram": {"max_chars": 2200, "hashtags": 8, "layout": "caption"},
+    "TikTok": {"max_chars": 300, "hashtags": 4, "layout": "caption"},
+    "YouTube": {"max_chars": 500, "hashtags": 0, "layout": "question"},
+    "Google Business Profile": {"max_chars": 750, "hashtags": 0, "layout": "update"},
+    "Newsletter": {"max_chars": 2000, "hashtags": 0, "layout": "bullets"},
+}
+DEFAULT_RULE = {"max_chars": 500, "hashtags": 0, "layout": "single"}
+PLATFORM_ALIASES = {"twitter": "X", "x.com": "X", "gbp": "Google Business Profile",
+                    "google business": "Google Business Profile"}
+
+STOPWORDS = set(
+    "a an and are as at be but by can do for from has have how i if in into is it its "
+    "just more most my no not of on or our so than that the their them then there these "
+    "they this to up us was we what when which who why will with you your".split()
+)
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z'-]+")
+MARKDOWN_RE = re.compile(r"(\*\*|__|`|!\[[^\]]*\]\([^)]*\)|\[([^\]]*)\]\([^)]*\))")
+
+logger = logging.getLogger("intel-hub")
+
+
+def rule_for(platform: str) -> dict:
+    name = PLATFORM_ALIASES.get(platform.lower(), platform)
+    for known, rule in PLATFORM_RULES.items():
+        if known.lower() == name.lower():
+            return rule
+    return DEFAULT_RULE
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(" ".join(text.split()).encode()).hexdigest()
+
+
+def plain(text: str) -> str:
+    """Strip inline markdown so variants read as plain social copy."""
+    return MARKDOWN_RE.sub(lambda m: m.group(2) or "", text).strip()
+
+
+def source_title(text: str, fallback: str) -> str:
+    for line in text.splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return fallback
+
+
+def split_chunks(text: str) -> list[dict]:
+    """Split a source into reusable chunks: one per `##` section, capped at CHUNK_CHARS."""
+    sections = []
+    heading, paragraphs = "", []
+    for block in re.split(r"\n\s*\n", text):
+        block = block.strip()
+        # Titles, code and tables don't make social copy
+        if not block or block.startswith(("# ", "```", "|")):
+            continue
+        if block.startswith("## "):
+            if paragraphs:
+                sections.append((heading, paragraphs))
+            first, _, rest = block.partition("\n")
+            heading, paragraphs = first[3:].strip(), [rest.strip()] if rest.strip() else []
+        else:
+            paragraphs.append(block)
+    if paragraphs:
+        sections.append((heading, paragraphs))
+
+    chunks = []
+    for heading, paragraphs in sections:
+        current = []
+        for paragraph in paragraphs:
+            if current and sum(len(p) for p in current) + len(paragraph) > CHUNK_CHARS:
+                chunks.append({"heading": heading, "text": "\n\n".join(current)})
+                current = []
+            current.append(paragraph)
+        if current:
+            chunks.append({"heading": heading, "text": "\n\n".join(current)})
+    for chunk in chunks:
+        chunk["hash"] = content_hash(f"{chunk['heading']}\n{chunk['text']}")
+    return chunks
+
+
+def keywords(text: str, limit: int) -> list[str]:
+    counts = Counter(w.lower() for w in WORD_RE.findall(text) if w.lower() not in STOPWORDS and len(w) > 3)
+    return [w for w, _ in counts.most_common(limit)]
+
+
+def key_sentences(text: str) -> list[str]:
+    """Sentences ordered by importance: the lead first, then by keyword density."""
+    sentences = [plain(s) for s in SENTENCE_RE.split(" ".join(plain(text).split())) if s.strip()]
+    if not sentences:
+        return []
+    weights = Counter(w.lower() for w in WORD_RE.findall(text) if w.lower() not in STOPWORDS)
+
+    def score(sentence):
+        words = [w.lower() for w in WORD_RE.findall(sentence)]
+        return sum(weights[w] for w in words) / (len(words) or 1)
+
+    return [sentences[0]] + sorted(sentences[1:], key=score, reverse=True)
+
+
+def fit(text: str, limit: int) -> str:
+    """Trim to the limit on a word boundary."""
+    if len(text) <= limit:
+        return text
+    cut = text[:max(limit - 1, 0)].rsplit(" ", 1)[0].rstrip(",;:")
+    return cut + "…"
+
+
+def build_variant(chunk: dict, platform: str) -> str:
+    """Draft one platform variant of a chunk according to its rule."""
+    rule = rule_for(platform)
+    limit = rule["max_chars"]
+    sentences = key_sentences(chunk["text"]) or [chunk["heading"]]
+    tags = " ".join(f"#{w.replace('-', '')}" for w in keywords(chunk["text"], rule["hashtags"]))
+    reserve = len(tags) + 2 if tags else 0
+
+    if rule["layout"] == "bullets":
+        hook = chunk["heading"] or sentences[0]
+        bullets = [f"- {s}" for s in sentences[1 if not chunk["heading"] else 0:5]]
+        body = "\n".join([hook, ""] + bullets)
+    elif rule["layout"] == "question":
+        topic = chunk["heading"] or "this"
+        body = " ".join(sentences[:2]) + f"\n\nWhat's your take on {topic.lower()}?"
+    elif rule["layout"] == "caption":
+        body = "\n\n".join(sentences[:3])
+    elif rule["layout"] == "update":
+        body = " ".join(sentences[:2]) + "\n\nCall or book online to learn more."
+    else:
+        body = ""
+        for sentence in sentences:
+            candidate = f"{body} {sentence}".strip()
+            if len(candidate) > limit - reserve:
+                break
+            body = candidate
+        body = body or sentences[0]
+
+    body = fit(body, limit - reserve)
+    return f"{body}\n\n{tags}" if tags else body
+
+
+def _variant_job(args: tuple[dict, str]) -> str:
+    chunk, platform = args
+    return build_variant(chunk, platform)
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:60] or "source"
+
+
+class AtomizeCache:
+    """Chunk lists and queued pipeline items per source, and variant text per (chunk hash, platform)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.sources: dict[str, list[str]] = {}
+        self.items: dict[str, list[list[str]]] = {}
+        self.variants: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "AtomizeCache":
+        cache = cls(path)
+        data = hubdata.load_json(cache.path)
+        if data.get("version") == CACHE_VERSION:
+            cache.sources = data["sources"]
+            cache.items = data.get("items", {})
+            cache.variants = data["variants"]
+        return cache
+
+    def save(self):
+        hubdata.write_atomic(self.path, json.dumps({"version": CACHE_VERSION, "sources": self.sources,
+                                                    "items": self.items, "variants": self.variants}))
+
+    @staticmethod
+    def key(chunk_hash: str, platform: str) -> str:
+        return f"{chunk_hash}:{platform}:{RULES_VERSION}"
+
+
+def atomize(output_dir: Path, sources: list[Path], platforms: list[str],
+            workers: int | None = None) -> dict:
+    """Atomize sources into per-platform drafts and queue them as pipeline Ideas.
+
+    Returns counts: chunks, changed chunks, variants generated and reused,
+    pipeline items added, and stale Idea items retired.
+    """
+    cache = AtomizeCache.load(output_dir / CACHE_PATH)
+    stats = {"sources": len(sources), "chunks": 0, "changed_chunks": 0,
+             "generated": 0, "reused": 0, "queued": 0, "retired": 0}
+
+    plan = []  # (source path, title, chunk)
+    for source in sources:
+        text = source.read_text(errors="replace")
+        chunks = split_chunks(text)
+        previous = set(cache.sources.get(str(source), []))
+        stats["chunks"] += len(chunks)
+        stats["changed_chunks"] += sum(1 for c in chunks if c["hash"] not in previous)
+        cache.sources[str(source)] = [c["hash"] for c in chunks]
+        title = source_title(text, source.stem)
+        plan += [(source, title, chunk) for chunk in chunks]
+
+    jobs = []
+    seen = set()
+    for _, _, chunk in plan:
+        for platform in platforms:
+            key = cache.key(chunk["hash"], platform)
+            if key not in cache.variants and key not in seen:
+                seen.add(key)
+                jobs.append((chunk, platform))
+    stats["generated"] = len(jobs)
+    stats["reused"] = len(plan) * len(platforms) - len(jobs)
+
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_variant_job, jobs, chunksize=max(len(jobs) // 32, 1)))
+    else:
+        results = [_variant_job(job) for job in jobs]
+    for (chunk, platform), variant in zip(jobs, results):
+        cache.variants[cache.key(chunk["hash"], platform)] = variant
+
+    flow = pipeline.Pipeline.load(output_dir, platforms)
+    expected = {str(source): set() for source in sources}
+    drafts = set()
+    for source, title, chunk in plan:
+        folder = output_dir / OUTPUT_DIR / slugify(title)
+        for platform in platforms:
+            variant = cache.variants[cache.key(chunk["hash"], platform)]
+            draft = folder / f"{slugify(platform)}-{chunk['hash'][:8]}.md"
+            if not draft.exists():
+                draft.parent.mkdir(parents=True, exist_ok=True)
+                draft.write_text(f"# {title} — {platform}\n\n{variant}\n")
+            label = f"{title}: {chunk['heading']}" if chunk["heading"] else title
+            item_title = f"{label} [{chunk['hash'][:8]}]".replace("|", "/")
+            expected[str(source)].add((platform, item_title))
+            drafts.add(draft)
+            if (platform, item_title) not in flow.items:
+                flow.add(platform, item_title, stage="Idea", notes=draft.relative_to(output_dir).as_posix())
+                stats["queued"] += 1
+
+    # Ideas queued on earlier runs for chunks (or titles) these sources no longer have
+    current = set().union(*expected.values())
+    stale_drafts = []
+    for source, keys in expected.items():
+        for platform, item_title in cache.items.get(source, []):
+            item = flow.items.get((platform, item_title))
+            if not item or (platform, item_title) in current or item["stage"] != "Idea":
+                continue
+            flow.remove(platform, item_title)
+            draft = output_dir / item["notes"]
+            if item["notes"].startswith(OUTPUT_DIR.as_posix() + "/") and draft not in drafts:
+                stale_drafts.append(draft)
+            stats["retired"] += 1
+        cache.items[source] = sorted(keys)
+    flow.save()
+    # Only once their rows are gone, so a failed save leaves no row pointing at a missing draft
+    for draft in stale_drafts:
+        draft.unlink(missing_ok=True)
+
+    # Drop cached variants for chunks no source uses any more
+    live = {h for hashes in cache.sources.values() for h in hashes}
+    cache.variants = {k: v for k, v in cache.variants.items() if k.split(":", 1)[0] in live}
+    cache.save()
+    logger.debug(f"Atomize: {stats}")
+    return stats
@@ -0,0 +1,357 @@
+"""Near-duplicate detection for researched content.
+
+Computes MinHash signatures over word shingles and keeps them in a banded
+LSH index at data/knowledge/.fingerprints.idx. A new document is checked by
+hashing each signature band and looking up the matching buckets, so a lookup
+only touches the handful of candidates that share a band instead of every
+document in the knowledge base.
+
+The index file stores the band buckets as a sorted table and the signatures
+as packed 32-bit arrays, so loading it reads only the bucket table and the
+document list; a check binary-searches the table and reads just the
+candidates' signatures:
+
+    MAGIC | signatures (one NUM_PERM x uint32 slot per doc) | bucket keys (uint64, sorted)
+          | bucket slots (uint32) | doc ids + metadata (zlib JSON) | footer
+
+Usage (via generate.py):
+    python3 scripts/generate.py dedup check article.txt
+    python3 scripts/generate.py dedup add article.txt --id https://example.com/post
+    python3 scripts/generate.py dedup index
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+
+import hubdata
+import transcripts
+
+
+INDEX_PATH = Path("data/knowledge/.fingerprints.idx")
+LEGACY_INDEX_PATH = Path("data/knowledge/.fingerprints.json")
+INDEX_VERSION = 2
+MAGIC = b"IHFPX002"
+FOOTER = struct.Struct("<IIQI8s")
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+
+# Mersenne prime for the universal hash family (a * x + b) mod p
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Signature of a document with no words (failed or JS-only fetches); it matches nothing
+EMPTY_SIGNATURE = [_MAX_HASH] * NUM_PERM
+
+# Fixed seed so signatures stay comparable across runs and machines
+_rng = random.Random(0x1E1A5)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+KNOWLEDGE_SUFFIXES = {".md", ".txt", transcripts.SUFFIX}
+
+logger = logging.getLogger("intel-hub")
+
+
+class FingerprintError(Exception):
+    """Raised when the index file changes underneath a loaded index."""
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """Return the set of hashed word n-grams for a document."""
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode())}
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode())
+        for i in range(len(words) - size + 1)
+    }
+
+
+def signature(text: str) -> list[int]:
+    """Compute the MinHash signature of a document."""
+    hashed = shingles(text)
+    if not hashed:
+        return list(EMPTY_SIGNATURE)
+    return [
+        min(((a * x + b) % _PRIME) & _MAX_HASH for x in hashed)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimate Jaccard similarity from two signatures. Empty documents match nothing."""
+    if sig_a == EMPTY_SIGNATURE or sig_b == EMPTY_SIGNATURE:
+        return 0.0
+    matches = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return matches / len(sig_a)
+
+
+def band_keys(sig: list[int]) -> list[int]:
+    """Hash each band of a signature (band number included) into a 64-bit bucket key."""
+    keys = []
+    for band in range(BANDS):
+        chunk = sig[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(
+            bytes([band]) + b"".join(v.to_bytes(4, "little") for v in chunk), digest_size=8
+        ).digest()
+        keys.append(int.from_bytes(digest, "little"))
+    return keys
+
+
+def _packed(values: array) -> bytes:
+    """Little-endian bytes of an array, whatever the host byte order."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpacked(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class FingerprintIndex:
+    """Banded LSH index of MinHash signatures, persisted in a packed binary file.
+
+    Documents saved in the file stay on disk: only their ids, metadata and
+    the bucket table are loaded, and signatures are read per candidate.
+    Documents added since the load live in memory (signatures and buckets)
+    until save() writes everything back out.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.docs: dict[str, dict] = {}
+        # Added since load: their signatures and buckets are in memory
+        self.signatures: dict[str, list[int]] = {}
+        self.buckets: dict[int, set[str]] = {}
+        # From the index file: ids by slot, sorted bucket keys and their slots
+        self.stored: dict[str, int] = {}
+        self.stored_ids: list[str] = []
+        self.keys = array("Q")
+        self.slots = array("I")
+        self.stamp: tuple[int, int] | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "FingerprintIndex":
+        index = cls(path)
+        legacy = index.path.with_name(LEGACY_INDEX_PATH.name)
+        if index.path.exists():
+            index._read_file()
+        elif legacy.exists():
+            index._read_legacy(legacy)
+        logger.debug(f"Fingerprint index loaded: {len(index.docs)} docs")
+        return index
+
+    def _read_file(self):
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError("bad magic")
+                f.seek(-FOOTER.size, os.SEEK_END)
+                n_docs, n_keys, meta_offset, meta_len, magic = FOOTER.unpack(f.read(FOOTER.size))
+                if magic != MAGIC:
+                    raise ValueError("truncated")
+                f.seek(meta_offset)
+                header = json.loads(zlib.decompress(f.read(meta_len)))
+                if header.get("version") != INDEX_VERSION or header.get("num_perm") != NUM_PERM:
+                    logger.warning(f"Ignoring incompatible fingerprint index: {self.path}")
+                    return
+                f.seek(len(MAGIC) + n_docs * NUM_PERM * 4)
+                keys = _unpacked("Q", f.read(n_keys * 8))
+                slots = _unpacked("I", f.read(n_keys * 4))
+                st = os.fstat(f.fileno())
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            logger.warning(f"Ignoring unreadable fingerprint index {self.path}: {e}")
+            return
+        self.stored_ids = header["ids"]
+        self.stored = {doc_id: slot for slot, doc_id in enumerate(self.stored_ids)}
+        self.docs = dict(zip(self.stored_ids, header["meta"]))
+        self.keys, self.slots = keys, slots
+        self.stamp = (st.st_mtime_ns, st.st_size)
+
+    def _read_legacy(self, legacy: Path):
+        """Version 1 JSON index: load every signature; the next save converts it."""
+        data = hubdata.load_json(legacy)
+        if data.get("version") != 1 or data.get("num_perm") != NUM_PERM:
+            logger.warning(f"Ignoring incompatible fingerprint index: {legacy}")
+            return
+        for doc_id, doc in data.get("docs", {}).items():
+            meta = dict(doc)
+            self.add(doc_id, meta.pop("signature"), **meta)
+
+    def _read_signatures(self, doc_ids: list[str]) -> dict[str, list[int]]:
+        """Signatures of stored documents, read slot by slot from the index file."""
+        sigs = {}
+        if not doc_ids:
+            return sigs
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if (st.st_mtime_ns, st.st_size) != self.stamp:
+                # Slots may have moved; saving over it would also drop the other writer's docs
+                raise FingerprintError(f"{self.path} was rewritten by another run; try again")
+            for doc_id in sorted(doc_ids, key=self.stored.__getitem__):
+                f.seek(len(MAGIC) + self.stored[doc_id] * NUM_PERM * 4)
+                sigs[doc_id] = _unpacked("I", f.read(NUM_PERM * 4)).tolist()
+        return sigs
+
+    def signature_of(self, doc_id: str) -> list[int]:
+        if doc_id in self.signatures:
+            return self.signatures[doc_id]
+        return self._read_signatures([doc_id])[doc_id]
+
+    def save(self):
+        """Write every document, stored and in-memory, to a fresh index file."""
+        stored = [d for d in self.docs if d not in self.signatures]
+        sigs = self._read_signatures(stored) if stored else {}
+        sigs.update(self.signatures)
+        ids = list(self.docs)
+        entries = sorted((key, slot) for slot, doc_id in enumerate(ids)
+                         if sigs[doc_id] != EMPTY_SIGNATURE for key in band_keys(sigs[doc_id]))
+        header = {"version": INDEX_VERSION, "num_perm": NUM_PERM, "bands": BANDS,
+                  "ids": ids, "meta": [self.docs[d] for d in ids]}
+        packed_header = zlib.compress(json.dumps(header, separators=(",", ":")).encode())
+        parts = [MAGIC, _packed(array("I", [v for doc_id in ids for v in sigs[doc_id]])),
+                 _packed(array("Q", [key for key, _ in entries])),
+                 _packed(array("I", [slot for _, slot in entries]))]
+        meta_offset = sum(len(part) for part in parts)
+        parts += [packed_header, FOOTER.pack(len(ids), len(entries), meta_offset, len(packed_header), MAGIC)]
+        hubdata.write_atomic(self.path, b"".join(parts))
+        legacy = self.path.with_name(LEGACY_INDEX_PATH.name)
+        if legacy != self.path:
+            legacy.unlink(missing_ok=True)
+
+        # Everything is stored now: drop the in-memory copies and read the new file's table
+        self.signatures.clear()
+        self.buckets.clear()
+        self._read_file()
+
+    def _insert(self, doc_id: str, sig: list[int]):
+        self.signatures[doc_id] = sig
+        if sig == EMPTY_SIGNATURE:
+            return
+        for key in band_keys(sig):
+            self.buckets.setdefault(key, set()).add(doc_id)
+
+    def remove(self, doc_id: str):
+        if self.docs.pop(doc_id, None) is None:
+            return
+        sig = self.signatures.pop(doc_id, None)
+        if sig is None:
+            return  # Stored only: dropping it from docs hides its bucket entries
+        for key in band_keys(sig):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.discard(doc_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def add(self, doc_id: str, sig: list[int], **meta):
+        """Add or replace a document signature. Extra keyword args are stored as metadata."""
+        self.remove(doc_id)
+        self.docs[doc_id] = meta
+        self._insert(doc_id, list(sig))
+
+    def candidates(self, sig: list[int]) -> set[str]:
+        """Documents sharing at least one band with sig."""
+        found = set()
+        for key in band_keys(sig):
+            found.update(self.buckets.get(key, ()))
+            i = bisect.bisect_left(self.keys, key)
+            while i < len(self.keys) and self.keys[i] == key:
+                doc_id = self.stored_ids[self.slots[i]]
+                # Removed or replaced since load: the stored entry is stale
+                if doc_id in self.docs and doc_id not in self.signatures:
+                    found.add(doc_id)
+                i += 1
+        return found
+
+    def query(self, sig: list[int], threshold: float = DEFAULT_THRESHOLD,
+              exclude: str | None = None) -> list[tuple[str, float]]:
+        """Return (doc_id, similarity) pairs at or above threshold, best first."""
+        if sig == EMPTY_SIGNATURE:
+            return []
+        candidates = self.candidates(sig)
+        candidates.discard(exclude)
+
+        sigs = self._read_signatures([d for d in candidates if d not in self.signatures])
+        sigs.update((d, self.signatures[d]) for d in candidates if d in self.signatures)
+        results = []
+        for doc_id, other in sigs.items():
+            score = similarity(sig, other)
+            if score >= threshold:
+                results.append((doc_id, score))
+        results.sort(key=lambda r: (-r[1], r[0]))
+        return results
+
+
+def read_knowledge(path: Path) -> str | None:
+    """Text of a knowledge file; packed .tsz transcripts are read through TranscriptReader."""
+    if path.suffix != transcripts.SUFFIX:
+        return path.read_text(errors="replace")
+    try:
+        return transcripts.TranscriptReader(path).text()
+    except transcripts.TranscriptError as e:
+        logger.warning(f"Skipping {path}: {e}")
+        return None
+
+
+def index_knowledge(index: FingerprintIndex, output_dir: Path) -> int:
+    """Fingerprint every knowledge file that is new or changed since last indexed.
+
+    Returns the number of files (re)indexed.
+    """
+    knowledge_dir = output_dir / "data" / "knowledge"
+    updated = 0
+    seen = set()
+    for path in sorted(knowledge_dir.rglob("*")):
+        if not path.is_file() or path.suffix not in KNOWLEDGE_SUFFIXES:
+            continue
+        if path.suffix == transcripts.SUFFIX and path.with_suffix(".txt").exists():
+            continue  # converted with --keep: the .txt is indexed instead
+        doc_id = path.relative_to(output_dir).as_posix()
+        mtime = path.stat().st_mtime
+        existing = index.docs.get(doc_id)
+        if existing and existing.get("mtime") == mtime:
+            seen.add(doc_id)
+            continue
+        text = read_knowledge(path)
+        if text is None:
+            continue
+        seen.add(doc_id)
+        index.add(doc_id, signature(text), mtime=mtime)
+        logger.debug(f"FINGERPRINT: {doc_id}")
+        updated += 1
+
+    # Drop knowledge files that were deleted since the last run
+    for doc_id in [d for d in index.docs if d.startswith("data/knowledge/") and d not in seen]:
+        index.remove(doc_id)
+        logger.debug(f"FINGERPRINT removed: {doc_id}")
+
+    return updated
+
+
+def format_match(doc_id: str, score: float) -> str:
+    return f"near-duplicate of {doc_id} (similarity {score:.2f})"
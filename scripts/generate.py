@@ -13,6 +13,21 @@ Reads config.json from the project root and renders:
 
 Usage:
     python3 scripts/generate.py [--config path/to/config.json] [--output-dir path/to/output]
+
+Maintenance commands operate on an existing hub:
+    python3 scripts/generate.py dedup {check,add,index} [path]
+    python3 scripts/generate.py people {add,render,rebuild}
+    python3 scripts/generate.py snapshot {export,import} [path]
+    python3 scripts/generate.py synth [--size production] [--seed N]
+    python3 scripts/generate.py rollup <clients-dir> [--out dir]
+    python3 scripts/generate.py journal {append,update,merge,status} [file]
+    python3 scripts/generate.py pipeline {next,add,move,report}
+    python3 scripts/generate.py read <file> [section]
+    python3 scripts/generate.py atomize <source>... [--platforms ...]
+    python3 scripts/generate.py transcripts convert|read|list
+    python3 scripts/generate.py security [dir...] [--out findings.json]
+    python3 scripts/generate.py stack [dir...] [--json]
+    python3 scripts/generate.py archive run|status|search
 """
 
 import argparse
@@ -26,21 +41,31 @@ from pathlib import Path
 
 
 LOG_DIR = Path("logs")
+COMMAND_LOG = "commands.log"
 
 logger = logging.getLogger("intel-hub")
 
 
-def setup_logging(output_dir: Path) -> Path:
-    """Configure logging to both console and a timestamped log file."""
-    log_dir = output_dir / "logs"
+def setup_logging(output_dir: Path, command: str | None = None) -> Path:
+    """Configure logging to both console and a log file.
+
+    Setup gets its own timestamped log; maintenance subcommands all append
+    to logs/commands.log, tagged with the command name.
+    """
+    log_dir = output_dir / LOG_DIR
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    log_file = log_dir / f"setup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.log"
+    if command:
+        log_file = log_dir / COMMAND_LOG
+        file_format = f"%(asctime)s [%(levelname)s] [{command}] %(message)s"
+    else:
+        log_file = log_dir / f"setup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.log"
+        file_format = "%(asctime)s [%(levelname)s] %(message)s"
 
     # File handler: DEBUG level (everything)
     fh = logging.FileHandler(log_file)
     fh.setLevel(logging.DEBUG)
-    fh.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    fh.setFormatter(logging.Formatter(file_format))
 
     # Console handler: INFO level
     ch = logging.StreamHandler()
@@ -154,18 +179,18 @@ This system processes research links into actionable intelligence, tracks projec
 | `/research <URL>` | Process a link through the full research pipeline |
 | `/status [project]` | Status report — project pulse, recommendations, stale items |
 | `/prioritize <args>` | Move projects between tiers or vote on recommendations |
-| `/atomize <source>` | Turn a blog post into social media variations |
-| `/add-project <name>` | Scan a project directory and add it to the registry |
-| `/security [target]` | Security audit — secrets, deps, tool evaluations |
+| `/atomize <source>` | Turn a blog post into social media variations (many at once: `python3 scripts/generate.py atomize <files...>` queues drafts as pipeline Ideas) |
+| `/add-project <name>` | Scan a project directory and add it to the registry. Detect the stack with `python3 scripts/generate.py stack <dir>` and record it with a `- **Path:**` line |
+| `/security [target]` | Security audit — secrets, deps, tool evaluations. For secrets, run `python3 scripts/generate.py security [dir]` (defaults to every project with a `- **Path:**` line) and review its JSON findings |
 
 ## The `/research` Pipeline
 
 1. **Timestamp & log** — Add entry to `data/research/intake-log.md` with status `pending`
-2. **Fetch & understand** — WebFetch the content; follow referenced links
+2. **Fetch & understand** — WebFetch the content; follow referenced links. Run `python3 scripts/generate.py dedup check -` on the fetched text — if it is a near-duplicate of something already analyzed, shorten the analysis and link the original
 3. **Analyze** — Evaluate through these lenses:
 {category_lines}
 4. **Update knowledge base** — Create/update files in `data/knowledge/` as appropriate
-5. **Update docs** — Add to `data/research/bookmarks.md`, update `data/research/intelligence-brief.md`, update `data/research/people-to-watch.md` if new person
+5. **Update docs** — Add to `data/research/bookmarks.md` with `python3 scripts/generate.py people add` (keeps `people-to-watch.md` ranked), update `data/research/intelligence-brief.md`, update `data/research/people-to-watch.md` if new person
 6. **Report** — Structured summary with business applicability and action items
 7. **Mark processed** — Change intake log status from `pending` to `processed`
 8. **Cross-project check** — Check findings against `data/portfolio/projects.md` and add recommendations
@@ -176,7 +201,7 @@ This system processes research links into actionable intelligence, tracks projec
 ### data/research/
 
 **intake-log.md** — Newest first. Format: `[YYYY-MM-DD HH:MM] | STATUS | Title | URL`
-Statuses: `pending`, `processed`, `actioned`
+Statuses: `pending`, `processed`, `actioned`. Old `processed`/`actioned` entries are moved to `data/research/archive/` by `python3 scripts/generate.py archive run`. Search the archives when you need history: `archive search "<text>"`.
 
 **bookmarks.md** — Organized by topic: {topic_list}. Each entry has Author, Date, URL, Content summary, Tags, Notes.
 
@@ -188,15 +213,25 @@ Statuses: `pending`, `processed`, `actioned`
 
 **projects.md** — Project registry organized by tier (ACTIVE > READY > INCUBATING > SUPPORTING > DORMANT). Each project has: What, Status, Lane, Next actions, Last touched.
 
-**content-pipeline.md** — Content tracking by platform and stage.
+**content-pipeline.md** — Content tracking by platform and stage. Use `python3 scripts/generate.py pipeline next|add|move|report` to find what's due and to move items between stages (moves are logged for cycle-time and throughput metrics).
+
+**implementation-backlog.md** — Every actionable idea from research. Statuses: `idea` > `exploring` > `in-progress` > `done` / `rejected` / `deferred`. Old `done`/`rejected` rows live in `data/portfolio/archive/`.
 
-**implementation-backlog.md** — Every actionable idea from research. Statuses: `idea` > `exploring` > `in-progress` > `done` / `rejected` / `deferred`.
+### Concurrent sessions
+
+Other sessions may be editing the same hub. Make changes to `intake-log.md`, `projects.md` and `implementation-backlog.md` through the journal instead of editing them in place:
+
+- `python3 scripts/generate.py journal append intake --text "[YYYY-MM-DD HH:MM] | pending | Title | URL"`
+- `python3 scripts/generate.py journal append backlog --section BUILD --text "| ID | Idea | Source | idea | Notes |"`
+- `python3 scripts/generate.py journal update backlog --section BUILD --key <ID> --set status=done`
+
+To read one section without loading a whole file: `python3 scripts/generate.py read projects ACTIVE` (or `read backlog BUILD`, `read bookmarks "<topic>"`). Omit the section to list headings.
 
 ### data/knowledge/
 
 **strategies/** — Deep methodology breakdowns
 **tools/** — Tool evaluations
-**transcripts/** — Video/audio transcripts
+**transcripts/** — Video/audio transcripts. Pack new `.txt` transcripts with `python3 scripts/generate.py transcripts convert`, then quote a passage with `transcripts read <file> --from HH:MM:SS --to HH:MM:SS` instead of loading the whole file.
 
 ## Key Principles
 
@@ -508,16 +543,598 @@ def generate_all(config: dict, output_dir: Path, force: bool = False) -> list[st
     return created
 
 
+def read_input(path: str) -> str:
+    """Read a file argument, treating '-' as stdin."""
+    if path == "-":
+        return sys.stdin.read()
+    source = Path(path)
+    if not source.exists():
+        print(f"Error: File not found: {path}", file=sys.stderr)
+        sys.exit(1)
+    return source.read_text(errors="replace")
+
+
+def cmd_dedup(args, output_dir: Path) -> int:
+    """Check, add or index documents in the near-duplicate fingerprint index."""
+    import fingerprint
+
+    index = fingerprint.FingerprintIndex.load(output_dir / fingerprint.INDEX_PATH)
+
+    if args.action == "index":
+        try:
+            updated = fingerprint.index_knowledge(index, output_dir)
+            index.save()
+        except fingerprint.FingerprintError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        logger.info(f"Fingerprinted {updated} knowledge files ({len(index.docs)} indexed)")
+        return 0
+
+    if not args.path:
+        print(f"Error: dedup {args.action} requires a path (or '-' for stdin)", file=sys.stderr)
+        return 1
+    if args.action == "add" and args.path == "-" and not args.id:
+        print("Error: dedup add - requires --id (the document's URL or path)", file=sys.stderr)
+        return 1
+
+    sig = fingerprint.signature(read_input(args.path))
+    doc_id = args.id or args.path
+    try:
+        matches = index.query(sig, threshold=args.threshold, exclude=doc_id)
+        for match_id, score in matches:
+            print(fingerprint.format_match(match_id, score))
+        if not matches:
+            print("no near-duplicates found")
+
+        if args.action == "add":
+            index.add(doc_id, sig, added=today())
+            index.save()
+            logger.debug(f"Fingerprint added: {doc_id}")
+    except fingerprint.FingerprintError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_people(args, output_dir: Path) -> int:
+    """Maintain author aggregates and regenerate the people-to-watch ranking."""
+    import archive
+    import hublock
+    import people
+
+    state_path = output_dir / people.STATE_PATH
+
+    if args.action == "add":
+        missing = [f for f in ("topic", "title", "author") if not getattr(args, f)]
+        if missing:
+            print(f"Error: people add requires --{', --'.join(missing)}", file=sys.stderr)
+            return 1
+
+    try:
+        # Held from load to save so concurrent sessions don't drop each other's bookmarks
+        with hublock.FileLock(output_dir / people.LOCK_PATH):
+            if args.action == "rebuild":
+                index = people.rebuild(output_dir, state_path)
+            else:
+                index = people.PeopleIndex.load(state_path)
+
+            if args.action == "add":
+                entry = {
+                    "topic": args.topic,
+                    "title": args.title,
+                    "author": args.author,
+                    "date": args.date or today(),
+                    "url": args.url,
+                    "content": args.content,
+                    "tags": args.tags,
+                    "notes": args.notes,
+                }
+                if not people.add_bookmark(output_dir, index, entry):
+                    logger.info(f"Already bookmarked: {args.url or args.title}")
+
+            index.refresh_actioned(output_dir / people.BACKLOG_PATH, output_dir / archive.ARCHIVE_DIRS["backlog"])
+            people.write_people(output_dir, index)
+            index.save()
+    except hublock.LockTimeout as e:
+        logger.error(f"People update failed: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    logger.info(f"Ranked {len(index.authors)} people in {people.PEOPLE_PATH}")
+    return 0
+
+
+def cmd_snapshot(args, output_dir: Path) -> int:
+    """Export the hub to a compressed snapshot, or restore one."""
+    import snapshot
+
+    if args.action == "export":
+        dest = Path(args.path or f"hub-snapshot-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl.gz")
+        end = snapshot.export_snapshot(output_dir, dest)
+        logger.info(f"Snapshot saved to {dest}: {end['files']} files, {end['records']} records")
+        return 0
+
+    if not args.path:
+        print("Error: snapshot import requires a snapshot path", file=sys.stderr)
+        return 1
+    try:
+        restored = snapshot.import_snapshot(Path(args.path), output_dir, force=args.force)
+    except (snapshot.SnapshotError, OSError) as e:
+        logger.error(f"Snapshot import failed: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    logger.info(f"Restored {len(restored)} files (existing files kept unless --force)")
+    return 0
+
+
+def cmd_synth(args, output_dir: Path) -> int:
+    """Generate a seeded synthetic hub for load and scale testing."""
+    import synth
+
+    existing = [p for p in ("config.json", "data/research/intake-log.md") if (output_dir / p).exists()]
+    if existing and not args.force:
+        print(f"Error: {output_dir} already has a hub ({existing[0]}); use --force to overwrite", file=sys.stderr)
+        return 1
+
+    overrides = {field: getattr(args, field) for field in synth.SYNTH_FIELDS}
+    size = synth.resolve_size(args.size, **overrides)
+    written = synth.generate_hub(output_dir, size, seed=args.seed)
+    total = sum(written.values())
+    logger.info(f"Synthetic hub ({args.size}, seed {args.seed}): {len(written)} files, {total / 1e6:.1f} MB")
+    return 0
+
+
+def cmd_rollup(args, output_dir: Path) -> int:
+    """Aggregate pending intake, stale projects, recommendations and backlog across hubs."""
+    import hubdata
+    import rollup
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"Error: Directory not found: {args.root}", file=sys.stderr)
+        return 1
+    out_dir = Path(args.out) if args.out else root / "rollup"
+    since = None
+    if args.since:
+        since = hubdata.parse_date(args.since)
+        if since is None:
+            print(f"Error: --since must be YYYY-MM-DD, got {args.since!r}", file=sys.stderr)
+            return 1
+    report, parsed = rollup.run_rollup(root, out_dir, workers=args.workers, stale_days=args.stale_days, since=since)
+    logger.info(f"Rolled up {report['totals']['hubs']} hubs ({parsed} re-parsed, "
+                f"{report['totals']['hubs'] - parsed} cached) into {out_dir / rollup.REPORT_MD}")
+    return 0
+
+
+def cmd_journal(args, output_dir: Path) -> int:
+    """Locked, journaled updates so concurrent sessions don't lose each other's writes."""
+    import hublock
+
+    if args.action == "status":
+        counts = hublock.pending(output_dir)
+        rejected = hublock.rejected(output_dir)
+        for rel, n in counts.items():
+            print(f"{rel}: {n} pending")
+        for rel, n in rejected.items():
+            print(f"{rel}: {n} rejected (see {hublock.journal_paths(output_dir, rel)['rejected']})")
+        if not counts and not rejected:
+            print("journal empty")
+        return 0
+
+    if args.action == "merge":
+        targets = [args.file] if args.file else list(hublock.FILE_ALIASES.values())
+        try:
+            applied = sum(hublock.merge(output_dir, rel, timeout=args.timeout) for rel in targets)
+        except hublock.LockTimeout as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        logger.info(f"Merged {applied} journaled changes")
+        return 0
+
+    if not args.file:
+        print(f"Error: journal {args.action} requires a file (e.g. intake, backlog)", file=sys.stderr)
+        return 1
+
+    if args.action == "append":
+        if not args.text:
+            print("Error: journal append requires --text", file=sys.stderr)
+            return 1
+        try:
+            hublock.append(output_dir, args.file, args.text, section=args.section, timeout=args.timeout)
+        except (hublock.JournalError, hublock.LockTimeout) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    if not (args.section and args.key and args.set):
+        print("Error: journal update requires --section, --key and --set column=value", file=sys.stderr)
+        return 1
+    bad = [item for item in args.set if "=" not in item]
+    if bad:
+        print(f"Error: --set expects column=value, got {', '.join(repr(item) for item in bad)}", file=sys.stderr)
+        return 1
+    changes = dict(item.split("=", 1) for item in args.set)
+    try:
+        hublock.update(output_dir, args.file, args.section, args.key, changes, timeout=args.timeout)
+    except (hublock.JournalError, hublock.LockTimeout) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_pipeline(args, output_dir: Path) -> int:
+    """Query and update the content pipeline across platforms."""
+    import hublock
+    import pipeline
+
+    config_path = Path(args.config)
+    platforms = []
+    if config_path.exists():
+        with open(config_path) as f:
+            platforms = json.load(f).get("platforms", [])
+
+    flow = pipeline.Pipeline.load(output_dir, platforms)
+
+    if args.action == "next":
+        for item in flow.next_up(args.n):
+            print(f"{item.get('due') or 'no date'} | {item.get('priority') or '—'} | "
+                  f"{item['platform']} | {item['stage']} | {item['title']}")
+        return 0
+
+    if args.action == "report":
+        print(pipeline.render_report(flow, pipeline.read_events(output_dir), platforms), end="")
+        return 0
+
+    if not (args.platform and args.title):
+        print(f"Error: pipeline {args.action} requires --platform and --title", file=sys.stderr)
+        return 1
+    try:
+        if args.action == "add":
+            flow.add(args.platform, args.title, stage=args.stage or "Idea",
+                     priority=args.priority or "", due=args.due or "", notes=args.notes or "")
+        else:
+            if args.stage:
+                flow.move(args.platform, args.title, args.stage)
+            if any(v is not None for v in (args.priority, args.due, args.notes)):
+                flow.set_fields(args.platform, args.title, priority=args.priority, due=args.due, notes=args.notes)
+    except pipeline.PipelineError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    try:
+        written = flow.save()
+    except hublock.LockTimeout as e:
+        logger.error(f"Pipeline update failed: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    logger.info(f"Updated {', '.join(written) or 'nothing'} in {pipeline.PIPELINE_PATH}")
+    return 0
+
+
+def cmd_read(args, output_dir: Path) -> int:
+    """Print one section of a hub file (or list its sections) without parsing the rest."""
+    import hublock
+    import mdreader
+
+    path = output_dir / hublock.resolve(args.file)
+    if not path.exists():
+        print(f"Error: File not found: {path}", file=sys.stderr)
+        return 1
+    reader = mdreader.SectionReader.open(path, cache_dir=output_dir / "data" / ".index")
+    if not args.section:
+        for heading in reader.headings:
+            print(f"{'  ' * (heading.level - 1)}{heading.title}")
+        return 0
+    try:
+        print(reader.read(args.section, parent=args.parent), end="")
+    except KeyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_atomize(args, output_dir: Path) -> int:
+    """Atomize many sources into per-platform drafts queued in the content pipeline."""
+    import atomize
+    import hublock
+
+    platforms = args.platforms
+    if not platforms and Path(args.config).exists():
+        with open(args.config) as f:
+            platforms = json.load(f).get("platforms", [])
+    if not platforms:
+        print("Error: no platforms configured — pass --platforms or add them to config.json", file=sys.stderr)
+        return 1
+
+    sources = [Path(p) for p in args.sources]
+    missing = [str(p) for p in sources if not p.is_file()]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    try:
+        stats = atomize.atomize(output_dir, sources, platforms, workers=args.workers)
+    except hublock.LockTimeout as e:
+        logger.error(f"Atomize failed: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    logger.info(f"Atomized {stats['sources']} sources into {stats['chunks']} chunks "
+                f"({stats['changed_chunks']} new or changed): {stats['generated']} drafts generated, "
+                f"{stats['reused']} reused, {stats['queued']} queued as Ideas, {stats['retired']} stale Ideas retired")
+    return 0
+
+
+def cmd_transcripts(args, output_dir: Path) -> int:
+    """Pack plain-text transcripts into the chunked store, list them, or read a slice."""
+    import transcripts
+
+    directory = output_dir / transcripts.TRANSCRIPTS_DIR
+
+    def locate(name):
+        path = Path(name)
+        return path if path.exists() or path.is_absolute() else directory / name
+
+    try:
+        if args.action == "convert":
+            if args.files:
+                results = [transcripts.convert(locate(f), codec=args.codec, keep=args.keep) for f in args.files]
+            else:
+                results = transcripts.convert_dir(directory, codec=args.codec, keep=args.keep)
+            raw = sum(r["raw"] for r in results)
+            packed = sum(r["packed"] for r in results)
+            ratio = f" ({raw / packed:.1f}x smaller)" if packed else ""
+            logger.info(f"Packed {len(results)} transcripts: {raw:,} -> {packed:,} bytes{ratio}")
+            return 0
+
+        if args.action == "list":
+            for path in sorted(directory.rglob(f"*{transcripts.SUFFIX}")):
+                reader = transcripts.TranscriptReader(path)
+                duration = reader.duration()
+                length = transcripts.format_timestamp(duration) if duration is not None else "—"
+                print(f"{path.relative_to(directory)} | {length} | {reader.size:,} bytes | {reader.title}")
+            return 0
+
+        if not args.files:
+            print("Error: transcripts read requires a file", file=sys.stderr)
+            return 1
+        reader = transcripts.open_transcript(locate(args.files[0]))
+        if args.bytes:
+            start, _, end = args.bytes.partition(":")
+            data = reader.read_bytes(int(start or 0), int(end) if end else None)
+            print(data.decode("utf-8", errors="replace"), end="")
+        elif args.start:
+            start = transcripts.parse_timestamp(args.start)
+            end = transcripts.parse_timestamp(args.end) if args.end else None
+            print(reader.read_time(start, end), end="")
+        else:
+            print(reader.text(), end="")
+    except transcripts.TranscriptError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_security(args, output_dir: Path) -> int:
+    """Scan registered project directories (or the given paths) for exposed secrets."""
+    import hubdata
+    import secrets_scan
+
+    missing = [t for t in args.targets if not Path(t).expanduser().exists()]
+    if missing:
+        print(f"Error: Not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    if not args.targets and not secrets_scan.project_dirs(output_dir):
+        print(f"Error: no project directories in {hubdata.PROJECTS_PATH} — "
+              "add a `- **Path:**` line to a project or pass a directory", file=sys.stderr)
+        return 1
+
+    report = secrets_scan.scan(output_dir, [Path(t) for t in args.targets], workers=args.workers)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+    logger.info(f"Scanned {report['files']} files ({report['scanned']} changed since last audit): "
+                f"{len(report['findings'])} findings")
+    return 0
+
+
+def cmd_stack(args, output_dir: Path) -> int:
+    """Detect the stack of a project directory (or every project with a Path in projects.md)."""
+    import hubdata
+    import stack_scan
+
+    if args.dirs:
+        targets = [(Path(d).expanduser().name, Path(d).expanduser()) for d in args.dirs]
+    else:
+        targets = hubdata.project_dirs(output_dir)
+        if not targets:
+            print(f"Error: no project directories in {hubdata.PROJECTS_PATH} — "
+                  "add a `- **Path:**` line or pass a directory", file=sys.stderr)
+            return 1
+
+    results = []
+    for name, directory in targets:
+        if not directory.is_dir():
+            print(f"Error: Directory not found: {directory}", file=sys.stderr)
+            return 1
+        result = stack_scan.scan(output_dir, directory, workers=args.workers)
+        results.append({"name": name, **result})
+        if not args.json:
+            print(f"{name} | {stack_scan.summarize(result) or 'no stack markers found'}")
+        logger.debug(f"{name}: {result['dirs']} dirs, {result['rescanned']} rescanned")
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+def cmd_archive(args, output_dir: Path) -> int:
+    """Move old closed intake and backlog entries into monthly archives, or look through them."""
+    import archive
+    import hubdata
+    import hublock
+
+    if args.action == "run":
+        before = None
+        if args.before:
+            before = hubdata.parse_date(args.before)
+            if before is None:
+                print(f"Error: --before must be YYYY-MM-DD, got {args.before!r}", file=sys.stderr)
+                return 1
+        try:
+            results = archive.run(output_dir, days=args.older_than, before=before, dry_run=args.dry_run)
+        except hublock.LockTimeout as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        verb = "Would archive" if args.dry_run else "Archived"
+        for kind, months in results.items():
+            if months:
+                span = f"{min(months)} to {max(months)}" if len(months) > 1 else min(months)
+                logger.info(f"{verb} {sum(months.values())} {kind} entries from {len(months)} months ({span})")
+            else:
+                logger.info(f"No {kind} entries to archive")
+        return 0
+
+    if args.action == "status":
+        for kind, archive_dir in archive.ARCHIVE_DIRS.items():
+            files = archive.load_manifest(output_dir / archive_dir)["files"]
+            print(f"{kind}: {sum(e['count'] for e in files.values())} archived in {len(files)} months")
+            for name, entry in files.items():
+                statuses = ", ".join(f"{s} {n}" for s, n in entry["by_status"].items())
+                print(f"  {name} | {entry['first']} → {entry['last']} | {entry['count']} | {statuses}")
+        return 0
+
+    if not args.pattern:
+        print("Error: archive search requires a pattern", file=sys.stderr)
+        return 1
+    kinds = [args.file] if args.file else list(archive.SOURCES)
+    for kind in kinds:
+        for where, line in archive.search(output_dir, kind, args.pattern):
+            print(f"{where}: {line}")
+    return 0
+
+
+COMMANDS = {
+    "dedup": cmd_dedup,
+    "people": cmd_people,
+    "snapshot": cmd_snapshot,
+    "synth": cmd_synth,
+    "rollup": cmd_rollup,
+    "journal": cmd_journal,
+    "pipeline": cmd_pipeline,
+    "read": cmd_read,
+    "atomize": cmd_atomize,
+    "transcripts": cmd_transcripts,
+    "security": cmd_security,
+    "stack": cmd_stack,
+    "archive": cmd_archive,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate intelligence hub files from config")
     parser.add_argument("--config", default="config.json", help="Path to config.json")
     parser.add_argument("--output-dir", default=".", help="Output directory (project root)")
     parser.add_argument("--force", action="store_true", help="Overwrite existing data files")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    dedup = subparsers.add_parser("dedup", help="Near-duplicate detection for researched content")
+    dedup.add_argument("action", choices=["check", "add", "index"])
+    dedup.add_argument("path", nargs="?", help="Document to check/add ('-' for stdin)")
+    dedup.add_argument("--id", help="Identifier to record, e.g. the URL (defaults to the path; required for stdin)")
+    dedup.add_argument("--threshold", type=float, default=0.8, help="Minimum similarity to report")
+
+    people_cmd = subparsers.add_parser("people", help="Rank people-to-watch from bookmark authorship")
+    people_cmd.add_argument("action", choices=["add", "render", "rebuild"])
+    for field in ("topic", "title", "author", "date", "url", "content", "tags", "notes"):
+        people_cmd.add_argument(f"--{field}", help=f"Bookmark {field} (for add)")
+
+    snapshot_cmd = subparsers.add_parser("snapshot", help="Export or import a compressed hub snapshot")
+    snapshot_cmd.add_argument("action", choices=["export", "import"])
+    snapshot_cmd.add_argument("path", nargs="?", help="Snapshot file (.jsonl.gz)")
+    snapshot_cmd.add_argument("--force", action="store_true", help="Overwrite existing files on import")
+
+    synth_cmd = subparsers.add_parser("synth", help="Generate a synthetic hub for scale testing")
+    synth_cmd.add_argument("--size", choices=["small", "medium", "production"], default="small")
+    synth_cmd.add_argument("--seed", type=int, default=0)
+    synth_cmd.add_argument("--force", action="store_true", help="Overwrite an existing hub")
+    for field in ("intake", "bookmarks", "backlog", "projects", "pipeline", "people",
+                  "authors", "transcripts", "transcript-minutes", "knowledge"):
+        synth_cmd.add_argument(f"--{field}", type=int, help=f"Override {field} count")
+
+    rollup_cmd = subparsers.add_parser("rollup", help="Cross-client rollup over every hub under a directory")
+    rollup_cmd.add_argument("root", help="Directory containing client hubs")
+    rollup_cmd.add_argument("--out", help="Report directory (default: <root>/rollup)")
+    rollup_cmd.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    rollup_cmd.add_argument("--stale-days", type=int, default=14, help="Days untouched before a project is stale")
+    rollup_cmd.add_argument("--since", metavar="YYYY-MM-DD",
+                            help="Measure backlog throughput from this date (default: 7 days ago)")
+
+    journal_cmd = subparsers.add_parser("journal", help="Concurrency-safe updates to hub files")
+    journal_cmd.add_argument("action", choices=["append", "update", "merge", "status"])
+    journal_cmd.add_argument("file", nargs="?", help="intake, bookmarks, projects, backlog, ... or a hub-relative path")
+    journal_cmd.add_argument("--text", help="Entry or table row to append")
+    journal_cmd.add_argument("--section", help="Section heading to append to / update in")
+    journal_cmd.add_argument("--key", help="First-column value of the row to update")
+    journal_cmd.add_argument("--set", action="append", metavar="COLUMN=VALUE", help="Column to change (repeatable)")
+    journal_cmd.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for a lock")
+
+    pipeline_cmd = subparsers.add_parser("pipeline", help="Content pipeline queue, transitions and metrics")
+    pipeline_cmd.add_argument("action", choices=["next", "add", "move", "report"])
+    pipeline_cmd.add_argument("-n", type=int, default=5, help="How many items to show (for next)")
+    pipeline_cmd.add_argument("--platform")
+    pipeline_cmd.add_argument("--title")
+    pipeline_cmd.add_argument("--stage", help="Idea, Research, Outline, Draft, Review, Scheduled, Published")
+    pipeline_cmd.add_argument("--priority", help="High, Medium or Low")
+    pipeline_cmd.add_argument("--due", help="YYYY-MM-DD")
+    pipeline_cmd.add_argument("--notes")
+
+    read_cmd = subparsers.add_parser("read", help="Print one section of a hub file")
+    read_cmd.add_argument("file", help="intake, bookmarks, brief, people, projects, pipeline, backlog or a path")
+    read_cmd.add_argument("section", nargs="?", help="Heading to print (omit to list headings)")
+    read_cmd.add_argument("--parent", help="Parent heading, if the title appears more than once")
+
+    atomize_cmd = subparsers.add_parser("atomize", help="Batch-atomize sources into per-platform drafts")
+    atomize_cmd.add_argument("sources", nargs="+", help="Markdown or text files to atomize")
+    atomize_cmd.add_argument("--platforms", nargs="+", help="Platforms (default: platforms in config.json)")
+    atomize_cmd.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+
+    transcripts_cmd = subparsers.add_parser("transcripts", help="Compressed transcript store with random access")
+    transcripts_cmd.add_argument("action", choices=["convert", "read", "list"])
+    transcripts_cmd.add_argument("files", nargs="*", help="Transcripts (default for convert: every .txt in knowledge/transcripts/)")
+    transcripts_cmd.add_argument("--codec", choices=["zlib", "lzma"], default="zlib")
+    transcripts_cmd.add_argument("--keep", action="store_true", help="Keep the original .txt after converting")
+    transcripts_cmd.add_argument("--from", dest="start", metavar="HH:MM:SS", help="Start time (for read)")
+    transcripts_cmd.add_argument("--to", dest="end", metavar="HH:MM:SS", help="End time (for read)")
+    transcripts_cmd.add_argument("--bytes", metavar="START:END", help="Byte range of the original text (for read)")
+
+    security_cmd = subparsers.add_parser("security", help="Incremental secret scan of project directories")
+    security_cmd.add_argument("targets", nargs="*", help="Directories or files (default: Path fields in projects.md)")
+    security_cmd.add_argument("--out", help="Write JSON findings here instead of stdout")
+    security_cmd.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+
+    stack_cmd = subparsers.add_parser("stack", help="Detect a project's stack (cached, parallel)")
+    stack_cmd.add_argument("dirs", nargs="*", help="Project directories (default: Path fields in projects.md)")
+    stack_cmd.add_argument("--json", action="store_true", help="Print every marker as JSON")
+    stack_cmd.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+
+    archive_cmd = subparsers.add_parser("archive", help="Archive old closed intake/backlog entries by month")
+    archive_cmd.add_argument("action", choices=["run", "status", "search"])
+    archive_cmd.add_argument("pattern", nargs="?", help="Text to find in hot and archived entries (for search)")
+    archive_cmd.add_argument("--older-than", type=int, default=90, metavar="DAYS",
+                             help="Archive closed entries older than this (default: 90)")
+    archive_cmd.add_argument("--before", metavar="YYYY-MM-DD", help="Explicit cutoff date instead of --older-than")
+    archive_cmd.add_argument("--dry-run", action="store_true", help="Report what would move without changing files")
+    archive_cmd.add_argument("--file", choices=["intake", "backlog"], help="Limit search to one file")
+
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
 
-    log_file = setup_logging(output_dir)
+    log_file = setup_logging(output_dir, args.command)
+
+    if args.command:
+        logger.debug(f"Command: {' '.join(sys.argv[1:])}")
+        sys.exit(COMMANDS[args.command](args, output_dir))
+
     logger.info("Intel Hub setup starting...")
     log_environment(output_dir)
 
@@ -0,0 +1,142 @@
+""".gitignore matching and vendor/binary filters shared by the directory scanners.
+
+Rules are stacked per directory while walking: each directory's .gitignore
+is parsed once and applies to paths below it, later rules win, and `!`
+re-includes. Directories are tested before descending so ignored trees
+(node_modules, build output, ...) are pruned without being listed.
+
+    rules = IgnoreRules.load(root)
+    child = rules.child(root / "web")        # adds web/.gitignore, if any
+    child.ignored("web/dist", is_dir=True)
+"""
+
+import re
+from pathlib import Path
+
+
+VENDOR_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "bower_components", "vendor", ".venv", "venv",
+    "__pycache__", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".tox", ".nox",
+    "dist", "build", "target", ".next", ".nuxt", ".svelte-kit", ".turbo", ".parcel-cache",
+    ".gradle", "Pods", ".terraform", ".serverless", "coverage", ".cache",
+}
+BINARY_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".bmp", ".tiff", ".psd",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".tar", ".jar", ".war",
+    ".mp3", ".mp4", ".mov", ".avi", ".wav", ".flac", ".ogg", ".webm",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".so", ".dylib", ".dll", ".exe", ".bin", ".o", ".a", ".class", ".pyc", ".wasm",
+    ".sqlite", ".db", ".tsz",
+}
+SNIFF_BYTES = 8192
+
+
+def is_binary(sample: bytes) -> bool:
+    """Git's heuristic: a NUL byte in the first few KB means binary."""
+    return b"\0" in sample[:SNIFF_BYTES]
+
+
+def translate(pattern: str) -> str:
+    """Translate a gitignore glob (without leading `/` or trailing `/`) to a regex."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+            continue
+        if c == "*":
+            out.append(".*" if pattern.startswith("**", i) else "[^/]*")
+            i += 2 if pattern.startswith("**", i) else 1
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                out.append("[^" + body[1:] + "]" if body.startswith("!") else "[" + body + "]")
+                i = end
+        elif c == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """An immutable stack of gitignore rules; child() returns a new stack."""
+
+    def __init__(self, root: Path, rules: tuple = (), extra_dirs: frozenset = frozenset(VENDOR_DIRS)):
+        self.root = Path(root)
+        self.rules = rules  # (base, regex, negate, dir_only)
+        self.extra_dirs = extra_dirs
+
+    @classmethod
+    def load(cls, root: Path, vendor_dirs: set[str] | None = None) -> "IgnoreRules":
+        root = Path(root)
+        rules = cls(root, extra_dirs=frozenset(VENDOR_DIRS if vendor_dirs is None else vendor_dirs))
+        info_exclude = root / ".git" / "info" / "exclude"
+        if info_exclude.is_file():
+            rules = rules._with_file(info_exclude, "")
+        return rules.child(root)
+
+    def child(self, directory: Path) -> "IgnoreRules":
+        """Rules for paths inside directory (adds its .gitignore, if it has one)."""
+        gitignore = Path(directory) / ".gitignore"
+        if not gitignore.is_file():
+            return self
+        base = Path(directory).relative_to(self.root).as_posix()
+        return self._with_file(gitignore, "" if base == "." else base)
+
+    def _with_file(self, path: Path, base: str) -> "IgnoreRules":
+        parsed = []
+        try:
+            lines = path.read_text(errors="replace").splitlines()
+        except OSError:
+            return self
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if not line:
+                continue
+            regex = translate(line)
+            regex = regex if anchored else "(?:.*/)?" + regex
+            parsed.append((base, re.compile(regex + "$"), negate, dir_only))
+        return IgnoreRules(self.root, self.rules + tuple(parsed), self.extra_dirs)
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        """Is this root-relative posix path ignored? The last matching rule wins."""
+        name = rel.rsplit("/", 1)[-1]
+        if is_dir and name in self.extra_dirs:
+            return True
+        result = False
+        for base, regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel.startswith(base + "/"):
+                    continue
+                sub = rel[len(base) + 1:]
+            else:
+                sub = rel
+            if regex.match(sub):
+                result = not negate
+        return result
@@ -0,0 +1,439 @@
+"""Parsers for the markdown data files generated by generate.py.
+
+Each parser takes an iterable of lines (an open file works) and yields one
+dict per entry, so callers can stream large files without loading them.
+PARSERS maps each data file's path to its parser.
+
+Bookmark entries use this layout inside a `## Topic` section:
+
+    ### Title
+
+    - **Author:** Name
+    - **Date:** YYYY-MM-DD
+    - **URL:** https://...
+    - **Content:** One-paragraph summary
+    - **Tags:** tag-one, tag-two
+    - **Notes:** Why it matters
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+BOOKMARK_FIELDS = {
+    "author": "Author",
+    "date": "Date",
+    "url": "URL",
+    "content": "Content",
+    "tags": "Tags",
+    "notes": "Notes",
+}
+
+PLACEHOLDER_RE = re.compile(r"^\*\(.*\)\*$")
+FIELD_RE = re.compile(r"^- \*\*(.+?):\*\*\s*(.*)$")
+URL_RE = re.compile(r"https?://[^\s)\]|>]+")
+
+# Domain suffix -> platform label used in people-to-watch.md
+PLATFORMS = {
+    "x.com": "X",
+    "twitter.com": "X",
+    "youtube.com": "YouTube",
+    "youtu.be": "YouTube",
+    "linkedin.com": "LinkedIn",
+    "github.com": "GitHub",
+    "substack.com": "Substack",
+    "medium.com": "Medium",
+    "reddit.com": "Reddit",
+    "tiktok.com": "TikTok",
+    "instagram.com": "Instagram",
+    "facebook.com": "Facebook",
+}
+
+
+def is_placeholder(text: str) -> bool:
+    """True for the `*(No entries yet ...)*` lines the generators emit."""
+    return bool(PLACEHOLDER_RE.match(text.strip()))
+
+
+def split_row(line: str) -> list[str]:
+    """Split a markdown table row into stripped cells."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def is_separator_row(cells: list[str]) -> bool:
+    return all(cell and set(cell) <= set("-: ") for cell in cells)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form for matching the same link written slightly differently."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{parts.query}" if parts.query else "")
+
+
+def find_urls(text: str) -> list[str]:
+    return URL_RE.findall(text)
+
+
+def platform_for(url: str) -> str:
+    """Guess the platform a link was published on from its domain."""
+    host = urlsplit(url.strip()).netloc.lower().removeprefix("www.")
+    for domain, label in PLATFORMS.items():
+        if host == domain or host.endswith("." + domain):
+            return label
+    return host or "Web"
+
+
+def iter_tables(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield every data row of every markdown table, tagged with its headings.
+
+    Each row dict has `section` (last `##` heading), `subsection` (last `###`
+    heading, reset by a new `##`) and one key per column, lowercased.
+    Placeholder rows such as `*(none yet)*` are skipped.
+    """
+    section = subsection = None
+    header = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("## "):
+            section, subsection, header = line[3:].strip(), None, None
+            continue
+        if line.startswith("### "):
+            subsection, header = line[4:].strip(), None
+            continue
+        if not line.lstrip().startswith("|"):
+            header = None
+            continue
+        cells = split_row(line)
+        if header is None:
+            header = [c.lower() for c in cells]
+            continue
+        if is_separator_row(cells) or is_placeholder(cells[0]):
+            continue
+        row = dict(zip(header, cells))
+        row["section"] = section
+        row["subsection"] = subsection
+        yield row
+
+
+INTAKE_RE = re.compile(r"^\[(\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2})?)\]\s*\|(.*)$")
+PROJECT_TIERS = ["ACTIVE", "READY", "INCUBATING", "SUPPORTING", "DORMANT"]
+PROJECTS_PATH = Path("data/portfolio/projects.md")
+PROJECT_PATH_FIELDS = ("path", "directory", "dir", "repo", "location")
+
+
+def parse_intake(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield intake-log entries: `[YYYY-MM-DD HH:MM] | STATUS | Title | URL`.
+
+    The title may itself contain pipes, so status and URL are taken from the
+    ends of the line and everything between them is the title.
+    """
+    for line in lines:
+        match = INTAKE_RE.match(line.strip())
+        if not match:
+            continue
+        fields = [f.strip() for f in match.group(2).split("|")]
+        if len(fields) < 2:
+            continue
+        status = fields[0]
+        url = fields[-1] if len(fields) > 2 else ""
+        title = " | ".join(fields[1:-1]) if len(fields) > 2 else fields[1]
+        yield {"timestamp": match.group(1), "status": status, "title": title, "url": url}
+
+
+def parse_projects(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield project entries from projects.md, tagged with their `tier`.
+
+    Recommendation table rows are yielded too, with `tier` set to
+    "Recommendations" and the table columns as keys.
+    """
+    tier = None
+    project = None
+    field = None
+    header = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("## "):
+            if project:
+                yield project
+            tier, project, field, header = line[3:].strip(), None, None, None
+            continue
+        if line.startswith("### ") and tier in PROJECT_TIERS:
+            if project:
+                yield project
+            project, field = {"tier": tier, "name": line[4:].strip(), "next_actions": []}, None
+            continue
+        if tier == "Recommendations" and line.lstrip().startswith("|"):
+            cells = split_row(line)
+            if header is None:
+                header = [c.lower() for c in cells]
+            elif not is_separator_row(cells) and not is_placeholder(cells[0]):
+                yield {"tier": tier, **dict(zip(header, cells))}
+            continue
+        if project is None:
+            continue
+        match = FIELD_RE.match(line)
+        if match:
+            field = match.group(1).strip().lower().replace(" ", "_")
+            if field != "next_actions":
+                project[field] = match.group(2).strip()
+        elif field == "next_actions" and line.strip().startswith("- ["):
+            item = line.strip()
+            project["next_actions"].append({"done": item[3:4].lower() == "x", "text": item[5:].strip()})
+    if project:
+        yield project
+
+
+def project_paths(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (project name, directory) for projects with a Path (or Directory/Repo) field."""
+    for project in parse_projects(lines):
+        for field in PROJECT_PATH_FIELDS:
+            value = project.get(field, "").strip("` ")
+            if value and not is_placeholder(value):
+                yield project["name"], value
+                break
+
+
+def project_dirs(output_dir: Path) -> list[tuple[str, Path]]:
+    """(project name, directory) for every project in projects.md with a Path field.
+
+    `~` is expanded and relative paths are resolved against the hub, not the
+    working directory. Directories are not checked for existence.
+    """
+    path = Path(output_dir) / PROJECTS_PATH
+    if not path.exists():
+        return []
+    dirs = []
+    with open(path) as f:
+        for name, value in project_paths(f):
+            directory = Path(value).expanduser()
+            if not directory.is_absolute():
+                directory = Path(output_dir) / directory
+            dirs.append((name, directory))
+    return dirs
+
+
+def parse_brief(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield intelligence-brief action items tagged with their `category`."""
+    for row in iter_tables(lines):
+        row["category"] = row.pop("subsection")
+        row.pop("section")
+        yield row
+
+
+def parse_people(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield people-to-watch table rows."""
+    for row in iter_tables(lines):
+        row.pop("section")
+        row.pop("subsection")
+        yield row
+
+
+def parse_pipeline(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield content-pipeline rows tagged with their `platform`."""
+    for row in iter_tables(lines):
+        row["platform"] = row.pop("subsection")
+        row.pop("section")
+        yield row
+
+
+def parse_backlog(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield implementation-backlog rows with a `kind` of BUILD, ADOPT or OFFER."""
+    for row in iter_tables(lines):
+        row["kind"] = row.pop("section")
+        row.pop("subsection")
+        yield row
+
+
+def parse_bookmarks(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield one dict per bookmark entry, tagged with its `topic` section."""
+    topic = None
+    entry = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("## "):
+            if entry:
+                yield entry
+            topic, entry = line[3:].strip(), None
+        elif line.startswith("### "):
+            if entry:
+                yield entry
+            entry = {"topic": topic, "title": line[4:].strip()}
+        elif entry is not None:
+            match = FIELD_RE.match(line)
+            if match:
+                key = match.group(1).strip().lower()
+                if key == "content summary":
+                    key = "content"
+                entry[key] = match.group(2).strip()
+    if entry:
+        yield entry
+
+
+def format_bookmark(entry: dict) -> str:
+    """Render a bookmark dict in the layout parse_bookmarks reads."""
+    lines = [f"### {entry['title']}", ""]
+    for field, label in BOOKMARK_FIELDS.items():
+        if entry.get(field):
+            lines.append(f"- **{label}:** {entry[field]}")
+    return "\n".join(lines)
+
+
+def insert_into_section(text: str, heading: str, block: str) -> str:
+    """Append a block to the end of a `## heading` section.
+
+    Replaces the section's placeholder line if it only has one, and creates
+    the section at the end of the document if it doesn't exist yet.
+    """
+    lines = text.split("\n")
+    marker = f"## {heading}"
+    try:
+        start = next(i for i, line in enumerate(lines) if line.strip() == marker)
+    except StopIteration:
+        return text.rstrip("\n") + f"\n\n{marker}\n\n{block}\n"
+
+    end = len(lines)
+    for i in range(start + 1, len(lines)):
+        if lines[i].startswith("## ") or lines[i].strip() == "---":
+            end = i
+            break
+
+    body = [line for line in lines[start + 1:end] if not is_placeholder(line)]
+    while body and not body[-1].strip():
+        body.pop()
+    while body and not body[0].strip():
+        body.pop(0)
+    body = ([""] + body + [""] if body else [""]) + [block, ""]
+    return "\n".join(lines[:start + 1] + body + lines[end:])
+
+
+def find_section(lines: list[str], heading: str) -> tuple[int, int] | None:
+    """Line range (start, end) of the `##`/`###` section titled heading.
+
+    The range ends at the next heading of the same or higher level, or at a
+    `---` rule.
+    """
+    for start, line in enumerate(lines):
+        if line.startswith("#") and line.lstrip("#").strip() == heading:
+            level = len(line) - len(line.lstrip("#"))
+            break
+    else:
+        return None
+    for end in range(start + 1, len(lines)):
+        line = lines[end]
+        if line.strip() == "---":
+            return start, end
+        if line.startswith("#"):
+            depth = len(line) - len(line.lstrip("#"))
+            if depth <= level:
+                return start, end
+    return start, len(lines)
+
+
+def insert_after_rule(text: str, block: str) -> str:
+    """Insert a block right after the first `---` rule (newest-first logs).
+
+    Drops the placeholder line that empty generated logs carry.
+    """
+    lines = text.split("\n")
+    try:
+        rule = next(i for i, line in enumerate(lines) if line.strip() == "---")
+    except StopIteration:
+        return block + "\n" + text
+    rest = lines[rule + 1:]
+    while rest and (not rest[0].strip() or is_placeholder(rest[0])):
+        rest.pop(0)
+    return "\n".join(lines[:rule + 1] + ["", block] + rest + ([""] if not rest else []))
+
+
+def append_table_row(text: str, heading: str, row: str) -> str:
+    """Append a row to the table in a section, replacing its placeholder row."""
+    lines = text.split("\n")
+    span = find_section(lines, heading)
+    if span is None:
+        raise KeyError(f"Section not found: {heading}")
+    start, end = span
+    table = [i for i in range(start + 1, end) if lines[i].lstrip().startswith("|")]
+    if len(table) < 2:
+        raise KeyError(f"No table in section: {heading}")
+    last = table[-1]
+    if len(table) > 2 and is_placeholder(split_row(lines[last])[0]):
+        lines[last] = row
+    else:
+        lines.insert(last + 1, row)
+    return "\n".join(lines)
+
+
+def update_table_row(text: str, heading: str, key: str, changes: dict[str, str]) -> str:
+    """Set columns (by header name, case-insensitive) on the row whose first cell is key."""
+    lines = text.split("\n")
+    span = find_section(lines, heading)
+    if span is None:
+        raise KeyError(f"Section not found: {heading}")
+    start, end = span
+    header = None
+    for i in range(start + 1, end):
+        if not lines[i].lstrip().startswith("|"):
+            header = None
+            continue
+        cells = split_row(lines[i])
+        if header is None:
+            header = [c.lower() for c in cells]
+            continue
+        if is_separator_row(cells) or cells[0] != key:
+            continue
+        # Hand-edited rows can be missing trailing cells
+        cells += [""] * (len(header) - len(cells))
+        for column, value in changes.items():
+            if column.lower() not in header:
+                raise KeyError(f"No column {column!r} in {heading}")
+            cells[header.index(column.lower())] = value
+        lines[i] = "| " + " | ".join(cells) + " |"
+        return "\n".join(lines)
+    raise KeyError(f"No row {key!r} in {heading}")
+
+
+def parse_date(value: str) -> date | None:
+    """The YYYY-MM-DD date at the start of value, or None if there isn't one."""
+    try:
+        return date.fromisoformat(value.strip()[:10])
+    except (ValueError, AttributeError):
+        return None
+
+
+def load_json(path: Path) -> dict:
+    """A JSON object from a cache or state file; {} if it is missing, unreadable or not an object."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_atomic(path: Path, data: str | bytes):
+    """Replace a file via a pid-unique temp file, so concurrent writers never share one."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data)
+    os.replace(tmp, path)
+
+
+PARSERS = {
+    "data/research/intake-log.md": ("intake", parse_intake),
+    "data/research/bookmarks.md": ("bookmark", parse_bookmarks),
+    "data/research/intelligence-brief.md": ("brief", parse_brief),
+    "data/research/people-to-watch.md": ("person", parse_people),
+    "data/portfolio/projects.md": ("project", parse_projects),
+    "data/portfolio/content-pipeline.md": ("pipeline", parse_pipeline),
+    "data/portfolio/implementation-backlog.md": ("backlog", parse_backlog),
+}
@@ -0,0 +1,322 @@
+"""Advisory file locks and a write-ahead journal for concurrent sessions.
+
+Several agent sessions can update the same hub at once. Instead of editing
+intake-log.md, projects.md or implementation-backlog.md directly, a session
+records its change as one JSON line in the file's journal
+(data/.journal/<file>.jsonl) and then merges the journal. Merging takes an
+exclusive fcntl lock on the target, applies every pending operation in order
+to the current file contents, and swaps the result in with os.replace().
+
+Before swapping the result in, a merge writes a .applied marker naming the
+ops it applied and the sha256 of the new contents. If it crashes before
+cleaning up, the next merge replays .merging but skips the marker's ops when
+the file still has that hash, so a replay never applies an op twice.
+
+An append or update is checked against the current file (plus any pending
+ops) before it is journaled, so a bad section or key fails the command
+instead of being queued. If another session's op can no longer be applied
+when a merge runs, it is moved to the file's .rejected journal, which
+`journal status` reports, rather than being lost.
+
+Because appends go to the journal and merges re-read the file under the lock,
+concurrent sessions never overwrite each other's entries. Row updates are
+column-level, so two sessions changing different columns of the same row
+both win. Readers never take a lock: os.replace() is atomic, so a reader
+always sees either the old or the new file, never a partial write.
+
+Operations:
+    {"op": "append", "text": ...}                         # newest-first, after the first `---`
+    {"op": "append", "section": ..., "text": ...}         # into a `## section` (table row or block)
+    {"op": "update", "section": ..., "key": ..., "set": {column: value}}
+
+Usage (via generate.py):
+    python3 scripts/generate.py journal append intake --text "[2026-03-01 09:30] | pending | Title | URL"
+    python3 scripts/generate.py journal update backlog --section BUILD --key B-3 --set status=done
+    python3 scripts/generate.py journal merge
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import hubdata
+
+
+JOURNAL_DIR = Path("data/.journal")
+DEFAULT_TIMEOUT = 10.0
+POLL_INTERVAL = 0.05
+
+FILE_ALIASES = {
+    "intake": "data/research/intake-log.md",
+    "bookmarks": "data/research/bookmarks.md",
+    "brief": "data/research/intelligence-brief.md",
+    "people": "data/research/people-to-watch.md",
+    "projects": "data/portfolio/projects.md",
+    "pipeline": "data/portfolio/content-pipeline.md",
+    "backlog": "data/portfolio/implementation-backlog.md",
+}
+
+logger = logging.getLogger("intel-hub")
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a lock can't be acquired before the timeout."""
+
+
+class JournalError(Exception):
+    """Raised when a journaled operation can't be applied."""
+
+
+class FileLock:
+    """Advisory fcntl lock on a sidecar .lock file, with a timeout.
+
+        with FileLock(path, timeout=5):
+            ...
+    """
+
+    def __init__(self, path: Path, timeout: float = DEFAULT_TIMEOUT, shared: bool = False):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        self.fd = None
+
+    def acquire(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fcntl.flock(fd, self.mode | fcntl.LOCK_NB)
+                self.fd = fd
+                return self
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeout(f"Timed out after {self.timeout}s waiting for {self.path}")
+                time.sleep(POLL_INTERVAL)
+
+    def release(self):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def resolve(rel: str) -> str:
+    """Accept either a short alias (intake, backlog, ...) or a hub-relative path."""
+    return FILE_ALIASES.get(rel, rel)
+
+
+def journal_paths(output_dir: Path, rel: str) -> dict[str, Path]:
+    name = resolve(rel).replace("/", "__")
+    base = output_dir / JOURNAL_DIR
+    return {
+        "journal": base / f"{name}.jsonl",
+        "merging": base / f"{name}.merging",
+        "applied": base / f"{name}.applied",
+        "rejected": base / f"{name}.rejected",
+        "journal_lock": base / f"{name}.jsonl.lock",
+        "target_lock": base / f"{name}.lock",
+    }
+
+
+def record(output_dir: Path, rel: str, op: dict, timeout: float = DEFAULT_TIMEOUT) -> str:
+    """Append one operation to a file's journal. Returns the operation id."""
+    paths = journal_paths(output_dir, rel)
+    entry = {"id": uuid.uuid4().hex, "ts": datetime.now().isoformat(timespec="seconds"),
+             "pid": os.getpid(), **op}
+    line = json.dumps(entry, ensure_ascii=False) + "\n"
+    with FileLock(paths["journal_lock"], timeout=timeout):
+        with open(paths["journal"], "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+    return entry["id"]
+
+
+def read_ops(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    ops = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    ops.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crashed writer; everything before it is intact
+                    logger.warning(f"Skipping unreadable journal line in {path}")
+    return ops
+
+
+def apply_op(text: str, op: dict) -> str:
+    """Apply one journal operation to file contents. Raises JournalError if it can't be."""
+    kind = op.get("op")
+    try:
+        if op["op"] == "append":
+            block = op["text"].rstrip("\n")
+            if not op.get("section"):
+                return hubdata.insert_after_rule(text, block)
+            if block.lstrip().startswith("|"):
+                return hubdata.append_table_row(text, op["section"], block)
+            return hubdata.insert_into_section(text, op["section"], block)
+        if op["op"] == "update":
+            return hubdata.update_table_row(text, op["section"], op["key"], op["set"])
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        # KeyError's str() is the repr of its message; show the message itself
+        detail = e.args[0] if isinstance(e, KeyError) and e.args else e
+        raise JournalError(f"Can't apply {kind}: {detail}") from e
+    raise JournalError(f"Unknown journal operation: {kind}")
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def replayed_ids(paths: dict[str, Path], text: str) -> set[str]:
+    """Ids a crashed merge already applied to text, per its .applied marker."""
+    try:
+        marker = json.loads(paths["applied"].read_text())
+    except (OSError, json.JSONDecodeError):
+        return set()
+    if marker.get("sha256") != text_hash(text):
+        # The crash came before the swap: nothing in the marker reached the file
+        return set()
+    return set(marker.get("ids", []))
+
+
+def merge(output_dir: Path, rel: str, timeout: float = DEFAULT_TIMEOUT) -> int:
+    """Apply all pending journal operations to a file. Returns how many were applied.
+
+    Operations that can't be applied (e.g. an update for a row that doesn't
+    exist) are moved to the .rejected journal so one bad entry can't wedge
+    the journal and none is lost.
+    """
+    rel = resolve(rel)
+    paths = journal_paths(output_dir, rel)
+    target = output_dir / rel
+
+    with FileLock(paths["target_lock"], timeout=timeout):
+        # Claim the pending journal; writers start a fresh one immediately.
+        # A leftover .merging file means a previous merge crashed: replay it first.
+        with FileLock(paths["journal_lock"], timeout=timeout):
+            pending = read_ops(paths["merging"])
+            pending += read_ops(paths["journal"])
+            if not pending:
+                return 0
+            hubdata.write_atomic(paths["merging"], "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in pending))
+            paths["journal"].unlink(missing_ok=True)
+
+        text = target.read_text() if target.exists() else ""
+        done = replayed_ids(paths, text)
+        applied = 0
+        rejected = []
+        for op in pending:
+            if op.get("id") in done:
+                continue
+            try:
+                text = apply_op(text, op)
+                applied += 1
+            except Exception as e:
+                # Set it aside: leaving it in .merging would fail every later merge
+                logger.warning(f"Rejected journal op {op.get('id', '')}: {e}")
+                rejected.append({**op, "error": str(e)})
+        if rejected:
+            with open(paths["rejected"], "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(op, ensure_ascii=False) + "\n" for op in rejected))
+                f.flush()
+                os.fsync(f.fileno())
+
+        marker = {"ids": [op["id"] for op in pending if "id" in op], "sha256": text_hash(text)}
+        hubdata.write_atomic(paths["applied"], json.dumps(marker))
+        hubdata.write_atomic(target, text)
+        paths["merging"].unlink(missing_ok=True)
+        paths["applied"].unlink(missing_ok=True)
+
+    logger.debug(f"Journal merged: {rel} ({applied}/{len(pending)} ops)")
+    return applied
+
+
+def submit(output_dir: Path, rel: str, op: dict, timeout: float = DEFAULT_TIMEOUT) -> str:
+    """Check an operation against the current file, journal it and merge. Returns its id.
+
+    Raises JournalError, with nothing journaled, if the operation can't be
+    applied to the file as it stands (pending ops included), and also if a
+    concurrent change made it inapplicable by the time it was merged. If the
+    merge lock is busy past the timeout, the operation stays in the journal
+    and is applied by the next merge.
+    """
+    apply_op(read_text(output_dir, rel, include_pending=True), op)
+    op_id = record(output_dir, rel, op, timeout)
+    try:
+        merge(output_dir, rel, timeout)
+    except LockTimeout:
+        logger.info(f"{resolve(rel)} is busy; change journaled as {op_id} for the next merge")
+        return op_id
+    rejected_path = journal_paths(output_dir, rel)["rejected"]
+    if any(r.get("id") == op_id for r in read_ops(rejected_path)):
+        raise JournalError(f"{op['op']} {op_id} no longer applies after a concurrent change; kept in {rejected_path}")
+    return op_id
+
+
+def append(output_dir: Path, rel: str, text: str, section: str | None = None,
+           timeout: float = DEFAULT_TIMEOUT) -> str:
+    """Journal an append and merge it. Returns the operation id."""
+    return submit(output_dir, rel, {"op": "append", "section": section, "text": text}, timeout)
+
+
+def update(output_dir: Path, rel: str, section: str, key: str, changes: dict[str, str],
+           timeout: float = DEFAULT_TIMEOUT) -> str:
+    """Journal a column-level row update and merge it. Returns the operation id."""
+    return submit(output_dir, rel, {"op": "update", "section": section, "key": key, "set": changes}, timeout)
+
+
+def pending(output_dir: Path) -> dict[str, int]:
+    """Count unmerged operations per file."""
+    counts = {}
+    for rel in FILE_ALIASES.values():
+        paths = journal_paths(output_dir, rel)
+        n = len(read_ops(paths["journal"])) + len(read_ops(paths["merging"]))
+        if n:
+            counts[rel] = n
+    return counts
+
+
+def rejected(output_dir: Path) -> dict[str, int]:
+    """Count operations set aside by merges because they could no longer be applied."""
+    counts = {}
+    for rel in FILE_ALIASES.values():
+        n = len(read_ops(journal_paths(output_dir, rel)["rejected"]))
+        if n:
+            counts[rel] = n
+    return counts
+
+
+def read_text(output_dir: Path, rel: str, include_pending: bool = False) -> str:
+    """Read a hub file without locking; optionally overlay unmerged journal operations."""
+    rel = resolve(rel)
+    target = output_dir / rel
+    text = target.read_text() if target.exists() else ""
+    if include_pending:
+        paths = journal_paths(output_dir, rel)
+        done = replayed_ids(paths, text)
+        for op in read_ops(paths["merging"]) + read_ops(paths["journal"]):
+            if op.get("id") in done:
+                continue
+            try:
+                text = apply_op(text, op)
+            except Exception:
+                pass
+    return text
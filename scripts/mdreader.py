@@ -0,0 +1,252 @@
+"""Lazy, section-addressable reader for the hub's markdown files.
+
+The first read of a file builds a heading -> byte-offset index in one
+streaming pass, plus a (title, parent) lookup table; after that, finding a
+`##`/`###` section is a dict lookup and reading it is a seek plus a read of
+just that section's bytes. Indexes are cached in memory and, optionally,
+on disk as JSON, and are rebuilt whenever the file's mtime or size changes.
+
+Parsed rows use small __slots__ classes rather than dicts. Table rows share
+one header tuple per table and keep their cells as a tuple, so memory grows
+with the rows in the section, not with the file.
+
+    reader = SectionReader.open("data/portfolio/projects.md")
+    for entry in reader.entries("ACTIVE"):
+        print(entry.title, entry.get("status"))
+    for row in SectionReader.open("data/portfolio/implementation-backlog.md").rows("BUILD"):
+        print(row["id"], row["status"])
+"""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+
+import hubdata
+
+
+INDEX_VERSION = 1
+MEMORY_CACHE_SIZE = 64
+
+logger = logging.getLogger("intel-hub")
+
+
+class Heading:
+    """One heading and the byte range of its section (heading line included)."""
+    __slots__ = ("level", "title", "start", "end", "parent")
+
+    def __init__(self, level: int, title: str, start: int, end: int, parent: str | None):
+        self.level = level
+        self.title = title
+        self.start = start
+        self.end = end
+        self.parent = parent
+
+    def to_list(self) -> list:
+        return [self.level, self.title, self.start, self.end, self.parent]
+
+    def __repr__(self):
+        return f"Heading({'#' * self.level} {self.title!r}, {self.start}:{self.end})"
+
+
+class TableRow:
+    """A table row; cells are looked up by lowercased column name."""
+    __slots__ = ("section", "header", "cells")
+
+    def __init__(self, section: str, header: tuple[str, ...], cells: tuple[str, ...]):
+        self.section = section
+        self.header = header
+        self.cells = cells
+
+    def __getitem__(self, column: str) -> str:
+        return self.cells[self.header.index(column)]
+
+    def get(self, column: str, default: str = "") -> str:
+        try:
+            return self[column]
+        except (ValueError, IndexError):
+            return default
+
+    def as_dict(self) -> dict:
+        return dict(zip(self.header, self.cells))
+
+    def __repr__(self):
+        return f"TableRow({self.section!r}, {self.as_dict()!r})"
+
+
+class Entry:
+    """A `### Title` block with `- **Field:** value` lines (bookmarks, projects)."""
+    __slots__ = ("section", "title", "fields")
+
+    def __init__(self, section: str, title: str, fields: dict[str, str]):
+        self.section = section
+        self.title = title
+        self.fields = fields
+
+    def get(self, field: str, default: str = "") -> str:
+        return self.fields.get(field, default)
+
+    def __repr__(self):
+        return f"Entry({self.section!r}, {self.title!r})"
+
+
+def build_index(path: Path) -> list[Heading]:
+    """Scan a file once and record where every heading's section starts and ends."""
+    headings: list[Heading] = []
+    open_stack: list[Heading] = []
+    offset = 0
+    in_fence = False
+    with open(path, "rb") as f:
+        for raw in f:
+            stripped = raw.lstrip()
+            if stripped.startswith(b"```"):
+                in_fence = not in_fence
+            elif not in_fence and raw.startswith(b"#"):
+                level = len(raw) - len(raw.lstrip(b"#"))
+                rest = raw[level:]
+                if rest[:1] in (b" ", b"\t") and level <= 6:
+                    # Close every open section at the same or a deeper level
+                    while open_stack and open_stack[-1].level >= level:
+                        open_stack.pop().end = offset
+                    parent = open_stack[-1].title if open_stack else None
+                    heading = Heading(level, rest.decode("utf-8", errors="replace").strip(), offset, -1, parent)
+                    headings.append(heading)
+                    open_stack.append(heading)
+            offset += len(raw)
+    for heading in open_stack:
+        heading.end = offset
+    return headings
+
+
+class SectionReader:
+    """Reads individual sections of one markdown file through a cached offset index."""
+
+    _memory: "OrderedDict[str, SectionReader]" = OrderedDict()
+
+    def __init__(self, path: Path, cache_dir: Path | None = None):
+        self.path = Path(path)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stamp: tuple[int, int] | None = None
+        self.headings: list[Heading] = []
+        # (title, parent) -> first such heading; (title, None) -> first with that title under any parent
+        self.lookup: dict[tuple[str, str | None], Heading] = {}
+
+    @classmethod
+    def open(cls, path: Path, cache_dir: Path | None = None) -> "SectionReader":
+        """Get a reader for path, reusing a cached index if the file hasn't changed."""
+        key = str(Path(path).resolve())
+        reader = cls._memory.get(key)
+        if reader is None:
+            reader = cls(path, cache_dir)
+            cls._memory[key] = reader
+            if len(cls._memory) > MEMORY_CACHE_SIZE:
+                cls._memory.popitem(last=False)
+        else:
+            cls._memory.move_to_end(key)
+        reader.refresh()
+        return reader
+
+    @classmethod
+    def clear_cache(cls):
+        cls._memory.clear()
+
+    def _index_file(self) -> Path | None:
+        if not self.cache_dir:
+            return None
+        name = str(self.path.resolve()).strip(os.sep).replace(os.sep, "__")
+        return self.cache_dir / f"{name}.idx.json"
+
+    def _set_headings(self, headings: list[Heading]):
+        self.headings = headings
+        self.lookup = {}
+        for heading in headings:
+            self.lookup.setdefault((heading.title, heading.parent), heading)
+            self.lookup.setdefault((heading.title, None), heading)
+
+    def refresh(self):
+        """Rebuild the index if the file's mtime or size changed since it was built."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            self.stamp = None
+            self._set_headings([])
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self.stamp:
+            return
+
+        index_file = self._index_file()
+        if index_file and index_file.exists():
+            try:
+                data = json.loads(index_file.read_text())
+                if data["version"] == INDEX_VERSION and tuple(data["stamp"]) == stamp:
+                    self._set_headings([Heading(*h) for h in data["headings"]])
+                    self.stamp = stamp
+                    return
+            except (json.JSONDecodeError, KeyError, TypeError):
+                pass
+
+        self._set_headings(build_index(self.path))
+        self.stamp = stamp
+        logger.debug(f"Indexed {self.path}: {len(self.headings)} headings")
+        if index_file:
+            data = {"version": INDEX_VERSION, "stamp": list(stamp),
+                    "headings": [h.to_list() for h in self.headings]}
+            hubdata.write_atomic(index_file, json.dumps(data))
+
+    def find(self, title: str, parent: str | None = None) -> Heading | None:
+        """First heading with this title (optionally under a given parent heading)."""
+        return self.lookup.get((title, parent))
+
+    def sections(self, level: int | None = None) -> list[str]:
+        return [h.title for h in self.headings if level is None or h.level == level]
+
+    def read(self, title: str, parent: str | None = None) -> str:
+        """Raw text of one section, heading line included. Raises KeyError if absent."""
+        heading = self.find(title, parent)
+        if heading is None:
+            raise KeyError(f"No section {title!r} in {self.path}")
+        with open(self.path, "rb") as f:
+            f.seek(heading.start)
+            data = f.read(heading.end - heading.start)
+        return data.decode("utf-8", errors="replace")
+
+    def lines(self, title: str, parent: str | None = None) -> list[str]:
+        return self.read(title, parent).splitlines()
+
+    def rows(self, title: str, parent: str | None = None) -> Iterator[TableRow]:
+        """Table rows in a section (including its subsections), placeholders skipped."""
+        header = None
+        section = title
+        for line in self.lines(title, parent):
+            if line.startswith("#"):
+                section = line.lstrip("#").strip()
+                header = None
+                continue
+            if not line.lstrip().startswith("|"):
+                header = None
+                continue
+            cells = tuple(hubdata.split_row(line))
+            if header is None:
+                header = tuple(c.lower() for c in cells)
+                continue
+            if hubdata.is_separator_row(list(cells)) or hubdata.is_placeholder(cells[0]):
+                continue
+            yield TableRow(section, header, cells)
+
+    def entries(self, title: str, parent: str | None = None) -> Iterator[Entry]:
+        """`### Title` blocks in a section, with their `- **Field:** value` lines."""
+        entry = None
+        for line in self.lines(title, parent):
+            if line.startswith("### "):
+                if entry:
+                    yield entry
+                entry = Entry(title, line[4:].strip(), {})
+            elif entry is not None:
+                match = hubdata.FIELD_RE.match(line)
+                if match:
+                    entry.fields[match.group(1).strip().lower().replace(" ", "_")] = match.group(2).strip()
+        if entry:
+            yield entry
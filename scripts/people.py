@@ -0,0 +1,275 @@
+"""Incremental people-to-watch ranking from bookmark authorship.
+
+Per-author aggregates live in data/research/.people-index.json and are
+updated one bookmark at a time, so adding a bookmark never rescans the
+bookmark history. The recency-weighted score is an exponentially decayed
+count stored relative to an `as_of` date, which lets a new entry fold in with
+a single multiply-add. Actioned ideas are traced by matching the backlog's
+Source column against each author's bookmark URLs and titles (archived
+backlog rows included); that count is recomputed only when
+implementation-backlog.md or the backlog archive changes.
+
+A session holds LOCK_PATH from loading the index until saving it, and
+bookmarks.md is written under its hublock lock, so concurrent `people add`
+runs don't lose each other's bookmarks.
+
+Usage (via generate.py):
+    python3 scripts/generate.py people add --topic "Industry Trends" --title ... --author ... --url ...
+    python3 scripts/generate.py people render
+    python3 scripts/generate.py people rebuild
+"""
+
+import json
+import logging
+import math
+from datetime import date
+from pathlib import Path
+
+import archive
+import hubdata
+import hublock
+
+
+STATE_PATH = Path("data/research/.people-index.json")
+LOCK_PATH = Path("data/research/.people-index.lock")
+BOOKMARKS_PATH = Path("data/research/bookmarks.md")
+PEOPLE_PATH = Path("data/research/people-to-watch.md")
+BACKLOG_PATH = Path("data/portfolio/implementation-backlog.md")
+STATE_VERSION = 1
+
+HALF_LIFE_DAYS = 90
+ACTIONED_WEIGHT = 2.0
+# Ranking score thresholds for the Follow Priority column
+PRIORITY_LEVELS = [(4.0, "High"), (1.5, "Medium"), (0.0, "Low")]
+INACTIVE_STATUSES = {"rejected"}
+
+logger = logging.getLogger("intel-hub")
+
+
+def decay(days: int) -> float:
+    return math.pow(0.5, days / HALF_LIFE_DAYS)
+
+
+def entry_key(entry: dict) -> str:
+    """Stable identity for a bookmark: its URL, or topic + title if it has none."""
+    if entry.get("url"):
+        return hubdata.normalize_url(entry["url"])
+    return f"{entry.get('topic')}::{entry.get('title')}"
+
+
+class PeopleIndex:
+    """Per-author aggregates maintained incrementally from bookmarks."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.authors: dict[str, dict] = {}
+        self.seen: set[str] = set()
+        self.backlog_stamp: list | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "PeopleIndex":
+        index = cls(path)
+        data = hubdata.load_json(index.path)
+        if data.get("version") == STATE_VERSION:
+            index.authors = data["authors"]
+            index.seen = set(data["seen"])
+            index.backlog_stamp = data.get("backlog_stamp")
+        return index
+
+    def save(self):
+        data = {
+            "version": STATE_VERSION,
+            "authors": self.authors,
+            "seen": sorted(self.seen),
+            "backlog_stamp": self.backlog_stamp,
+        }
+        hubdata.write_atomic(self.path, json.dumps(data, indent=1))
+
+    def record(self, entry: dict) -> bool:
+        """Fold one bookmark into its author's aggregate. Returns False if already counted."""
+        author = (entry.get("author") or "").strip()
+        key = entry_key(entry)
+        if not author or key in self.seen:
+            return False
+        self.seen.add(key)
+
+        agg = self.authors.setdefault(author, {
+            "platform": hubdata.platform_for(entry["url"]) if entry.get("url") else "Web",
+            "entries": 0,
+            "score": 0.0,
+            "as_of": None,
+            "last_seen": None,
+            "topics": {},
+            "urls": [],
+            "titles": [],
+            "actioned": 0,
+        })
+        agg["entries"] += 1
+
+        when = hubdata.parse_date(entry.get("date", "")) or date.today()
+        as_of = hubdata.parse_date(agg["as_of"] or "")
+        if as_of is None:
+            agg["score"] = 1.0
+            agg["as_of"] = when.isoformat()
+        elif when >= as_of:
+            agg["score"] = agg["score"] * decay((when - as_of).days) + 1.0
+            agg["as_of"] = when.isoformat()
+        else:
+            agg["score"] += decay((as_of - when).days)
+        if not agg["last_seen"] or when.isoformat() > agg["last_seen"]:
+            agg["last_seen"] = when.isoformat()
+
+        if entry.get("topic"):
+            agg["topics"][entry["topic"]] = agg["topics"].get(entry["topic"], 0) + 1
+        if entry.get("url"):
+            agg["urls"].append(hubdata.normalize_url(entry["url"]))
+        if entry.get("title"):
+            agg["titles"].append(entry["title"].strip().lower())
+        # Backlog rows may already cite this bookmark; recount on next refresh
+        self.backlog_stamp = None
+        return True
+
+    def refresh_actioned(self, backlog_path: Path, archive_dir: Path | None = None) -> bool:
+        """Recount backlog ideas per author if the backlog (or its archive) changed. Returns True if recounted."""
+        if not backlog_path.exists():
+            return False
+        stat = backlog_path.stat()
+        stamp = [stat.st_mtime, stat.st_size]
+        manifest = archive_dir / archive.MANIFEST_NAME if archive_dir else None
+        if manifest and manifest.exists():
+            stamp.append(manifest.stat().st_mtime)
+        if stamp == self.backlog_stamp:
+            return False
+
+        by_url = {}
+        by_title = {}
+        for author, agg in self.authors.items():
+            agg["actioned"] = 0
+            for url in agg["urls"]:
+                by_url[url] = author
+            for title in agg["titles"]:
+                by_title[title] = author
+
+        def count(rows):
+            for row in rows:
+                if row.get("status", "").lower() in INACTIVE_STATUSES:
+                    continue
+                source = row.get("source", "")
+                credited = {by_url.get(hubdata.normalize_url(u)) for u in hubdata.find_urls(source)}
+                credited.add(by_title.get(source.strip().lower()))
+                for author in credited - {None}:
+                    self.authors[author]["actioned"] += 1
+
+        with open(backlog_path) as f:
+            count(hubdata.parse_backlog(f))
+        if archive_dir:
+            count(archive.iter_archived(archive_dir, "backlog"))
+
+        self.backlog_stamp = stamp
+        return True
+
+    def ranked(self, on: date | None = None) -> list[dict]:
+        """Authors ordered by recency-weighted score plus actioned ideas."""
+        on = on or date.today()
+        rows = []
+        for name, agg in self.authors.items():
+            as_of = hubdata.parse_date(agg["as_of"] or "") or on
+            score = agg["score"] * decay(max((on - as_of).days, 0))
+            rank = score + ACTIONED_WEIGHT * agg["actioned"]
+            rows.append({**agg, "name": name, "score": score, "rank": rank})
+        rows.sort(key=lambda r: (-r["rank"], -r["entries"], r["name"].lower()))
+        return rows
+
+
+def follow_priority(rank: float) -> str:
+    for threshold, label in PRIORITY_LEVELS:
+        if rank >= threshold:
+            return label
+    return PRIORITY_LEVELS[-1][1]
+
+
+def render_table(rows: list[dict]) -> str:
+    lines = [
+        "| Name | Platform | Why | Follow Priority |",
+        "|------|----------|-----|-----------------|",
+    ]
+    for row in rows:
+        topics = sorted(row["topics"], key=lambda t: (-row["topics"][t], t))
+        why = f"{row['entries']} bookmark{'s' if row['entries'] != 1 else ''}"
+        if topics:
+            why += f"; topics: {', '.join(topics[:3])}"
+        if row["actioned"]:
+            why += f"; {row['actioned']} idea{'s' if row['actioned'] != 1 else ''} actioned"
+        why += f"; last seen {row['last_seen']}"
+        lines.append(f"| {row['name']} | {row['platform']} | {why} | {follow_priority(row['rank'])} |")
+    return "\n".join(lines)
+
+
+def hand_added_rows(lines: list[str], authors: dict) -> list[str]:
+    """Table rows for people with no bookmark aggregate, i.e. added by hand."""
+    known = {name.lower() for name in authors}
+    rows = []
+    for line in lines:
+        if not line.lstrip().startswith("|"):
+            continue
+        cells = hubdata.split_row(line)
+        name = cells[0] if cells else ""
+        if not name or hubdata.is_separator_row(cells) or hubdata.is_placeholder(name):
+            continue
+        if name.lower() == "name" or name.lower() in known:
+            continue
+        rows.append(line)
+    return rows
+
+
+def write_people(output_dir: Path, index: PeopleIndex, on: date | None = None) -> Path:
+    """Regenerate the ranked table in people-to-watch.md, keeping the file header.
+
+    Rows for people who have no bookmarks (added by hand) are kept after the ranked ones.
+    """
+    path = output_dir / PEOPLE_PATH
+    header = "# People to Watch\n\n**Format:** Name | Platform | Why | Follow Priority\n\n---\n"
+    manual = []
+    if path.exists():
+        text = path.read_text()
+        cut = text.find("\n---\n")
+        if cut != -1:
+            header = text[:cut + 5]
+            manual = hand_added_rows(text[cut + 5:].split("\n"), index.authors)
+    rows = index.ranked(on)
+    if rows or manual:
+        body = render_table(rows)
+        if manual:
+            body += "\n" + "\n".join(manual)
+    else:
+        body = "*(No people tracked yet — they'll be added as you process research with `/research`)*"
+    hubdata.write_atomic(path, f"{header}\n*Ranked {(on or date.today()).isoformat()} from bookmark authorship*\n\n{body}\n")
+    return path
+
+
+def add_bookmark(output_dir: Path, index: PeopleIndex, entry: dict) -> bool:
+    """Append a bookmark under its topic in bookmarks.md and fold it into the index.
+
+    Returns False (and writes nothing) if the bookmark was already recorded.
+    """
+    if entry_key(entry) in index.seen:
+        return False
+    path = output_dir / BOOKMARKS_PATH
+    block = hubdata.format_bookmark(entry)
+    with hublock.FileLock(hublock.journal_paths(output_dir, "bookmarks")["target_lock"]):
+        text = path.read_text() if path.exists() else "# Bookmarks\n\n---\n"
+        hubdata.write_atomic(path, hubdata.insert_into_section(text, entry["topic"], block))
+    index.record(entry)
+    logger.debug(f"Bookmark added under {entry['topic']}: {entry['title']}")
+    return True
+
+
+def rebuild(output_dir: Path, state_path: Path) -> PeopleIndex:
+    """Recompute every aggregate from a full scan of bookmarks.md."""
+    index = PeopleIndex(state_path)
+    path = output_dir / BOOKMARKS_PATH
+    if path.exists():
+        with open(path) as f:
+            for entry in hubdata.parse_bookmarks(f):
+                index.record(entry)
+    return index
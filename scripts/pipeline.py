@@ -0,0 +1,345 @@
+"""Content pipeline flow engine.
+
+Loads the per-platform tables in content-pipeline.md into a heap keyed by
+(due date, priority), so "what's due next across all platforms" is a heap
+pop instead of a scan of every table. Moving an item between stages records
+a transition in data/portfolio/.pipeline-events.jsonl, which feeds WIP per
+stage, cycle time (Idea -> Published) and weekly throughput per platform.
+Transitions are buffered and only appended by save(), under the file lock
+and after the tables are written, so a failed save logs no phantom moves.
+
+Saving rewrites only the platform tables that changed; every other byte of
+the file is left as it was. Under the file lock, save re-reads those tables
+and applies only the fields this session changed, so two sessions editing
+different items (or different fields of one item) keep both edits.
+
+Usage (via generate.py):
+    python3 scripts/generate.py pipeline next [-n 5]
+    python3 scripts/generate.py pipeline add --platform Facebook --title "Spring promo" --due 2026-04-01
+    python3 scripts/generate.py pipeline move --platform Facebook --title "Spring promo" --stage Draft
+    python3 scripts/generate.py pipeline report
+"""
+
+import heapq
+import json
+import logging
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from pathlib import Path
+
+import hubdata
+import hublock
+
+
+PIPELINE_PATH = Path("data/portfolio/content-pipeline.md")
+EVENTS_PATH = Path("data/portfolio/.pipeline-events.jsonl")
+
+STAGES = ["Idea", "Research", "Outline", "Draft", "Review", "Scheduled", "Published"]
+DONE_STAGE = "Published"
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+NO_DUE = date.max
+TABLE_HEADER = [
+    "| Title | Stage | Priority | Due | Notes |",
+    "|-------|-------|----------|-----|-------|",
+]
+EMPTY_ROW = "| *(none yet)* | — | — | — | — |"
+
+logger = logging.getLogger("intel-hub")
+
+
+class PipelineError(Exception):
+    """Raised for unknown platforms, items or stages."""
+
+
+def parse_due(value: str) -> date:
+    try:
+        return date.fromisoformat(value.strip()[:10])
+    except ValueError:
+        return NO_DUE
+
+
+def normalize_stage(stage: str) -> str:
+    for known in STAGES:
+        if known.lower() == stage.strip().lower():
+            return known
+    raise PipelineError(f"Unknown stage {stage!r} (expected one of: {', '.join(STAGES)})")
+
+
+def sort_key(item: dict) -> tuple:
+    """Earliest due date first; higher priority breaks ties."""
+    return (parse_due(item.get("due", "")), PRIORITY_RANK.get(item.get("priority", "").lower(), 3),
+            item["platform"].lower(), item["title"].lower())
+
+
+def render_row(item: dict) -> str:
+    cells = [item["title"], item["stage"], item.get("priority") or "—", item.get("due") or "—", item.get("notes", "")]
+    return "| " + " | ".join(cells) + " |"
+
+
+def row_item(row: dict) -> dict:
+    """A parse_pipeline row as a pipeline item."""
+    return {
+        "platform": row["platform"],
+        "title": row["title"],
+        "stage": row.get("stage", "Idea"),
+        "priority": "" if row.get("priority") == "—" else row.get("priority", ""),
+        "due": "" if row.get("due") == "—" else row.get("due", ""),
+        "notes": row.get("notes", ""),
+    }
+
+
+class Pipeline:
+    """In-memory view of content-pipeline.md with a due-date heap."""
+
+    def __init__(self, output_dir: Path, platforms: list[str] | None = None):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / PIPELINE_PATH
+        self.events_path = self.output_dir / EVENTS_PATH
+        self.items: dict[tuple[str, str], dict] = {}
+        self.platforms: list[str] = list(platforms or [])
+        self.heap: list[tuple] = []
+        self.versions: dict[tuple[str, str], int] = {}
+        self.dirty: set[str] = set()
+        # Fields this session changed per item; None means the item was removed
+        self.changed: dict[tuple[str, str], dict[str, str] | None] = {}
+        # Stage transitions waiting for save() to write them to the event log
+        self.events: list[dict] = []
+
+    @classmethod
+    def load(cls, output_dir: Path, platforms: list[str] | None = None) -> "Pipeline":
+        pipeline = cls(output_dir, platforms)
+        if pipeline.path.exists():
+            with open(pipeline.path) as f:
+                for row in hubdata.parse_pipeline(f):
+                    platform = row["platform"]
+                    if platform not in pipeline.platforms:
+                        pipeline.platforms.append(platform)
+                    pipeline.items[(platform, row["title"])] = row_item(row)
+        pipeline.heap = [(sort_key(item), 0, key) for key, item in pipeline.items.items()
+                         if item["stage"] != DONE_STAGE]
+        heapq.heapify(pipeline.heap)
+        pipeline.versions = {key: 0 for key in pipeline.items}
+        return pipeline
+
+    def _push(self, key: tuple[str, str]):
+        """Queue an item under its current key; older heap entries for it go stale."""
+        self.versions[key] = self.versions.get(key, -1) + 1
+        item = self.items[key]
+        if item["stage"] != DONE_STAGE:
+            heapq.heappush(self.heap, (sort_key(item), self.versions[key], key))
+
+    def _prune(self):
+        """Drop stale entries (moved, re-prioritized or published) from the heap top."""
+        while self.heap:
+            _, version, key = self.heap[0]
+            if key in self.items and self.versions.get(key) == version and self.items[key]["stage"] != DONE_STAGE:
+                return
+            heapq.heappop(self.heap)
+
+    def peek(self) -> dict | None:
+        """The next item due, in O(1) amortized."""
+        self._prune()
+        return self.items[self.heap[0][2]] if self.heap else None
+
+    def next_up(self, n: int = 1) -> list[dict]:
+        """The n next-due open items, in O(n log size)."""
+        taken = []
+        result = []
+        while len(result) < n:
+            self._prune()
+            if not self.heap:
+                break
+            entry = heapq.heappop(self.heap)
+            taken.append(entry)
+            result.append(self.items[entry[2]])
+        for entry in taken:
+            heapq.heappush(self.heap, entry)
+        return result
+
+    def _record(self, item: dict, from_stage: str | None, to_stage: str, when: datetime | None = None):
+        self.events.append({
+            "ts": (when or datetime.now()).isoformat(timespec="seconds"),
+            "platform": item["platform"],
+            "title": item["title"],
+            "from": from_stage,
+            "to": to_stage,
+        })
+
+    def add(self, platform: str, title: str, stage: str = "Idea", priority: str = "", due: str = "",
+            notes: str = "", when: datetime | None = None) -> dict:
+        """Add a new item (or return the existing one with the same platform and title)."""
+        key = (platform, title)
+        if key in self.items:
+            return self.items[key]
+        if platform not in self.platforms:
+            self.platforms.append(platform)
+        item = {"platform": platform, "title": title, "stage": normalize_stage(stage),
+                "priority": priority, "due": due, "notes": notes}
+        self.items[key] = item
+        self._push(key)
+        self._record(item, None, item["stage"], when)
+        self.dirty.add(platform)
+        self.changed[key] = dict(item)
+        return item
+
+    def move(self, platform: str, title: str, stage: str, when: datetime | None = None) -> dict:
+        """Move an item to a new stage and record the transition."""
+        item = self.get(platform, title)
+        stage = normalize_stage(stage)
+        if item["stage"] != stage:
+            previous = item["stage"]
+            item["stage"] = stage
+            self._push((platform, title))
+            self._record(item, previous, stage, when)
+            self.dirty.add(platform)
+            self.changed.setdefault((platform, title), {})["stage"] = stage
+        return item
+
+    def set_fields(self, platform: str, title: str, **fields) -> dict:
+        """Change priority, due or notes; the item is requeued under its new key."""
+        item = self.get(platform, title)
+        for field in ("priority", "due", "notes"):
+            if fields.get(field) is not None:
+                item[field] = fields[field]
+                self.changed.setdefault((platform, title), {})[field] = fields[field]
+        self._push((platform, title))
+        self.dirty.add(platform)
+        return item
+
+    def remove(self, platform: str, title: str) -> dict:
+        """Drop an item from its table (its heap entries go stale)."""
+        item = self.get(platform, title)
+        del self.items[(platform, title)]
+        self.dirty.add(platform)
+        self.changed[(platform, title)] = None
+        return item
+
+    def get(self, platform: str, title: str) -> dict:
+        try:
+            return self.items[(platform, title)]
+        except KeyError:
+            raise PipelineError(f"No pipeline item {title!r} on {platform}") from None
+
+    def platform_rows(self, platform: str) -> list[str]:
+        items = [item for (p, _), item in self.items.items() if p == platform]
+        return TABLE_HEADER + ([render_row(item) for item in items] or [EMPTY_ROW])
+
+    def _merge_rows(self, platform: str, lines: list[str]):
+        """Replace this platform's items with the rows on disk plus this session's changes."""
+        fresh = {}
+        for row in hubdata.parse_pipeline(lines):
+            fresh[(platform, row["title"])] = row_item({**row, "platform": platform})
+        for key, fields in self.changed.items():
+            if key[0] != platform:
+                continue
+            if fields is None:
+                fresh.pop(key, None)
+            elif key in fresh:
+                fresh[key].update(fields)
+            else:
+                fresh[key] = dict(self.items[key])
+        others = {key: item for key, item in self.items.items() if key[0] != platform}
+        for key, item in fresh.items():
+            if self.items.get(key) != item:
+                self.items[key] = item
+                self._push(key)
+        self.items = {**others, **fresh}
+
+    def save(self, timeout: float = hublock.DEFAULT_TIMEOUT) -> list[str]:
+        """Rewrite only the changed platform tables. Returns the platforms written.
+
+        Each table is re-read under the lock and only this session's changes
+        are applied to it, so concurrent sessions don't undo each other's edits.
+        Buffered stage transitions are appended to the event log once the
+        tables are written. Raises hublock.LockTimeout if the file stays locked.
+        """
+        if not self.dirty:
+            return []
+        written = sorted(self.dirty)
+        lock = hublock.journal_paths(self.output_dir, PIPELINE_PATH.as_posix())["target_lock"]
+        with hublock.FileLock(lock, timeout=timeout):
+            text = self.path.read_text() if self.path.exists() else "# Content Pipeline\n\n---\n"
+            lines = text.split("\n")
+            for platform in written:
+                span = hubdata.find_section(lines, platform)
+                if span is None:
+                    while lines and not lines[-1].strip():
+                        lines.pop()
+                    # Outside tables the only placeholder is "No platforms configured"
+                    lines = [l for l in lines if not hubdata.is_placeholder(l)]
+                    lines += ["", f"### {platform}", ""] + self.platform_rows(platform) + [""]
+                    continue
+                start, end = span
+                self._merge_rows(platform, lines[start:end])
+                body = lines[start + 1:end]
+                table = [i for i, line in enumerate(body) if line.lstrip().startswith("|")]
+                if table:
+                    first, last = table[0], table[-1]
+                    body = body[:first] + self.platform_rows(platform) + body[last + 1:]
+                else:
+                    body = ["", *self.platform_rows(platform), *body]
+                lines = lines[:start + 1] + body + lines[end:]
+            hubdata.write_atomic(self.path, "\n".join(lines))
+            if self.events:
+                self.events_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.events_path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in self.events))
+        self.events.clear()
+        self.dirty.clear()
+        self.changed.clear()
+        logger.debug(f"Pipeline saved: {', '.join(written)}")
+        return written
+
+    def wip(self) -> dict[str, int]:
+        """Open items per stage, in stage order."""
+        counts = Counter(item["stage"] for item in self.items.values() if item["stage"] != DONE_STAGE)
+        return {stage: counts[stage] for stage in STAGES if stage != DONE_STAGE}
+
+
+def read_events(output_dir: Path) -> list[dict]:
+    path = output_dir / EVENTS_PATH
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def cycle_times(events: list[dict]) -> dict[str, list[float]]:
+    """Days from first recorded stage to Published, per platform."""
+    started = {}
+    times = defaultdict(list)
+    for event in events:
+        key = (event["platform"], event["title"])
+        ts = datetime.fromisoformat(event["ts"])
+        started.setdefault(key, ts)
+        if event["to"] == DONE_STAGE and event["from"] != DONE_STAGE:
+            times[event["platform"]].append((ts - started[key]).total_seconds() / 86400)
+    return dict(times)
+
+
+def weekly_throughput(events: list[dict], platforms: list[str] | None = None) -> dict[str, dict[str, int]]:
+    """Items published per ISO week (YYYY-Www), per platform."""
+    weeks = defaultdict(Counter)
+    for event in events:
+        if event["to"] != DONE_STAGE or event["from"] == DONE_STAGE:
+            continue
+        if platforms and event["platform"] not in platforms:
+            continue
+        year, week, _ = datetime.fromisoformat(event["ts"]).isocalendar()
+        weeks[event["platform"]][f"{year}-W{week:02d}"] += 1
+    return {platform: dict(sorted(counts.items())) for platform, counts in weeks.items()}
+
+
+def render_report(pipeline: Pipeline, events: list[dict], platforms: list[str]) -> str:
+    lines = ["## WIP by Stage", "", "| Stage | Items |", "|-------|-------|"]
+    lines += [f"| {stage} | {count} |" for stage, count in pipeline.wip().items()]
+
+    lines += ["", "## Cycle Time (Idea → Published)", "",
+              "| Platform | Published | Avg Days | Max Days |", "|----------|-----------|----------|----------|"]
+    for platform, times in sorted(cycle_times(events).items()):
+        lines.append(f"| {platform} | {len(times)} | {sum(times) / len(times):.1f} | {max(times):.1f} |")
+
+    lines += ["", "## Weekly Throughput", "", "| Platform | Week | Published |", "|----------|------|-----------|"]
+    for platform, weeks in sorted(weekly_throughput(events, platforms).items()):
+        lines += [f"| {platform} | {week} | {count} |" for week, count in weeks.items()]
+    return "\n".join(lines) + "\n"
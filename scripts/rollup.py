@@ -0,0 +1,331 @@
+"""Cross-client rollup over many hubs.
+
+Discovers hub roots (directories with a config.json and a data/ folder),
+summarizes each one in a process pool (map), then merges the summaries into a
+single markdown + JSON report (reduce). Per-hub summaries are cached by the
+mtime and size of the files they were built from, so hubs that haven't
+changed since the last run are not re-parsed.
+
+Summaries hold raw facts (dates, counts), not judgements like "stale", so a
+cached summary stays valid as the calendar moves; staleness is decided at
+reduce time.
+
+The cache also keeps a dated history of each hub's `done` backlog count (one
+entry per day). Backlog throughput is measured against the newest entry at
+least THROUGHPUT_DAYS old, or against an explicit --since date, so rerunning
+the rollup doesn't reset the baseline.
+
+Usage (via generate.py):
+    python3 scripts/generate.py rollup ~/clients --out ~/clients/rollup
+    python3 scripts/generate.py rollup ~/clients --since 2026-03-01
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import archive
+import hubdata
+import mdreader
+
+
+CACHE_NAME = ".rollup-cache.json"
+REPORT_MD = "rollup.md"
+REPORT_JSON = "rollup.json"
+CACHE_VERSION = 1
+
+SOURCE_FILES = [
+    "config.json",
+    "data/research/intake-log.md",
+    "data/portfolio/projects.md",
+    "data/portfolio/implementation-backlog.md",
+    "data/research/archive/manifest.json",
+    "data/portfolio/archive/manifest.json",
+]
+TRACKED_TIERS = ["ACTIVE", "READY"]
+CLOSED_RECOMMENDATIONS = {"done", "declined", "rejected", "accepted"}
+SKIP_DIRS = {".git", "node_modules", "data", "logs", ".venv", "venv", "__pycache__"}
+DEFAULT_STALE_DAYS = 14
+THROUGHPUT_DAYS = 7
+HISTORY_DAYS = 400
+TOP_RECOMMENDATIONS = 10
+
+logger = logging.getLogger("intel-hub")
+
+
+def discover_hubs(root: Path) -> list[Path]:
+    """Find hub roots under root, without descending into a hub's own data."""
+    hubs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "config.json" in filenames and "data" in dirnames:
+            hubs.append(Path(dirpath))
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+    return hubs
+
+
+def hub_stamp(hub: Path) -> dict[str, list]:
+    """(mtime, size) of every file a summary is built from; missing files map to None."""
+    stamp = {}
+    for rel in SOURCE_FILES:
+        try:
+            st = (hub / rel).stat()
+            stamp[rel] = [st.st_mtime, st.st_size]
+        except FileNotFoundError:
+            stamp[rel] = None
+    return stamp
+
+
+def summarize_hub(hub: Path) -> dict:
+    """Parse one hub into a compact summary. Runs in a worker process."""
+    summary = {
+        "hub": str(hub),
+        "business_name": hub.name,
+        "intake": {"total": 0, "by_status": {}},
+        "projects": [],
+        "recommendations": [],
+        "backlog": {"total": 0, "by_status": {}},
+    }
+
+    try:
+        with open(hub / "config.json") as f:
+            summary["business_name"] = json.load(f).get("business_name", hub.name)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    def read(rel, parser):
+        path = hub / rel
+        if not path.exists():
+            return
+        with open(path, encoding="utf-8", errors="replace") as f:
+            yield from parser(f)
+
+    intake = summary["intake"]
+    for entry in read("data/research/intake-log.md", hubdata.parse_intake):
+        intake["total"] += 1
+        status = entry["status"].lower()
+        intake["by_status"][status] = intake["by_status"].get(status, 0) + 1
+
+    # Only the tracked tiers and the recommendations table are read, not the whole registry
+    projects = hub / "data/portfolio/projects.md"
+    if projects.exists():
+        reader = mdreader.SectionReader.open(projects)
+        for tier in TRACKED_TIERS:
+            if reader.find(tier):
+                for entry in reader.entries(tier):
+                    summary["projects"].append({
+                        "name": entry.title,
+                        "tier": tier,
+                        "last_touched": entry.get("last_touched"),
+                    })
+        if reader.find("Recommendations"):
+            for row in reader.rows("Recommendations"):
+                if row.get("status").lower() in CLOSED_RECOMMENDATIONS:
+                    continue
+                votes = row.get("votes")
+                summary["recommendations"].append({
+                    "suggestion": row.get("suggestion"),
+                    "source": row.get("source"),
+                    "votes": int(votes) if votes.lstrip("-").isdigit() else 0,
+                })
+
+    backlog = summary["backlog"]
+    for row in read("data/portfolio/implementation-backlog.md", hubdata.parse_backlog):
+        backlog["total"] += 1
+        status = row.get("status", "").lower()
+        backlog["by_status"][status] = backlog["by_status"].get(status, 0) + 1
+
+    # Archived history still counts, so archiving never shows up as negative throughput
+    for kind, counts in (("intake", intake), ("backlog", backlog)):
+        for status, n in archive.archived_counts(hub, kind).items():
+            counts["total"] += n
+            counts["by_status"][status] = counts["by_status"].get(status, 0) + n
+
+    return summary
+
+
+def collect(hubs: list[Path], cache_path: Path, workers: int | None = None) -> tuple[list[dict], int]:
+    """Summaries for every hub, reusing cached ones. Returns (summaries, hubs_parsed)."""
+    cache = hubdata.load_json(cache_path)
+    entries = cache.get("hubs", {}) if cache.get("version") == CACHE_VERSION else {}
+
+    stamps = {str(hub): hub_stamp(hub) for hub in hubs}
+    stale = [hub for hub in hubs if entries.get(str(hub), {}).get("stamp") != stamps[str(hub)]]
+    logger.debug(f"Rollup: {len(hubs)} hubs, {len(stale)} changed since last run")
+
+    if stale:
+        if len(stale) == 1 or workers == 1:
+            fresh = [summarize_hub(hub) for hub in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(summarize_hub, stale, chunksize=1))
+        for hub, summary in zip(stale, fresh):
+            entries[str(hub)] = {"stamp": stamps[str(hub)], "summary": summary}
+
+    # Forget hubs that were removed or moved
+    entries = {key: entries[key] for key in stamps}
+    history = {key: cache.get("history", {}).get(key, {}) for key in stamps}
+    hubdata.write_atomic(cache_path, json.dumps({"version": CACHE_VERSION, "hubs": entries, "history": history}))
+
+    return [entries[str(hub)]["summary"] for hub in hubs], len(stale)
+
+
+def record_history(cache_path: Path, summaries: list[dict], on: date) -> dict[str, dict[str, int]]:
+    """Store today's `done` count per hub in the cache's history. Returns the history."""
+    cache = hubdata.load_json(cache_path)
+    history = cache.get("history", {})
+    oldest = (on - timedelta(days=HISTORY_DAYS)).isoformat()
+    for s in summaries:
+        counts = history.setdefault(s["hub"], {})
+        counts[on.isoformat()] = s["backlog"]["by_status"].get("done", 0)
+        history[s["hub"]] = {day: n for day, n in sorted(counts.items()) if day >= oldest}
+    cache["history"] = history
+    hubdata.write_atomic(cache_path, json.dumps(cache))
+    return history
+
+
+def baseline(counts: dict[str, int], since: date) -> tuple[str, int] | None:
+    """The newest (day, done) entry on or before since, if any."""
+    days = [day for day in counts if day <= since.isoformat()]
+    if not days:
+        return None
+    day = max(days)
+    return day, counts[day]
+
+
+def days_since(value: str, on: date) -> int | None:
+    try:
+        return (on - date.fromisoformat(value.strip()[:10])).days
+    except ValueError:
+        return None
+
+
+def reduce_summaries(summaries: list[dict], history: dict[str, dict[str, int]] | None = None,
+                     stale_days: int = DEFAULT_STALE_DAYS, on: date | None = None,
+                     since: date | None = None) -> dict:
+    """Merge hub summaries into one report dict.
+
+    Backlog throughput is the change in `done` rows per hub since its newest
+    `history` entry on or before `since` (default: THROUGHPUT_DAYS before
+    `on`); hubs with no entry that old get None.
+    """
+    on = on or date.today()
+    since = since or on - timedelta(days=THROUGHPUT_DAYS)
+    history = history or {}
+
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "as_of": on.isoformat(),
+        "since": since.isoformat(),
+        "stale_days": stale_days,
+        "totals": {"hubs": len(summaries), "pending_intake": 0, "stale_projects": 0,
+                   "open_recommendations": 0, "backlog_done": 0, "backlog_total": 0,
+                   "backlog_throughput": None},
+        "hubs": [],
+        "stale_projects": [],
+        "top_recommendations": [],
+    }
+    totals = report["totals"]
+
+    for s in summaries:
+        stale = []
+        for project in s["projects"]:
+            age = days_since(project["last_touched"], on)
+            if age is not None and age > stale_days:
+                stale.append({"client": s["business_name"], **project, "days": age})
+        done = s["backlog"]["by_status"].get("done", 0)
+        base = baseline(history.get(s["hub"], {}), since)
+        throughput = done - base[1] if base else None
+        pending = s["intake"]["by_status"].get("pending", 0)
+
+        report["hubs"].append({
+            "hub": s["hub"],
+            "client": s["business_name"],
+            "pending_intake": pending,
+            "stale_projects": len(stale),
+            "open_recommendations": len(s["recommendations"]),
+            "backlog_done": done,
+            "backlog_total": s["backlog"]["total"],
+            "backlog_throughput": throughput,
+            "baseline": base[0] if base else None,
+        })
+        report["stale_projects"].extend(stale)
+        for rec in s["recommendations"]:
+            report["top_recommendations"].append({"client": s["business_name"], **rec})
+
+        totals["pending_intake"] += pending
+        totals["stale_projects"] += len(stale)
+        totals["open_recommendations"] += len(s["recommendations"])
+        totals["backlog_done"] += done
+        totals["backlog_total"] += s["backlog"]["total"]
+        if throughput is not None:
+            totals["backlog_throughput"] = (totals["backlog_throughput"] or 0) + throughput
+
+    report["hubs"].sort(key=lambda h: h["client"].lower())
+    report["stale_projects"].sort(key=lambda p: -p["days"])
+    report["top_recommendations"].sort(key=lambda r: (-r["votes"], r["client"].lower()))
+    del report["top_recommendations"][TOP_RECOMMENDATIONS:]
+    return report
+
+
+def render_markdown(report: dict) -> str:
+    totals = report["totals"]
+    if totals["backlog_throughput"] is None:
+        throughput = f" (no history from {report['since']} or earlier yet)"
+    else:
+        throughput = f", {totals['backlog_throughput']:+d} since {report['since']}"
+    lines = [
+        "# Cross-Client Rollup",
+        "",
+        f"*Generated: {report['generated']}*",
+        "",
+        f"**{totals['hubs']} hubs** · {totals['pending_intake']} pending intake · "
+        f"{totals['stale_projects']} stale projects · {totals['open_recommendations']} open recommendations · "
+        f"backlog {totals['backlog_done']}/{totals['backlog_total']} done{throughput}",
+        "",
+        "---",
+        "",
+        "## Clients",
+        "",
+        "| Client | Pending Intake | Stale Projects | Open Recs | Backlog Done | Throughput |",
+        "|--------|----------------|----------------|-----------|--------------|------------|",
+    ]
+    for h in report["hubs"]:
+        throughput = "—" if h["backlog_throughput"] is None else f"{h['backlog_throughput']:+d}"
+        lines.append(f"| {h['client']} | {h['pending_intake']} | {h['stale_projects']} | "
+                     f"{h['open_recommendations']} | {h['backlog_done']}/{h['backlog_total']} | {throughput} |")
+
+    lines += ["", f"## Stale Projects (untouched > {report['stale_days']} days)", ""]
+    if report["stale_projects"]:
+        lines += ["| Client | Project | Tier | Last Touched | Days |",
+                  "|--------|---------|------|--------------|------|"]
+        lines += [f"| {p['client']} | {p['name']} | {p['tier']} | {p['last_touched']} | {p['days']} |"
+                  for p in report["stale_projects"]]
+    else:
+        lines.append("*(None)*")
+
+    lines += ["", "## Top Recommendations", ""]
+    if report["top_recommendations"]:
+        lines += ["| Client | Suggestion | Source | Votes |", "|--------|-----------|--------|-------|"]
+        lines += [f"| {r['client']} | {r['suggestion']} | {r['source']} | {r['votes']} |"
+                  for r in report["top_recommendations"]]
+    else:
+        lines.append("*(None)*")
+    return "\n".join(lines) + "\n"
+
+
+def run_rollup(root: Path, out_dir: Path, workers: int | None = None,
+               stale_days: int = DEFAULT_STALE_DAYS, since: date | None = None,
+               on: date | None = None) -> tuple[dict, int]:
+    """Discover, summarize and reduce; writes rollup.md and rollup.json. Returns (report, hubs_parsed)."""
+    on = on or date.today()
+    hubs = discover_hubs(root)
+    summaries, parsed = collect(hubs, out_dir / CACHE_NAME, workers=workers)
+    history = record_history(out_dir / CACHE_NAME, summaries, on)
+    report = reduce_summaries(summaries, history, stale_days=stale_days, on=on, since=since)
+
+    hubdata.write_atomic(out_dir / REPORT_JSON, json.dumps(report, indent=2))
+    hubdata.write_atomic(out_dir / REPORT_MD, render_markdown(report))
+    return report, parsed
@@ -0,0 +1,206 @@
+"""Incremental secret scanner for the /security skill.
+
+Walks every project directory registered in projects.md (a `- **Path:**`
+field on the project), skipping gitignored, vendor and binary files, and
+matches each file against one combined regex of known key formats. Files are
+memory-mapped and scanned in a process pool.
+
+Results are cached per file by (mtime, size, sha256) in
+data/research/.secrets-cache.json: unchanged files aren't opened at all,
+and files whose content hash is unchanged (touched, re-checked out) reuse
+their previous findings. Changing RULES invalidates the cache.
+
+Usage (via generate.py):
+    python3 scripts/generate.py security                  # every registered project
+    python3 scripts/generate.py security ~/code/site      # one directory
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import gitignore
+import hubdata
+
+
+CACHE_PATH = Path("data/research/.secrets-cache.json")
+CACHE_VERSION = 1
+MAX_FILE_SIZE = 20 * 1024 * 1024
+
+# Order matters where formats overlap: the first alternative that matches wins
+RULES = [
+    ("private-key", rb"-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP |ENCRYPTED )?PRIVATE KEY(?: BLOCK)?-----"),
+    ("aws-access-key", rb"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b"),
+    ("aws-secret-key", rb"(?i:aws_?secret_?(?:access_?)?key)\s*[=:]\s*[\"']?[A-Za-z0-9/+=]{40}\b"),
+    ("github-token", rb"\bgh[pousr]_[A-Za-z0-9]{36,255}\b"),
+    ("github-pat", rb"\bgithub_pat_[A-Za-z0-9_]{60,255}\b"),
+    ("gitlab-token", rb"\bglpat-[A-Za-z0-9_-]{20}\b"),
+    ("slack-token", rb"\bxox[baprs]-[A-Za-z0-9-]{10,}\b"),
+    ("slack-webhook", rb"https://hooks\.slack\.com/services/T[A-Za-z0-9_]+/B[A-Za-z0-9_]+/[A-Za-z0-9_]+"),
+    ("stripe-key", rb"\b(?:sk|rk)_live_[0-9a-zA-Z]{24,}\b"),
+    ("google-api-key", rb"\bAIza[0-9A-Za-z_-]{35}\b"),
+    ("anthropic-key", rb"\bsk-ant-[A-Za-z0-9_-]{20,}"),
+    ("openai-key", rb"\bsk-(?:proj-|svcacct-)?[A-Za-z0-9_-]{20,}T3BlbkFJ[A-Za-z0-9_-]{20,}"),
+    ("sendgrid-key", rb"\bSG\.[A-Za-z0-9_-]{22}\.[A-Za-z0-9_-]{43}\b"),
+    ("twilio-key", rb"\bSK[0-9a-fA-F]{32}\b"),
+    ("mailchimp-key", rb"\b[0-9a-f]{32}-us[0-9]{1,2}\b"),
+    ("jwt", rb"\beyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}"),
+    ("url-credentials", rb"\b[a-z][a-z0-9+.-]{1,20}://[^/\s:@'\"]{1,64}:[^/\s:@'\"]{3,128}@[A-Za-z0-9.-]+"),
+    ("password-assignment",
+     rb"(?i:(?:password|passwd|secret|api_?key|access_?token|auth_?token))[\"']?\s*[:=]\s*[\"'][^\"'\s]{8,}[\"']"),
+]
+COMBINED = re.compile(b"|".join(b"(?P<%s>%s)" % (name.replace("-", "_").encode(), pattern)
+                                for name, pattern in RULES))
+RULES_SIGNATURE = hashlib.sha256(json.dumps([[n, p.decode()] for n, p in RULES]).encode()).hexdigest()[:16]
+
+logger = logging.getLogger("intel-hub")
+
+
+def redact(value: str) -> str:
+    """Keep enough of a match to recognize it, never enough to use it."""
+    if len(value) <= 8:
+        return "*" * len(value)
+    keep = min(4, len(value) // 4)
+    return value[:keep] + "*" * (len(value) - keep - 2) + value[-2:]
+
+
+def project_dirs(output_dir: Path) -> list[Path]:
+    """Existing directories named by a Path field on any project in projects.md."""
+    dirs = []
+    for _, directory in hubdata.project_dirs(output_dir):
+        if directory.is_dir() and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def iter_files(root: Path, rules: gitignore.IgnoreRules | None = None):
+    """Yield (path, stat) for every scannable file under root, pruning ignored directories."""
+    root = Path(root)
+    rules = rules or gitignore.IgnoreRules.load(root)
+    stack = [(root, rules)]
+    while stack:
+        directory, dir_rules = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            rel = Path(entry.path).relative_to(root).as_posix()
+            if entry.is_dir():
+                if not dir_rules.ignored(rel, is_dir=True):
+                    stack.append((Path(entry.path), dir_rules.child(Path(entry.path))))
+            elif entry.is_file():
+                if Path(entry.name).suffix.lower() in gitignore.BINARY_EXTENSIONS:
+                    continue
+                if dir_rules.ignored(rel, is_dir=False):
+                    continue
+                st = entry.stat()
+                if 0 < st.st_size <= MAX_FILE_SIZE:
+                    yield Path(entry.path), st
+
+
+def scan_file(job: tuple[str, str | None]) -> dict:
+    """Hash and scan one file via mmap. Runs in a worker process.
+
+    If the content hash equals known_hash, the scan is skipped and
+    "findings" is None (the caller reuses its cached findings).
+    """
+    path, known_hash = job
+    result = {"path": path, "sha256": None, "findings": None, "binary": False}
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            result["sha256"] = hashlib.sha256(mm).hexdigest()
+            if result["sha256"] == known_hash:
+                return result
+            if gitignore.is_binary(mm[:gitignore.SNIFF_BYTES]):
+                result["binary"] = True
+                result["findings"] = []
+                return result
+            findings = []
+            line, counted = 1, 0
+            for match in COMBINED.finditer(mm):
+                line += mm[counted:match.start()].count(b"\n")
+                counted = match.start()
+                findings.append({
+                    "line": line,
+                    "rule": match.lastgroup.replace("_", "-"),
+                    "match": redact(match.group().decode("utf-8", errors="replace")),
+                })
+            result["findings"] = findings
+    except (OSError, ValueError) as e:
+        # ValueError: mmap of a file truncated since it was listed
+        logger.debug(f"Skipping {path}: {e}")
+        result["findings"] = []
+    return result
+
+
+def load_cache(path: Path) -> dict:
+    data = hubdata.load_json(path)
+    if data.get("version") == CACHE_VERSION and data.get("rules") == RULES_SIGNATURE:
+        return data.get("files", {})
+    return {}
+
+
+def scan(output_dir: Path, targets: list[Path] | None = None, workers: int | None = None) -> dict:
+    """Scan targets (default: registered project dirs) and return a JSON-ready report.
+
+    Report keys: targets, files, scanned (files actually read), rehashed
+    (changed stat, same content), findings [{file, line, rule, match}].
+    """
+    targets = [Path(t).expanduser().resolve() for t in targets] if targets else project_dirs(output_dir)
+    cache_path = output_dir / CACHE_PATH
+    cache = load_cache(cache_path)
+
+    files = {}
+    for target in targets:
+        if target.is_file():
+            files[str(target)] = target.stat()
+            continue
+        for path, st in iter_files(target):
+            files[str(path)] = st
+
+    jobs = []
+    for path, st in files.items():
+        cached = cache.get(path)
+        if cached and cached["mtime"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            continue
+        jobs.append((path, cached["sha256"] if cached else None))
+
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(scan_file, jobs, chunksize=max(len(jobs) // 64, 1)))
+    else:
+        results = [scan_file(job) for job in jobs]
+
+    rehashed = 0
+    for result in results:
+        path = result["path"]
+        findings = result["findings"]
+        if findings is None:
+            findings = cache[path]["findings"]
+            rehashed += 1
+        st = files[path]
+        cache[path] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": result["sha256"],
+                       "findings": findings}
+
+    # Keep cache entries for files outside this run's targets; drop deleted files under them
+    prefixes = tuple(str(t) + os.sep for t in targets)
+    cache = {p: v for p, v in cache.items() if p in files or not (p.startswith(prefixes) or Path(p) in targets)}
+    hubdata.write_atomic(cache_path, json.dumps({"version": CACHE_VERSION, "rules": RULES_SIGNATURE, "files": cache}))
+
+    findings = [{"file": path, **finding} for path in sorted(files) for finding in cache[path]["findings"]]
+    logger.debug(f"Secret scan: {len(files)} files, {len(jobs) - rehashed} scanned, {rehashed} rehashed")
+    return {
+        "targets": [str(t) for t in targets],
+        "files": len(files),
+        "scanned": len(jobs) - rehashed,
+        "rehashed": rehashed,
+        "findings": findings,
+    }
@@ -0,0 +1,223 @@
+"""Compact hub snapshots for backups and analytics.
+
+A snapshot is one gzip-compressed JSONL stream. The first line is a header
+carrying the schema version; every following line is one record:
+
+    {"type": "file", "path": ..., "size": ..., "mtime": ...}      # starts a file
+    {"type": "content", "path": ..., "text": ...}                  # raw chunk (or "b64")
+    {"type": "record", "path": ..., "kind": ..., "data": {...}}    # parsed entry
+    {"type": "end", "files": N, "records": M}
+
+Content chunks restore every file byte for byte. Record lines are the parsed
+entries from hubdata's parsers plus a knowledge index, so analytics can read
+the snapshot without re-parsing markdown. Export and import both work one
+chunk at a time, so memory use does not grow with hub size.
+
+Usage (via generate.py):
+    python3 scripts/generate.py snapshot export [hub-snapshot.jsonl.gz]
+    python3 scripts/generate.py snapshot import hub-snapshot.jsonl.gz [--force]
+"""
+
+import base64
+import gzip
+import json
+import logging
+import os
+import zlib
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+
+import hubdata
+import transcripts
+
+
+SCHEMA_VERSION = 1
+CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger("intel-hub")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot can't be read or restored."""
+
+
+def hub_files(output_dir: Path) -> Iterator[Path]:
+    """Every file that belongs in a snapshot: config.json, CLAUDE.md and everything under data/."""
+    for name in ("config.json", "CLAUDE.md"):
+        if (output_dir / name).is_file():
+            yield output_dir / name
+    data_dir = output_dir / "data"
+    if data_dir.is_dir():
+        for root, dirs, files in os.walk(data_dir):
+            dirs.sort()
+            for name in sorted(files):
+                yield Path(root) / name
+
+
+def knowledge_record(path: Path, text_head: bytes) -> dict:
+    """Index entry for a knowledge file: its first heading (or line) as title.
+
+    Packed .tsz transcripts are read through TranscriptReader, not as raw bytes.
+    """
+    if path.suffix == transcripts.SUFFIX:
+        try:
+            reader = transcripts.TranscriptReader(path)
+            text_head = reader.title.encode() or reader.read_bytes(0, 4096)
+        except transcripts.TranscriptError:
+            text_head = b""
+    title = ""
+    for line in text_head.decode("utf-8", errors="replace").splitlines():
+        if line.strip():
+            title = line.lstrip("# ").strip()
+            break
+    return {"category": path.parent.name, "name": path.name, "title": title}
+
+
+def content_record(rel: str, chunk: bytes) -> dict:
+    try:
+        return {"type": "content", "path": rel, "text": chunk.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"type": "content", "path": rel, "b64": base64.b64encode(chunk).decode("ascii")}
+
+
+def iter_records(output_dir: Path) -> Iterator[dict]:
+    """Yield snapshot records for every hub file, streaming each file twice (raw, then parsed)."""
+    files = records = 0
+    for path in hub_files(output_dir):
+        rel = path.relative_to(output_dir).as_posix()
+        stat = path.stat()
+        files += 1
+        yield {"type": "file", "path": rel, "size": stat.st_size, "mtime": stat.st_mtime}
+
+        head = b""
+        with open(path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                head = head or chunk[:4096]
+                yield content_record(rel, chunk)
+
+        if rel in hubdata.PARSERS:
+            kind, parser = hubdata.PARSERS[rel]
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for entry in parser(f):
+                    records += 1
+                    yield {"type": "record", "path": rel, "kind": kind, "data": entry}
+        elif rel.startswith("data/knowledge/") and not path.name.startswith("."):
+            records += 1
+            yield {"type": "record", "path": rel, "kind": "knowledge",
+                   "data": {**knowledge_record(path, head), "size": stat.st_size}}
+
+    yield {"type": "end", "files": files, "records": records}
+
+
+def export_snapshot(output_dir: Path, dest: Path) -> dict:
+    """Write a compressed snapshot of the hub. Returns the end record (file/record counts)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    end = {}
+    with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as out:
+        header = {"type": "header", "schema": SCHEMA_VERSION, "created": datetime.now().isoformat(timespec="seconds")}
+        out.write(json.dumps(header) + "\n")
+        for record in iter_records(output_dir):
+            out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            if record["type"] == "end":
+                end = record
+    tmp.replace(dest)
+    logger.debug(f"Snapshot written: {dest} ({dest.stat().st_size} bytes)")
+    return end
+
+
+def read_snapshot(src: Path) -> Iterator[dict]:
+    """Yield records from a snapshot after validating its header.
+
+    A truncated or corrupt stream raises SnapshotError at the point it breaks.
+    """
+    with gzip.open(src, "rt", encoding="utf-8") as f:
+        try:
+            header = json.loads(f.readline())
+        except (json.JSONDecodeError, OSError, EOFError, zlib.error, UnicodeDecodeError) as e:
+            raise SnapshotError(f"Not a hub snapshot: {src} ({e})") from e
+        if not isinstance(header, dict) or header.get("type") != "header":
+            raise SnapshotError(f"Not a hub snapshot: {src}")
+        if header.get("schema") != SCHEMA_VERSION:
+            raise SnapshotError(f"Unsupported snapshot schema {header.get('schema')} (expected {SCHEMA_VERSION})")
+        lineno = 1
+        try:
+            for lineno, line in enumerate(f, start=2):
+                yield json.loads(line)
+        except (json.JSONDecodeError, OSError, EOFError, zlib.error, UnicodeDecodeError) as e:
+            raise SnapshotError(f"Snapshot {src} is truncated or corrupt after line {lineno - 1} ({e})") from e
+
+
+def safe_target(output_dir: Path, rel: str) -> Path:
+    """Resolve a snapshot path inside the hub, rejecting anything that escapes it."""
+    pure = PurePosixPath(rel)
+    if pure.is_absolute() or ".." in pure.parts or not pure.parts:
+        raise SnapshotError(f"Refusing to restore unsafe path: {rel}")
+    return output_dir.joinpath(*pure.parts)
+
+
+def import_snapshot(src: Path, output_dir: Path, force: bool = False) -> list[str]:
+    """Restore every file from a snapshot. Returns the restored paths.
+
+    Existing files are skipped unless force=True, matching generate_all.
+    Files are staged next to their targets and only moved into place once
+    the end record has been read, so a truncated or corrupt snapshot
+    raises SnapshotError and restores nothing.
+    """
+    staged = []  # (rel, target, tmp, mtime)
+    handle = None
+    complete = False
+    try:
+        for record in read_snapshot(src):
+            kind = record.get("type")
+            if kind == "file":
+                if handle:
+                    handle.close()
+                    handle = None
+                rel = record["path"]
+                target = safe_target(output_dir, rel)
+                if target.exists() and not force:
+                    logger.debug(f"SKIP (exists): {rel}")
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_name(f".{target.name}.{os.getpid()}.restore")
+                staged.append((rel, target, tmp, record["mtime"]))
+                handle = open(tmp, "wb")
+            elif kind == "content" and handle and record["path"] == staged[-1][0]:
+                if "b64" in record:
+                    handle.write(base64.b64decode(record["b64"]))
+                else:
+                    handle.write(record["text"].encode("utf-8"))
+            elif kind == "end":
+                complete = True
+                break
+        if handle:
+            handle.close()
+            handle = None
+        if not complete:
+            raise SnapshotError(f"Snapshot {src} is truncated (no end record); nothing was restored")
+
+        restored = []
+        for rel, target, tmp, mtime in staged:
+            tmp.replace(target)
+            os.utime(target, (mtime, mtime))
+            restored.append(rel)
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        # ValueError covers bad base64; records missing fields land in the others
+        raise SnapshotError(f"Malformed record in snapshot {src}: {e}") from e
+    finally:
+        if handle:
+            handle.close()
+        for _, _, tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+
+    logger.debug(f"Snapshot restored: {len(restored)} files from {src}")
+    return restored
+
+
+def iter_snapshot_records(src: Path, kind: str | None = None) -> Iterator[dict]:
+    """Yield parsed entries from a snapshot, optionally filtered by kind (e.g. "backlog")."""
+    for record in read_snapshot(src):
+        if record["type"] == "record" and (kind is None or record["kind"] == kind):
+            yield record
@@ -0,0 +1,277 @@
+"""Cached, parallel stack detection for /add-project and /status.
+
+Walks a project with os.scandir, pruning gitignored and vendor directories
+(node_modules, build output, virtualenvs, ...) before descending, and
+records stack markers: package manifests, lockfiles and framework/deploy
+configs, plus well-known dependencies named in package.json,
+requirements.txt and pyproject.toml. Each top-level subtree is walked in
+its own worker process, which is where monorepos spend their time.
+
+Results are cached per directory in data/portfolio/.stack-cache.json, keyed
+by the directory's mtime (which changes whenever an entry is added, removed
+or renamed) plus the mtimes of the manifests and .gitignore read in it. A
+re-scan of an unchanged tree is one stat per directory.
+
+Usage (via generate.py):
+    python3 scripts/generate.py stack ~/code/site     # one directory
+    python3 scripts/generate.py stack                 # every project with a Path in projects.md
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import gitignore
+import hubdata
+
+
+CACHE_PATH = Path("data/portfolio/.stack-cache.json")
+CACHE_VERSION = 1
+
+# name or glob -> (category, stack)
+MARKERS = {
+    "package.json": ("manifest", "Node.js"),
+    "deno.json": ("manifest", "Deno"),
+    "pyproject.toml": ("manifest", "Python"),
+    "setup.py": ("manifest", "Python"),
+    "requirements.txt": ("manifest", "Python"),
+    "Pipfile": ("manifest", "Python"),
+    "Cargo.toml": ("manifest", "Rust"),
+    "go.mod": ("manifest", "Go"),
+    "Gemfile": ("manifest", "Ruby"),
+    "composer.json": ("manifest", "PHP"),
+    "pom.xml": ("manifest", "Java (Maven)"),
+    "build.gradle": ("manifest", "JVM (Gradle)"),
+    "build.gradle.kts": ("manifest", "JVM (Gradle)"),
+    "*.csproj": ("manifest", ".NET"),
+    "*.sln": ("manifest", ".NET"),
+    "mix.exs": ("manifest", "Elixir"),
+    "pubspec.yaml": ("manifest", "Flutter/Dart"),
+    "Package.swift": ("manifest", "Swift"),
+    "package-lock.json": ("lockfile", "npm"),
+    "yarn.lock": ("lockfile", "Yarn"),
+    "pnpm-lock.yaml": ("lockfile", "pnpm"),
+    "bun.lockb": ("lockfile", "Bun"),
+    "bun.lock": ("lockfile", "Bun"),
+    "poetry.lock": ("lockfile", "Poetry"),
+    "uv.lock": ("lockfile", "uv"),
+    "Pipfile.lock": ("lockfile", "Pipenv"),
+    "Cargo.lock": ("lockfile", "Cargo"),
+    "go.sum": ("lockfile", "Go modules"),
+    "Gemfile.lock": ("lockfile", "Bundler"),
+    "composer.lock": ("lockfile", "Composer"),
+    "next.config.*": ("config", "Next.js"),
+    "nuxt.config.*": ("config", "Nuxt"),
+    "vite.config.*": ("config", "Vite"),
+    "svelte.config.*": ("config", "SvelteKit"),
+    "astro.config.*": ("config", "Astro"),
+    "remix.config.*": ("config", "Remix"),
+    "gatsby-config.*": ("config", "Gatsby"),
+    "angular.json": ("config", "Angular"),
+    "tailwind.config.*": ("config", "Tailwind CSS"),
+    "tsconfig.json": ("config", "TypeScript"),
+    "manage.py": ("config", "Django"),
+    "wp-config.php": ("config", "WordPress"),
+    "shopify.app.toml": ("config", "Shopify"),
+    "Dockerfile": ("deploy", "Docker"),
+    "docker-compose.yml": ("deploy", "Docker Compose"),
+    "docker-compose.yaml": ("deploy", "Docker Compose"),
+    "compose.yaml": ("deploy", "Docker Compose"),
+    "vercel.json": ("deploy", "Vercel"),
+    "netlify.toml": ("deploy", "Netlify"),
+    "wrangler.toml": ("deploy", "Cloudflare Workers"),
+    "fly.toml": ("deploy", "Fly.io"),
+    "firebase.json": ("deploy", "Firebase"),
+    "serverless.yml": ("deploy", "Serverless"),
+    "*.tf": ("deploy", "Terraform"),
+}
+EXACT_MARKERS = {name: marker for name, marker in MARKERS.items() if "*" not in name}
+GLOB_MARKERS = [(name, marker) for name, marker in MARKERS.items() if "*" in name]
+
+NODE_DEPENDENCIES = {
+    "next": "Next.js", "react": "React", "vue": "Vue", "svelte": "Svelte", "@angular/core": "Angular",
+    "nuxt": "Nuxt", "astro": "Astro", "express": "Express", "fastify": "Fastify", "@nestjs/core": "NestJS",
+    "react-native": "React Native", "expo": "Expo", "electron": "Electron", "tailwindcss": "Tailwind CSS",
+    "prisma": "Prisma", "@supabase/supabase-js": "Supabase", "firebase": "Firebase", "stripe": "Stripe",
+}
+PYTHON_DEPENDENCIES = {
+    "django": "Django", "flask": "Flask", "fastapi": "FastAPI", "streamlit": "Streamlit",
+    "pandas": "pandas", "torch": "PyTorch", "langchain": "LangChain", "anthropic": "Anthropic SDK",
+    "openai": "OpenAI SDK", "sqlalchemy": "SQLAlchemy", "celery": "Celery",
+}
+# Files whose contents are read, so their mtimes are part of the cache key
+WATCHED = {".gitignore", "package.json", "requirements.txt", "pyproject.toml"}
+PY_REQUIREMENT_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9_.-]*)", re.MULTILINE)
+PY_QUOTED_RE = re.compile(r"[\"']([A-Za-z0-9][A-Za-z0-9_.-]*)\s*(?:[<>=!~\[;@ ]|[\"'])")
+
+logger = logging.getLogger("intel-hub")
+
+
+def match_marker(name: str) -> tuple[str, str] | None:
+    marker = EXACT_MARKERS.get(name)
+    if marker:
+        return marker
+    for pattern, marker in GLOB_MARKERS:
+        if fnmatch.fnmatchcase(name, pattern):
+            return marker
+    return None
+
+
+def dependency_stacks(path: Path) -> list[str]:
+    """Frameworks named as dependencies in a package.json, requirements.txt or pyproject.toml."""
+    try:
+        text = path.read_text(errors="replace")
+    except OSError:
+        return []
+    if path.name == "package.json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return []
+        names = set()
+        for key in ("dependencies", "devDependencies", "peerDependencies"):
+            if isinstance(data.get(key), dict):
+                names.update(data[key])
+        return sorted({NODE_DEPENDENCIES[n] for n in names if n in NODE_DEPENDENCIES})
+    pattern = PY_REQUIREMENT_RE if path.name == "requirements.txt" else PY_QUOTED_RE
+    names = {n.lower().replace("_", "-") for n in pattern.findall(text)}
+    return sorted({PYTHON_DEPENDENCIES[n] for n in names if n in PYTHON_DEPENDENCIES})
+
+
+def mtime(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan_dir(root: Path, rel: str, rules: gitignore.IgnoreRules) -> dict:
+    """List one directory: its markers and the subdirectories worth descending into."""
+    path = root / rel if rel else root
+    entry = {"mtime": mtime(path), "watch": {}, "markers": [], "subdirs": []}
+    try:
+        items = sorted(os.scandir(path), key=lambda e: e.name)
+    except OSError:
+        return entry
+    for item in items:
+        child = f"{rel}/{item.name}" if rel else item.name
+        if item.is_symlink():
+            continue
+        if item.is_dir():
+            if not rules.ignored(child, is_dir=True):
+                entry["subdirs"].append(item.name)
+            continue
+        if item.name in WATCHED:
+            entry["watch"][item.name] = item.stat().st_mtime_ns
+        if rules.ignored(child, is_dir=False):
+            continue
+        marker = match_marker(item.name)
+        if marker:
+            entry["markers"].append([item.name, *marker])
+        if item.name in WATCHED and item.name != ".gitignore":
+            entry["markers"] += [[item.name, "dependency", stack] for stack in dependency_stacks(Path(item.path))]
+    return entry
+
+
+def is_current(root: Path, rel: str, entry: dict | None) -> bool:
+    if not entry:
+        return False
+    path = root / rel if rel else root
+    if mtime(path) != entry["mtime"]:
+        return False
+    return all(mtime(path / name) == stamp for name, stamp in entry["watch"].items())
+
+
+def walk_subtree(job: tuple) -> tuple[dict, int]:
+    """Walk one subtree, reusing cached directory entries. Runs in a worker process.
+
+    Returns (entries by relative dir, directories rescanned).
+    """
+    root, rel, rules, cached, force = job
+    out = {}
+    rescanned = 0
+    stack = [(rel, rules, force)]
+    while stack:
+        rel, parent_rules, force = stack.pop()
+        dir_rules = parent_rules.child(root / rel)
+        entry = cached.get(rel)
+        if force or not is_current(root, rel, entry):
+            fresh = scan_dir(root, rel, dir_rules)
+            # A changed .gitignore can un-prune (or prune) anything below it
+            force = force or (entry is not None and entry["watch"].get(".gitignore") != fresh["watch"].get(".gitignore"))
+            entry = fresh
+            rescanned += 1
+        out[rel] = entry
+        stack += [(f"{rel}/{name}" if rel else name, dir_rules, force) for name in entry["subdirs"]]
+    return out, rescanned
+
+
+def load_cache(path: Path) -> dict:
+    data = hubdata.load_json(path)
+    if data.get("version") == CACHE_VERSION:
+        return data.get("roots", {})
+    return {}
+
+
+def scan(output_dir: Path, root: Path, workers: int | None = None) -> dict:
+    """Detect a project's stack. Returns a JSON-ready result.
+
+    Result keys: root, dirs, rescanned, stacks {stack: [dirs]}, markers
+    [{dir, file, category, stack}].
+    """
+    root = Path(root).expanduser().resolve()
+    cache_path = output_dir / CACHE_PATH
+    roots = load_cache(cache_path)
+    cached = roots.get(str(root), {})
+
+    # The root is listed here; each of its subdirectories is a separate job
+    rules = gitignore.IgnoreRules.load(root)
+    top_entry = cached.get("")
+    rescanned = 0
+    forced = False
+    if not is_current(root, "", top_entry):
+        fresh = scan_dir(root, "", rules)
+        forced = top_entry is not None and top_entry["watch"].get(".gitignore") != fresh["watch"].get(".gitignore")
+        top_entry = fresh
+        rescanned = 1
+
+    jobs = []
+    for name in top_entry["subdirs"]:
+        prefix = name + "/"
+        subset = {k: v for k, v in cached.items() if k == name or k.startswith(prefix)}
+        jobs.append((root, name, rules, subset, forced))
+
+    entries = {"": top_entry}
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(walk_subtree, jobs))
+    else:
+        results = [walk_subtree(job) for job in jobs]
+    for subtree, count in results:
+        entries.update(subtree)
+        rescanned += count
+
+    roots[str(root)] = entries
+    hubdata.write_atomic(cache_path, json.dumps({"version": CACHE_VERSION, "roots": roots}))
+
+    markers = []
+    stacks: dict[str, list[str]] = {}
+    for rel in sorted(entries):
+        for name, category, stack in entries[rel]["markers"]:
+            markers.append({"dir": rel or ".", "file": name, "category": category, "stack": stack})
+            dirs = stacks.setdefault(stack, [])
+            if (rel or ".") not in dirs:
+                dirs.append(rel or ".")
+    logger.debug(f"Stack scan {root}: {len(entries)} dirs, {rescanned} rescanned")
+    return {"root": str(root), "dirs": len(entries), "rescanned": rescanned, "stacks": stacks, "markers": markers}
+
+
+def summarize(result: dict) -> str:
+    """One line for projects.md: stacks ordered by how many directories use them."""
+    counts = Counter({stack: len(dirs) for stack, dirs in result["stacks"].items()})
+    return ", ".join(stack for stack, _ in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0].lower())))
@@ -0,0 +1,366 @@
+"""Seeded synthetic hub generator for load and scale testing.
+
+Produces a hub with the same layout and file formats the real generators
+and hubdata parsers use, at configurable sizes. Every file is written line
+by line through a buffered writer, so memory stays flat and GB-scale hubs
+only cost disk and time. The same seed always produces the same entries.
+
+Cross-references are realistic: backlog Source cells cite bookmark URLs,
+and authors follow a long-tail distribution so a few people dominate.
+
+Usage (via generate.py):
+    python3 scripts/generate.py --output-dir /tmp/big-hub synth --size production --seed 7
+    python3 scripts/generate.py --output-dir /tmp/hub synth --intake 50000 --bookmarks 5000
+"""
+
+import json
+import logging
+import random
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import generate
+import hubdata
+
+
+@dataclass
+class HubSize:
+    """How many of each entry to generate."""
+    intake: int = 200
+    bookmarks: int = 100
+    backlog: int = 50
+    projects: int = 20
+    pipeline: int = 40
+    people: int = 30
+    authors: int = 50
+    transcripts: int = 2
+    transcript_minutes: int = 10
+    knowledge: int = 10
+
+
+SYNTH_FIELDS = list(asdict(HubSize()))
+
+SIZES = {
+    "small": HubSize(),
+    "medium": HubSize(intake=50_000, bookmarks=5_000, backlog=1_000, projects=300,
+                      pipeline=2_000, people=300, authors=1_000, transcripts=20,
+                      transcript_minutes=60, knowledge=200),
+    # Roughly a three-year-old agency hub
+    "production": HubSize(intake=1_000_000, bookmarks=100_000, backlog=10_000, projects=3_000,
+                          pipeline=20_000, people=2_000, authors=10_000, transcripts=200,
+                          transcript_minutes=60, knowledge=2_000),
+}
+
+SYNTH_CONFIG = {
+    "business_name": "Synthetic Pool Co",
+    "description": "Generated hub for scale testing",
+    "industry": "home_services",
+    "industry_label": "Home Services",
+    "categories": ["Implement", "Marketing", "Monitor", "Competitors", "Equipment & Suppliers"],
+    "bookmark_topics": ["Industry Trends", "Equipment & Tech", "Marketing Ideas",
+                        "Competitor Intel", "Operations", "Hiring & Team"],
+    "project_lanes": ["Revenue", "Operations", "Growth"],
+    "platforms": ["Facebook", "Instagram", "Google Business Profile", "LinkedIn", "YouTube"],
+    "voice": "casual",
+    "audience": "homeowners",
+}
+
+WORDS = (
+    "pool pump filter rebate customer schedule route quote invoice review marketing "
+    "local search ads referral season spring summer winter opening closing chemical "
+    "chlorine salt heater automation controller warranty install repair crew truck "
+    "hiring training margin pricing bundle membership retention churn lead funnel "
+    "website booking reminder text email video short reel post newsletter guide "
+    "checklist survey supplier distributor inventory backorder shortage trend forecast "
+    "competitor franchise regional national software crm dispatch mobile app payment"
+).split()
+
+HOSTS = ["x.com", "www.youtube.com", "www.linkedin.com", "github.com",
+         "poolpro.substack.com", "medium.com", "www.reddit.com", "blog.example.com"]
+
+INTAKE_STATUSES = (["processed"] * 6) + (["actioned"] * 3) + ["pending"]
+BACKLOG_STATUSES = ["idea", "idea", "exploring", "in-progress", "done", "done", "rejected", "deferred"]
+PIPELINE_STAGES = ["Idea", "Research", "Outline", "Draft", "Review", "Scheduled", "Published"]
+PRIORITIES = ["High", "Medium", "Low"]
+WRITE_BUFFER = 1024 * 1024
+
+logger = logging.getLogger("intel-hub")
+
+
+class LineWriter:
+    """Line writer over one large file buffer that counts the UTF-8 bytes written."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(path, "wb", buffering=WRITE_BUFFER)
+        self.bytes = 0
+
+    def write(self, line: str = ""):
+        data = (line + "\n").encode("utf-8")
+        self.bytes += len(data)
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Synth:
+    """Seeded source of realistic-looking hub content."""
+
+    def __init__(self, seed: int, size: HubSize, start: datetime):
+        self.rng = random.Random(seed)
+        self.size = size
+        self.start = start
+        self.authors = [f"{self._name()} {i}" for i in range(size.authors)]
+        # Long tail: author k is picked with weight 1 / (k + 1)
+        weights = [1 / (k + 1) for k in range(size.authors)]
+        self.author_cum = []
+        total = 0.0
+        for w in weights:
+            total += w
+            self.author_cum.append(total)
+
+    def _name(self) -> str:
+        first = self.rng.choice(["Alex", "Sam", "Jordan", "Taylor", "Casey", "Riley", "Morgan", "Jamie"])
+        last = self.rng.choice(["Reed", "Shah", "Ortiz", "Kim", "Nguyen", "Brooks", "Patel", "Lowe"])
+        return f"{first} {last}"
+
+    def words(self, lo: int, hi: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(lo, hi)))
+
+    def title(self) -> str:
+        return self.words(3, 8).capitalize()
+
+    def author(self) -> str:
+        return self.rng.choices(self.authors, cum_weights=self.author_cum)[0]
+
+    def days_ago(self, max_days: int) -> datetime:
+        return self.start - timedelta(minutes=self.rng.randint(0, max_days * 24 * 60))
+
+    @staticmethod
+    def bookmark_url(i: int) -> str:
+        """Bookmark URLs are derived from their index so other files can cite them."""
+        return f"https://{HOSTS[i % len(HOSTS)]}/p/{i:07d}"
+
+
+def template_parts(text: str, placeholder: str) -> tuple[str, str]:
+    """Split a generated template around its first placeholder line."""
+    head, _, tail = text.partition(placeholder)
+    return head.rstrip("\n"), tail.lstrip("\n")
+
+
+def write_intake(path: Path, synth: Synth, config: dict) -> int:
+    head, _ = template_parts(generate.generate_intake_log(config), "*(No entries yet")
+    minutes = 3 * 365 * 24 * 60
+    step = max(minutes // max(synth.size.intake, 1), 1)
+    with LineWriter(path) as out:
+        out.write(head)
+        out.write()
+        when = synth.start
+        for i in range(synth.size.intake):
+            # Newest first, with jitter so timestamps aren't perfectly regular
+            when -= timedelta(minutes=synth.rng.randint(1, 2 * step))
+            status = synth.rng.choice(INTAKE_STATUSES)
+            url = synth.bookmark_url(synth.rng.randrange(max(synth.size.bookmarks, 1)))
+            out.write(f"[{when:%Y-%m-%d %H:%M}] | {status} | {synth.title()} | {url}")
+        return out.bytes
+
+
+def write_bookmarks(path: Path, synth: Synth, config: dict) -> int:
+    topics = config.get("bookmark_topics", config["categories"])
+    head, _ = template_parts(generate.generate_bookmarks(config), f"## {topics[0]}")
+    with LineWriter(path) as out:
+        out.write(head)
+        for t, topic in enumerate(topics):
+            out.write()
+            out.write(f"## {topic}")
+            # Bookmark i lives in topic i % len(topics)
+            for i in range(t, synth.size.bookmarks, len(topics)):
+                out.write()
+                out.write(hubdata.format_bookmark({
+                    "title": synth.title(),
+                    "author": synth.author(),
+                    "date": f"{synth.days_ago(3 * 365):%Y-%m-%d}",
+                    "url": synth.bookmark_url(i),
+                    "content": synth.words(20, 60).capitalize() + ".",
+                    "tags": ", ".join(synth.rng.sample(WORDS, 3)),
+                    "notes": synth.words(5, 15).capitalize() + ".",
+                }))
+        return out.bytes
+
+
+def write_backlog(path: Path, synth: Synth, config: dict) -> int:
+    text = generate.generate_implementation_backlog(config)
+    sections = text.split("\n## ")
+    placeholder = "| *(none yet)* | — | — | — | — |"
+    with LineWriter(path) as out:
+        out.write(sections[0].rstrip("\n"))
+        for s, section in enumerate(sections[1:]):
+            kind = section.split("\n", 1)[0].strip()
+            head = section.split(placeholder)[0].rstrip("\n")
+            out.write()
+            out.write(f"## {head}")
+            for i in range(s, synth.size.backlog, len(sections) - 1):
+                source = synth.bookmark_url(synth.rng.randrange(max(synth.size.bookmarks, 1)))
+                status = synth.rng.choice(BACKLOG_STATUSES)
+                out.write(f"| {kind[0]}-{i + 1} | {synth.title()} | {source} | {status} | {synth.words(0, 8)} |")
+        return out.bytes
+
+
+def write_projects(path: Path, synth: Synth, config: dict) -> int:
+    lanes = config.get("project_lanes", ["Revenue", "Operations", "Growth"])
+    text = generate.generate_projects({**config, "projects": []})
+    head, _ = template_parts(text, "## ACTIVE")
+    with LineWriter(path) as out:
+        out.write(head)
+        for t, tier in enumerate(hubdata.PROJECT_TIERS):
+            out.write()
+            out.write(f"## {tier}")
+            for i in range(t, synth.size.projects, len(hubdata.PROJECT_TIERS)):
+                out.write()
+                out.write(f"### {synth.title()} {i + 1}")
+                out.write()
+                out.write(f"- **What:** {synth.words(8, 20).capitalize()}")
+                out.write(f"- **Status:** {synth.rng.choice(['Not started', 'In progress', 'Blocked', 'Shipped'])}")
+                out.write(f"- **Lane:** {synth.rng.choice(lanes)}")
+                out.write("- **Next actions:**")
+                for _ in range(synth.rng.randint(1, 4)):
+                    done = "x" if synth.rng.random() < 0.3 else " "
+                    out.write(f"  - [{done}] {synth.words(3, 8).capitalize()}")
+                out.write(f"- **Last touched:** {synth.days_ago(400):%Y-%m-%d}")
+            out.write()
+            out.write("---")
+        out.write()
+        out.write("## Recommendations")
+        out.write()
+        out.write("| # | Suggestion | Source | Votes | Status |")
+        out.write("|---|-----------|--------|-------|--------|")
+        for i in range(max(synth.size.projects // 10, 1)):
+            source = synth.bookmark_url(synth.rng.randrange(max(synth.size.bookmarks, 1)))
+            status = synth.rng.choice(["open", "accepted", "declined"])
+            out.write(f"| {i + 1} | {synth.title()} | {source} | {synth.rng.randint(0, 9)} | {status} |")
+        return out.bytes
+
+
+def write_pipeline(path: Path, synth: Synth, config: dict) -> int:
+    platforms = config.get("platforms", [])
+    head, _ = template_parts(generate.generate_content_pipeline(config), f"### {platforms[0]}")
+    with LineWriter(path) as out:
+        out.write(head)
+        for p, platform in enumerate(platforms):
+            out.write()
+            out.write(f"### {platform}")
+            out.write()
+            out.write("| Title | Stage | Priority | Due | Notes |")
+            out.write("|-------|-------|----------|-----|-------|")
+            for _ in range(p, synth.size.pipeline, len(platforms)):
+                due = synth.start + timedelta(days=synth.rng.randint(-60, 90))
+                stage = synth.rng.choice(PIPELINE_STAGES)
+                priority = synth.rng.choice(PRIORITIES)
+                out.write(f"| {synth.title()} | {stage} | {priority} | {due:%Y-%m-%d} | {synth.words(0, 6)} |")
+        return out.bytes
+
+
+def write_brief(path: Path, synth: Synth, config: dict) -> int:
+    text = generate.generate_intelligence_brief(config)
+    placeholder = "| *(none yet)* | — | — | — |"
+    parts = text.split(placeholder)
+    per_category = max(synth.size.backlog // 20, 1)
+    with LineWriter(path) as out:
+        for n, part in enumerate(parts):
+            if n:
+                out.write()
+            out.write(part.strip("\n"))
+            if n == len(parts) - 1:
+                break
+            for _ in range(per_category):
+                source = synth.bookmark_url(synth.rng.randrange(max(synth.size.bookmarks, 1)))
+                status = synth.rng.choice(["open", "done", "blocked"])
+                out.write(f"| {synth.title()} | {source} | {synth.rng.choice(PRIORITIES)} | {status} |")
+        return out.bytes
+
+
+def write_people(path: Path, synth: Synth, config: dict) -> int:
+    head, _ = template_parts(generate.generate_people_to_watch(config), "*(No people tracked yet")
+    with LineWriter(path) as out:
+        out.write(head)
+        out.write()
+        out.write("| Name | Platform | Why | Follow Priority |")
+        out.write("|------|----------|-----|-----------------|")
+        for name in synth.authors[:synth.size.people]:
+            platform = hubdata.platform_for(f"https://{synth.rng.choice(HOSTS)}/")
+            out.write(f"| {name} | {platform} | {synth.words(4, 10)} | {synth.rng.choice(PRIORITIES)} |")
+        return out.bytes
+
+
+def write_transcript(path: Path, synth: Synth) -> int:
+    with LineWriter(path) as out:
+        out.write(f"# {synth.title()}")
+        out.write()
+        seconds = 0
+        while seconds < synth.size.transcript_minutes * 60:
+            h, rem = divmod(seconds, 3600)
+            m, s = divmod(rem, 60)
+            out.write(f"[{h:02d}:{m:02d}:{s:02d}] {synth.words(12, 40)}")
+            seconds += synth.rng.randint(4, 15)
+        return out.bytes
+
+
+def write_knowledge(path: Path, synth: Synth) -> int:
+    with LineWriter(path) as out:
+        out.write(f"# {synth.title()}")
+        for _ in range(synth.rng.randint(3, 8)):
+            out.write()
+            out.write(f"## {synth.title()}")
+            out.write()
+            out.write(synth.words(60, 200).capitalize() + ".")
+        return out.bytes
+
+
+def generate_hub(output_dir: Path, size: HubSize, seed: int = 0, config: dict | None = None,
+                 start: datetime | None = None) -> dict[str, int]:
+    """Write a synthetic hub into output_dir. Returns bytes written per file."""
+    config = config or SYNTH_CONFIG
+    synth = Synth(seed, size, start or datetime(2026, 1, 1, 12, 0))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "config.json").write_text(json.dumps(config, indent=2))
+    (output_dir / "CLAUDE.md").write_text(generate.generate_claude_md(config))
+
+    writers = {
+        "data/research/intake-log.md": write_intake,
+        "data/research/bookmarks.md": write_bookmarks,
+        "data/research/intelligence-brief.md": write_brief,
+        "data/research/people-to-watch.md": write_people,
+        "data/portfolio/projects.md": write_projects,
+        "data/portfolio/content-pipeline.md": write_pipeline,
+        "data/portfolio/implementation-backlog.md": write_backlog,
+    }
+    written = {}
+    for rel_path, writer in writers.items():
+        written[rel_path] = writer(output_dir / rel_path, synth, config)
+        logger.debug(f"SYNTH: {rel_path} ({written[rel_path]} bytes)")
+
+    for i in range(size.transcripts):
+        rel_path = f"data/knowledge/transcripts/transcript-{i + 1:04d}.txt"
+        written[rel_path] = write_transcript(output_dir / rel_path, synth)
+    for i in range(size.knowledge):
+        folder = "strategies" if i % 2 == 0 else "tools"
+        rel_path = f"data/knowledge/{folder}/note-{i + 1:04d}.md"
+        written[rel_path] = write_knowledge(output_dir / rel_path, synth)
+
+    logger.debug(f"SYNTH: {len(written)} files, {sum(written.values())} bytes, seed {seed}")
+    return written
+
+
+def resolve_size(name: str, **overrides) -> HubSize:
+    """Start from a named size and apply any non-None per-field overrides."""
+    base = SIZES[name]
+    fields = {k: v for k, v in overrides.items() if v is not None and k in asdict(base)}
+    return replace(base, **fields)
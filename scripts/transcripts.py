@@ -0,0 +1,259 @@
+"""Chunked, compressed transcript store with random access.
+
+A `.tsz` file holds one transcript as independently compressed chunks of
+about CHUNK_SIZE bytes, cut on line boundaries so every `[HH:MM:SS]` line
+sits in exactly one chunk, followed by a JSON index of each chunk's byte
+range and first/last timestamp:
+
+    MAGIC | chunk 0 | chunk 1 | ... | index (zlib JSON) | footer (index offset, index length, MAGIC)
+
+Reading a time or byte range binary-searches the index and decompresses
+only the chunks that cover it, so a lookup costs one chunk, not the whole
+hour-long file.
+
+Usage (via generate.py):
+    python3 scripts/generate.py transcripts convert            # every .txt in data/knowledge/transcripts/
+    python3 scripts/generate.py transcripts read talk.tsz --from 00:12:00 --to 00:14:30
+    python3 scripts/generate.py transcripts read talk.tsz --bytes 0:2000
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import lzma
+import os
+import re
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+
+TRANSCRIPTS_DIR = Path("data/knowledge/transcripts")
+SUFFIX = ".tsz"
+MAGIC = b"IHTSZ001"
+FOOTER = struct.Struct("<QI8s")
+INDEX_VERSION = 1
+CHUNK_SIZE = 64 * 1024
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+TIMESTAMP_RE = re.compile(rb"^\[(?:(\d+):)?(\d{1,2}):(\d{2})(?:\.\d+)?\]")
+
+logger = logging.getLogger("intel-hub")
+
+
+class TranscriptError(Exception):
+    """Raised for missing, truncated or unreadable .tsz files."""
+
+
+def parse_timestamp(value: str) -> int:
+    """`HH:MM:SS`, `MM:SS` or plain seconds -> seconds."""
+    parts = value.strip().strip("[]").split(":")
+    try:
+        seconds = 0
+        for part in parts:
+            seconds = seconds * 60 + int(float(part))
+        return seconds
+    except ValueError:
+        raise TranscriptError(f"Bad timestamp {value!r} (expected HH:MM:SS)") from None
+
+
+def format_timestamp(seconds: int) -> str:
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+def line_seconds(line: bytes) -> int | None:
+    match = TIMESTAMP_RE.match(line)
+    if not match:
+        return None
+    h, m, s = match.groups()
+    return int(h or 0) * 3600 + int(m) * 60 + int(s)
+
+
+def split_lines(data: bytes, chunk_size: int) -> Iterator[bytes]:
+    """Chunks of roughly chunk_size bytes, each ending at a line break."""
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + chunk_size - 1)
+        end = len(data) if end == -1 else end + 1
+        yield data[start:end]
+        start = end
+
+
+def encode(data: bytes, codec: str = "zlib", chunk_size: int = CHUNK_SIZE, title: str = "") -> bytes:
+    """Pack raw transcript bytes into the .tsz format."""
+    if codec not in CODECS:
+        raise TranscriptError(f"Unknown codec {codec!r} (expected one of: {', '.join(CODECS)})")
+    compress = CODECS[codec][0]
+    parts = [MAGIC]
+    chunks = []
+    raw_offset = 0
+    file_offset = len(MAGIC)
+    last_seen = None
+    for raw in split_lines(data, chunk_size):
+        stamps = [s for s in map(line_seconds, raw.splitlines()) if s is not None]
+        # Untimed chunks inherit the previous timestamp so the index stays sorted
+        first = stamps[0] if stamps else last_seen
+        last_seen = stamps[-1] if stamps else last_seen
+        packed = compress(raw)
+        chunks.append([raw_offset, len(raw), file_offset, len(packed), first, last_seen])
+        parts.append(packed)
+        raw_offset += len(raw)
+        file_offset += len(packed)
+
+    index = {
+        "version": INDEX_VERSION,
+        "codec": codec,
+        "chunk_size": chunk_size,
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "title": title,
+        "chunks": chunks,
+    }
+    packed_index = zlib.compress(json.dumps(index).encode())
+    parts += [packed_index, FOOTER.pack(file_offset, len(packed_index), MAGIC)]
+    return b"".join(parts)
+
+
+class TranscriptReader:
+    """Random access into one .tsz transcript; decompresses only the chunks it needs."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise TranscriptError(f"{self.path} is not a .tsz transcript")
+                f.seek(-FOOTER.size, os.SEEK_END)
+                index_offset, index_len, magic = FOOTER.unpack(f.read(FOOTER.size))
+                if magic != MAGIC:
+                    raise TranscriptError(f"{self.path} is truncated (no index footer)")
+                f.seek(index_offset)
+                index = json.loads(zlib.decompress(f.read(index_len)))
+        except (OSError, struct.error, zlib.error, json.JSONDecodeError) as e:
+            raise TranscriptError(f"Can't read {self.path}: {e}") from e
+        if index.get("version") != INDEX_VERSION:
+            raise TranscriptError(f"{self.path} has unsupported index version {index.get('version')}")
+        self.index = index
+        self.chunks = index["chunks"]
+        self.size = index["size"]
+        self.title = index["title"]
+        self._decompress = CODECS[index["codec"]][1]
+        self._raw_starts = [c[0] for c in self.chunks]
+        self._time_starts = [-1 if c[4] is None else c[4] for c in self.chunks]
+        self._cached: tuple[int, bytes] | None = None
+
+    def chunk(self, i: int) -> bytes:
+        """Raw bytes of chunk i (the most recent one is kept decompressed)."""
+        if self._cached and self._cached[0] == i:
+            return self._cached[1]
+        _, _, offset, length, _, _ = self.chunks[i]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = self._decompress(f.read(length))
+        self._cached = (i, data)
+        return data
+
+    def read_bytes(self, start: int = 0, end: int | None = None) -> bytes:
+        """Raw bytes [start, end) of the original transcript."""
+        end = self.size if end is None else min(end, self.size)
+        if start >= end:
+            return b""
+        first = bisect.bisect_right(self._raw_starts, start) - 1
+        last = bisect.bisect_right(self._raw_starts, end - 1) - 1
+        data = b"".join(self.chunk(i) for i in range(first, last + 1))
+        base = self.chunks[first][0]
+        return data[start - base:end - base]
+
+    def read_time(self, start: int, end: int | None = None) -> str:
+        """Lines stamped within [start, end] seconds, plus the passage already playing at start.
+
+        Untimed continuation lines go with the stamped line above them.
+        """
+        end = start if end is None else end
+        # One chunk back: the passage playing at `start` may begin in the previous chunk
+        first = max(bisect.bisect_right(self._time_starts, start) - 2, 0)
+        before, out = [], []
+        exact = False
+        current = None
+        for i in range(first, len(self.chunks)):
+            if self.chunks[i][4] is not None and self.chunks[i][4] > end:
+                break
+            for line in self.chunk(i).splitlines(keepends=True):
+                stamp = line_seconds(line)
+                if stamp is not None:
+                    current = stamp
+                    if stamp < start:
+                        before = []
+                    exact = exact or stamp == start
+                if current is None:
+                    continue
+                if current > end:
+                    break
+                (before if current < start else out).append(line)
+            if current is not None and current > end:
+                break
+        return b"".join(out if exact else before + out).decode("utf-8", errors="replace")
+
+    def text(self) -> str:
+        return self.read_bytes().decode("utf-8", errors="replace")
+
+    def duration(self) -> int | None:
+        stamps = [c[5] for c in self.chunks if c[5] is not None]
+        return stamps[-1] if stamps else None
+
+
+def tsz_path(path: Path) -> Path:
+    return Path(path).with_suffix(SUFFIX)
+
+
+def open_transcript(path: Path) -> TranscriptReader:
+    """Open a transcript by its .tsz name or its original .txt name."""
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        path = tsz_path(path)
+    if not path.exists():
+        raise TranscriptError(f"File not found: {path}")
+    return TranscriptReader(path)
+
+
+def convert(source: Path, codec: str = "zlib", chunk_size: int = CHUNK_SIZE, keep: bool = False) -> dict:
+    """Convert one plain-text transcript to .tsz, verify it, and remove the original unless keep.
+
+    Returns {"source", "target", "raw", "packed"} sizes in bytes.
+    """
+    source = Path(source)
+    data = source.read_bytes()
+    title = ""
+    first_line = data.split(b"\n", 1)[0].decode("utf-8", errors="replace")
+    if first_line.startswith("# "):
+        title = first_line[2:].strip()
+
+    target = tsz_path(source)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(encode(data, codec=codec, chunk_size=chunk_size, title=title))
+    check = TranscriptReader(tmp)
+    if hashlib.sha256(check.read_bytes()).hexdigest() != check.index["sha256"]:
+        tmp.unlink()
+        raise TranscriptError(f"Round-trip check failed for {source}; original left in place")
+    os.replace(tmp, target)
+    if not keep:
+        source.unlink()
+    logger.debug(f"Packed {source}: {len(data)} -> {target.stat().st_size} bytes ({codec})")
+    return {"source": str(source), "target": str(target), "raw": len(data), "packed": target.stat().st_size}
+
+
+def convert_dir(directory: Path, codec: str = "zlib", chunk_size: int = CHUNK_SIZE, keep: bool = False) -> list[dict]:
+    """Convert every .txt transcript in a directory (recursively) that isn't already packed and current."""
+    results = []
+    for source in sorted(Path(directory).rglob("*.txt")):
+        target = tsz_path(source)
+        if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            continue
+        results.append(convert(source, codec=codec, chunk_size=chunk_size, keep=keep))
+    return results
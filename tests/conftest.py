@@ -1,6 +1,7 @@
 """Shared fixtures for intel-hub tests."""
 
 import json
+import sys
 from pathlib import Path
 
 import pytest
@@ -10,6 +11,24 @@ PRESETS_DIR = ROOT_DIR / "presets"
 SCRIPTS_DIR = ROOT_DIR / "scripts"
 
 
+def pytest_addoption(parser):
+    parser.addoption("--run-scale", action="store_true", default=False,
+                     help="Run scale tests against large synthetic hubs (slow)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "scale: load/scale test using a large synthetic hub (needs --run-scale)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-scale"):
+        return
+    skip_scale = pytest.mark.skip(reason="scale test — pass --run-scale to run")
+    for item in items:
+        if "scale" in item.keywords:
+            item.add_marker(skip_scale)
+
+
 @pytest.fixture
 def root_dir():
     return ROOT_DIR
@@ -56,3 +75,27 @@ def config_file(tmp_path, sample_config):
     path = tmp_path / "config.json"
     path.write_text(json.dumps(sample_config, indent=2))
     return path
+
+
+@pytest.fixture
+def hub(tmp_path, sample_config):
+    """A freshly generated hub in tmp_path."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from generate import generate_all
+
+    generate_all(sample_config, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def synthetic_hub(tmp_path_factory):
+    """Factory for seeded synthetic hubs: synthetic_hub("medium", seed=1, intake=5000)."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import synth
+
+    def make(size="small", seed=0, **overrides):
+        root = tmp_path_factory.mktemp(f"hub-{size}")
+        synth.generate_hub(root, synth.resolve_size(size, **overrides), seed=seed)
+        return root
+
+    return make
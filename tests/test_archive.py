@@ -0,0 +1,126 @@
+"""Test tiered archival of closed intake and backlog entries."""
+
+import gzip
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from archive import (ARCHIVE_DIRS, CLOSED_SINCE_NAME, MANIFEST_NAME, SOURCES, archive_files,
+                     archived_counts, iter_records, run, search)
+from hublock import pending, record
+
+TODAY = date(2026, 6, 1)
+INTAKE = [
+    "[2026-05-20 09:00] | processed | Recent read | https://example.com/recent",
+    "[2026-04-10 09:00] | pending | Still to do | https://example.com/todo",
+    "[2026-01-15 10:30] | actioned | Rebate programs | https://example.com/rebates",
+    "[2026-01-03 08:00] | processed | Pipe | title | https://example.com/pipe",
+    "[2025-12-24 17:45] | processed | Holiday promo | https://example.com/holiday",
+]
+BUILD_ROWS = [
+    "| B-1 | Rebate calculator | https://example.com/rebates | done | |",
+    "| B-2 | Holiday landing page | x | done | shipped 2025-12-28 |",
+    "| B-3 | SMS reminders | x | in-progress | |",
+    "| B-4 | Chatbot | x | rejected | |",
+]
+
+
+@pytest.fixture
+def hub(hub):
+    intake = hub / SOURCES["intake"]
+    intake.write_text(intake.read_text().replace(
+        "*(No entries yet — run `/research <URL>` to get started)*", "\n".join(INTAKE)))
+    backlog = hub / SOURCES["backlog"]
+    backlog.write_text(backlog.read_text().replace(
+        "| *(none yet)* | — | — | — | — |", "\n".join(BUILD_ROWS), 1))
+    return hub
+
+
+def statuses(hub, kind, **kwargs):
+    return sorted(r["status"] for r in iter_records(hub, kind, **kwargs))
+
+
+class TestRun:
+    def test_moves_old_closed_entries_by_month(self, hub):
+        moved = run(hub, days=90, today=TODAY)
+        assert moved["intake"] == {"2025-12": 1, "2026-01": 2}
+        # B-1 is dated by its source's intake entry, B-2 by the date in its notes
+        assert moved["backlog"] == {"2025-12": 1, "2026-01": 1}
+
+        hot = (hub / SOURCES["intake"]).read_text()
+        assert "Recent read" in hot and "Still to do" in hot
+        assert "Rebate programs" not in hot and "Holiday promo" not in hot
+        with gzip.open(hub / ARCHIVE_DIRS["intake"] / "intake-2026-01.md.gz", "rt") as f:
+            archived = f.read()
+        assert archived.index("Rebate programs") < archived.index("Pipe | title")
+
+        backlog = (hub / SOURCES["backlog"]).read_text()
+        assert "B-3" in backlog and "B-4" in backlog
+        assert "B-1" not in backlog and "B-2" not in backlog
+
+    def test_manifest_ranges_and_counts(self, hub):
+        run(hub, days=90, today=TODAY)
+        manifest = json.loads((hub / ARCHIVE_DIRS["intake"] / MANIFEST_NAME).read_text())
+        january = manifest["files"]["intake-2026-01.md.gz"]
+        assert (january["first"], january["last"], january["count"]) == ("2026-01-03", "2026-01-15", 2)
+        assert january["by_status"] == {"actioned": 1, "processed": 1}
+        assert archived_counts(hub, "backlog") == {"done": 2}
+
+    def test_readers_reach_archived_entries(self, hub):
+        before = statuses(hub, "intake")
+        run(hub, days=90, today=TODAY)
+        assert statuses(hub, "intake") == before
+        assert len(statuses(hub, "intake", include_archive=False)) == 2
+        assert statuses(hub, "backlog") == ["done", "done", "in-progress", "rejected"]
+        assert [w for w, _ in search(hub, "backlog", "holiday landing")] == ["backlog-2025-12.md.gz"]
+
+    def test_date_bounds_skip_archives(self, hub):
+        run(hub, days=90, today=TODAY)
+        files = archive_files(hub / ARCHIVE_DIRS["intake"], "intake", since=date(2026, 1, 10))
+        assert [f.name for f in files] == ["intake-2026-01.md.gz"]
+
+    def test_rerun_is_idempotent(self, hub):
+        run(hub, days=90, today=TODAY)
+        assert run(hub, days=90, today=TODAY) == {"backlog": {}, "intake": {}}
+        # Re-archiving the same lines (e.g. after a crash) doesn't duplicate them
+        intake = hub / SOURCES["intake"]
+        intake.write_text(intake.read_text() + INTAKE[2] + "\n")
+        run(hub, days=90, today=TODAY)
+        assert statuses(hub, "intake").count("actioned") == 1
+
+    def test_dry_run_changes_nothing(self, hub):
+        text = (hub / SOURCES["intake"]).read_text()
+        assert run(hub, days=90, today=TODAY, dry_run=True)["intake"]
+        assert (hub / SOURCES["intake"]).read_text() == text
+        assert not (hub / ARCHIVE_DIRS["intake"]).exists()
+
+    def test_dry_run_leaves_journal_unmerged(self, hub):
+        text = (hub / SOURCES["intake"]).read_text()
+        record(hub, "intake", {"op": "append", "section": None,
+                               "text": "[2025-11-02 09:00] | processed | Journaled | https://example.com/j"})
+        months = run(hub, days=90, today=TODAY, dry_run=True)["intake"]
+        assert months["2025-11"] == 1
+        assert (hub / SOURCES["intake"]).read_text() == text
+        assert pending(hub) == {SOURCES["intake"].as_posix(): 1}
+
+    def test_undated_rows_wait_from_first_seen_closed(self, hub):
+        run(hub, days=90, today=TODAY)
+        stamps = json.loads((hub / ARCHIVE_DIRS["backlog"] / CLOSED_SINCE_NAME).read_text())
+        assert stamps == {"BUILD:B-4": "2026-06-01"}
+        assert run(hub, days=90, today=date(2026, 7, 1))["backlog"] == {}
+        assert run(hub, days=90, today=date(2026, 9, 15))["backlog"] == {"2026-06": 1}
+
+    def test_emptied_table_keeps_placeholder(self, hub):
+        backlog = hub / SOURCES["backlog"]
+        text = backlog.read_text().split("## ADOPT")
+        backlog.write_text(text[0] + "## ADOPT" + text[1].replace(
+            "| *(none yet)* | — | — | — | — |", "| A-1 | Route software | x | done | 2025-11-02 |", 1))
+        run(hub, days=90, today=TODAY)
+        adopt = backlog.read_text().split("## ADOPT")[1].split("## OFFER")[0]
+        assert "A-1" not in adopt
+        assert adopt.strip().splitlines()[-1] == "| *(none yet)* | — | — | — | — |"
@@ -0,0 +1,107 @@
+"""Test the batch atomize stage."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from atomize import PLATFORM_RULES, atomize, build_variant, rule_for, split_chunks
+from pipeline import Pipeline
+
+POST = """# Spring Pool Opening Guide
+
+Opening your pool early saves money. Algae blooms cost more to fix than a spring visit.
+
+## Check the equipment
+
+Inspect the pump and filter before the first warm week. Variable speed pumps now qualify for utility rebates in most of Western NC. A quick pressure check catches cracked filter housings.
+
+## Balance the water
+
+Test pH and chlorine after the cover comes off. Shock the pool the first night and run the pump for a full day.
+"""
+
+
+@pytest.fixture
+def post(tmp_path):
+    path = tmp_path / "post.md"
+    path.write_text(POST)
+    return path
+
+
+class TestChunks:
+    def test_one_chunk_per_section(self):
+        chunks = split_chunks(POST)
+        assert [c["heading"] for c in chunks] == ["", "Check the equipment", "Balance the water"]
+
+    def test_hash_ignores_whitespace(self):
+        a = split_chunks(POST)
+        b = split_chunks(POST.replace("Inspect the pump", "Inspect  the\\npump".replace("\\n", "\n")))
+        assert a[1]["hash"] == b[1]["hash"]
+
+
+class TestVariants:
+    @pytest.mark.parametrize("platform", sorted(PLATFORM_RULES))
+    def test_respects_length_limit(self, platform):
+        for chunk in split_chunks(POST * 5):
+            assert len(build_variant(chunk, platform)) <= PLATFORM_RULES[platform]["max_chars"]
+
+    def test_hashtags_per_rule(self):
+        variant = build_variant(split_chunks(POST)[1], "X")
+        assert variant.split("\n\n")[-1].count("#") == 2
+
+    def test_unknown_platform_uses_default(self):
+        assert rule_for("Mastodon")["max_chars"] == 500
+        assert rule_for("twitter") is PLATFORM_RULES["X"]
+
+
+class TestAtomize:
+    def test_queues_ideas_per_platform(self, hub, post, sample_config):
+        stats = atomize(hub, [post], sample_config["platforms"], workers=2)
+        assert stats["generated"] == 3 * len(sample_config["platforms"])
+        flow = Pipeline.load(hub)
+        assert len(flow.items) == stats["queued"] == stats["generated"]
+        assert {item["stage"] for item in flow.items.values()} == {"Idea"}
+        draft = hub / next(iter(flow.items.values()))["notes"]
+        assert draft.exists()
+
+    def test_rerun_reuses_everything(self, hub, post, sample_config):
+        atomize(hub, [post], sample_config["platforms"])
+        stats = atomize(hub, [post], sample_config["platforms"])
+        assert stats["generated"] == 0
+        assert stats["queued"] == 0
+        assert stats["reused"] == 3 * len(sample_config["platforms"])
+
+    def test_edit_regenerates_only_changed_chunk(self, hub, post, sample_config):
+        atomize(hub, [post], sample_config["platforms"])
+        post.write_text(POST.replace("Shock the pool the first night", "Shock the pool at dusk"))
+        stats = atomize(hub, [post], sample_config["platforms"])
+        assert stats["changed_chunks"] == 1
+        assert stats["generated"] == len(sample_config["platforms"])
+
+    def test_edit_retires_stale_ideas(self, hub, post, sample_config):
+        platforms = sample_config["platforms"]
+        atomize(hub, [post], platforms)
+        before = Pipeline.load(hub).items
+        post.write_text(POST.replace("Shock the pool the first night", "Shock the pool at dusk"))
+        stats = atomize(hub, [post], platforms)
+        assert stats["retired"] == len(platforms)
+        after = Pipeline.load(hub).items
+        assert len(after) == len(before)
+        gone = [item for key, item in before.items() if key not in after]
+        assert len(gone) == len(platforms)
+        assert not any((hub / item["notes"]).exists() for item in gone)
+        assert all((hub / item["notes"]).exists() for item in after.values())
+
+    def test_edit_keeps_stale_items_past_idea(self, hub, post, sample_config):
+        platforms = sample_config["platforms"]
+        atomize(hub, [post], platforms)
+        flow = Pipeline.load(hub)
+        key = next(iter(flow.items))
+        flow.move(*key, "Draft")
+        flow.save()
+        post.write_text(POST.replace("# ", "# Renamed ", 1))
+        atomize(hub, [post], platforms)
+        assert Pipeline.load(hub).items[key]["stage"] == "Draft"
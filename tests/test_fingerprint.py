@@ -0,0 +1,187 @@
+"""Test near-duplicate fingerprinting and the LSH index."""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from fingerprint import (
+    INDEX_PATH,
+    LEGACY_INDEX_PATH,
+    NUM_PERM,
+    FingerprintError,
+    FingerprintIndex,
+    format_match,
+    index_knowledge,
+    signature,
+    similarity,
+)
+from transcripts import convert
+
+ARTICLE = (
+    "Pool owners in Western North Carolina are switching to variable speed pumps "
+    "because utilities now offer rebates that cover most of the upgrade cost. "
+    "Contractors who bundle the rebate paperwork into their install quote are "
+    "closing more jobs, and several distributors report the pumps are back in stock "
+    "after a year of shortages. The article walks through the rebate math for a "
+    "typical residential pool and compares three popular pump models on noise, "
+    "warranty length and smart controller support."
+)
+
+SYNDICATED = ARTICLE.replace("several distributors", "a few distributors") + " Originally published elsewhere."
+
+UNRELATED = (
+    "A new restaurant point of sale system promises faster table turns by letting "
+    "servers split checks on handheld devices and sync orders to the kitchen display "
+    "without a separate expo station, according to a recent trade show demo."
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return FingerprintIndex(tmp_path / INDEX_PATH)
+
+
+class TestSignature:
+    def test_deterministic(self):
+        assert signature(ARTICLE) == signature(ARTICLE)
+
+    def test_identical_text_is_fully_similar(self):
+        assert similarity(signature(ARTICLE), signature(ARTICLE)) == 1.0
+
+    def test_light_edit_scores_high(self):
+        assert similarity(signature(ARTICLE), signature(SYNDICATED)) > 0.7
+
+    def test_unrelated_scores_low(self):
+        assert similarity(signature(ARTICLE), signature(UNRELATED)) < 0.2
+
+    def test_empty_text(self):
+        assert len(signature("")) == len(signature(ARTICLE))
+
+    def test_empty_documents_never_match(self):
+        assert similarity(signature(""), signature("<script></script>")) == 0.0
+
+
+class TestFingerprintIndex:
+    def test_finds_near_duplicate(self, index):
+        index.add("https://example.com/pumps", signature(ARTICLE))
+        matches = index.query(signature(SYNDICATED), threshold=0.7)
+        assert matches[0][0] == "https://example.com/pumps"
+
+    def test_ignores_unrelated(self, index):
+        index.add("https://example.com/pumps", signature(ARTICLE))
+        assert index.query(signature(UNRELATED)) == []
+
+    def test_exclude_self(self, index):
+        index.add("doc", signature(ARTICLE))
+        assert index.query(signature(ARTICLE), exclude="doc") == []
+
+    def test_empty_documents_not_indexed_as_matches(self, index):
+        index.add("https://example.com/js-only", signature(""))
+        assert index.query(signature("")) == []
+        assert index.buckets == {}
+
+    def test_remove_clears_buckets(self, index):
+        index.add("doc", signature(ARTICLE))
+        index.remove("doc")
+        assert index.docs == {}
+        assert index.buckets == {}
+
+    def test_save_and_load_roundtrip(self, index):
+        index.add("doc", signature(ARTICLE), added="2026-01-01")
+        index.save()
+        loaded = FingerprintIndex.load(index.path)
+        assert loaded.docs["doc"]["added"] == "2026-01-01"
+        assert loaded.query(signature(ARTICLE))[0] == ("doc", 1.0)
+        assert loaded.signatures == {}  # Read per candidate, not at load
+
+    def test_stored_docs_can_be_removed_and_replaced(self, index):
+        index.add("a", signature(ARTICLE))
+        index.add("b", signature(ARTICLE))
+        index.save()
+        loaded = FingerprintIndex.load(index.path)
+        loaded.remove("a")
+        loaded.add("b", signature(UNRELATED))
+        assert loaded.query(signature(ARTICLE)) == []
+        loaded.save()
+        assert list(FingerprintIndex.load(index.path).docs) == ["b"]
+        assert FingerprintIndex.load(index.path).query(signature(UNRELATED))[0] == ("b", 1.0)
+
+    def test_converts_legacy_json_index(self, tmp_path):
+        legacy = tmp_path / LEGACY_INDEX_PATH
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({"version": 1, "num_perm": len(signature(ARTICLE)), "docs": {
+            "https://example.com/pumps": {"signature": signature(ARTICLE), "added": "2026-01-01"}}}))
+        index = FingerprintIndex.load(tmp_path / INDEX_PATH)
+        assert index.query(signature(SYNDICATED), threshold=0.7)[0][0] == "https://example.com/pumps"
+        index.save()
+        assert not legacy.exists()
+        assert FingerprintIndex.load(tmp_path / INDEX_PATH).docs == {"https://example.com/pumps": {"added": "2026-01-01"}}
+
+    def test_rewritten_file_is_not_misread(self, index):
+        index.add("doc", signature(ARTICLE))
+        index.save()
+        loaded = FingerprintIndex.load(index.path)
+        index.add("other", signature(UNRELATED))
+        index.save()
+        with pytest.raises(FingerprintError):
+            loaded.query(signature(ARTICLE))
+
+
+class TestIndexKnowledge:
+    def test_indexes_new_and_skips_unchanged(self, tmp_path, index):
+        strategies = tmp_path / "data/knowledge/strategies"
+        strategies.mkdir(parents=True)
+        (strategies / "pumps.md").write_text(ARTICLE)
+
+        assert index_knowledge(index, tmp_path) == 1
+        assert index_knowledge(index, tmp_path) == 0
+        assert "data/knowledge/strategies/pumps.md" in index.docs
+
+    def test_drops_deleted_files(self, tmp_path, index):
+        strategies = tmp_path / "data/knowledge/strategies"
+        strategies.mkdir(parents=True)
+        doc = strategies / "pumps.md"
+        doc.write_text(ARTICLE)
+        index_knowledge(index, tmp_path)
+
+        doc.unlink()
+        index_knowledge(index, tmp_path)
+        assert index.docs == {}
+
+    def test_reads_packed_transcripts(self, tmp_path, index):
+        folder = tmp_path / "data/knowledge/transcripts"
+        folder.mkdir(parents=True)
+        source = folder / "talk.txt"
+        source.write_text(ARTICLE)
+        index_knowledge(index, tmp_path)
+        convert(source)
+        index_knowledge(index, tmp_path)
+        assert list(index.docs) == ["data/knowledge/transcripts/talk.tsz"]
+        assert index.query(signature(ARTICLE))[0][0] == "data/knowledge/transcripts/talk.tsz"
+
+
+def test_format_match():
+    assert format_match("x.md", 0.934) == "near-duplicate of x.md (similarity 0.93)"
+
+
+@pytest.mark.scale
+def test_check_cost_independent_of_corpus(tmp_path):
+    rng = random.Random(5)
+    index = FingerprintIndex(tmp_path / INDEX_PATH)
+    for i in range(10_000):
+        index.add(f"doc-{i}", [rng.getrandbits(32) for _ in range(NUM_PERM)], mtime=i)
+    index.add("pumps", signature(ARTICLE))
+    index.save()
+
+    start = time.perf_counter()
+    loaded = FingerprintIndex.load(index.path)
+    matches = loaded.query(signature(SYNDICATED), threshold=0.7)
+    elapsed = time.perf_counter() - start
+    assert matches[0][0] == "pumps"
+    assert elapsed < 0.25, f"load + check took {elapsed:.3f}s for 10k docs"
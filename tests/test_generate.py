@@ -1,6 +1,7 @@
 """Test the file generation logic."""
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 
@@ -275,3 +276,13 @@ class TestGenerateAll:
 
         content = (tmp_path / "CLAUDE.md").read_text()
         assert "New Name LLC" in content
+
+
+class TestLogging:
+    def test_commands_share_one_appended_log(self, tmp_path, root_dir):
+        for _ in range(2):
+            subprocess.run([sys.executable, str(root_dir / "scripts/generate.py"), "--output-dir", str(tmp_path),
+                            "journal", "status"], check=True, capture_output=True)
+        log = tmp_path / "logs/commands.log"
+        assert [p.name for p in (tmp_path / "logs").iterdir()] == ["commands.log"]
+        assert log.read_text().count("[journal] Command: --output-dir") == 2
@@ -0,0 +1,53 @@
+"""Test gitignore matching for the directory scanners."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from gitignore import IgnoreRules, is_binary
+
+
+def rules_for(tmp_path, text, **kwargs):
+    (tmp_path / ".gitignore").write_text(text)
+    return IgnoreRules.load(tmp_path, **kwargs)
+
+
+class TestIgnoreRules:
+    def test_basename_matches_at_any_depth(self, tmp_path):
+        rules = rules_for(tmp_path, "*.log\n")
+        assert rules.ignored("debug.log", is_dir=False)
+        assert rules.ignored("a/b/debug.log", is_dir=False)
+        assert not rules.ignored("a/b/debug.txt", is_dir=False)
+
+    def test_anchored_and_dir_only(self, tmp_path):
+        rules = rules_for(tmp_path, "/out\nlogs/\ndocs/*.pdf\n")
+        assert rules.ignored("out", is_dir=True)
+        assert not rules.ignored("src/out", is_dir=True)
+        assert rules.ignored("src/logs", is_dir=True)
+        assert not rules.ignored("logs", is_dir=False)
+        assert rules.ignored("docs/a.pdf", is_dir=False)
+        assert not rules.ignored("docs/sub/a.pdf", is_dir=False)
+
+    def test_negation_and_double_star(self, tmp_path):
+        rules = rules_for(tmp_path, "*.env\n!example.env\nconfig/**/secret.json\n")
+        assert rules.ignored("prod.env", is_dir=False)
+        assert not rules.ignored("example.env", is_dir=False)
+        assert rules.ignored("config/secret.json", is_dir=False)
+        assert rules.ignored("config/a/b/secret.json", is_dir=False)
+
+    def test_nested_gitignore_is_relative(self, tmp_path):
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web/.gitignore").write_text("/cache\n")
+        rules = IgnoreRules.load(tmp_path).child(tmp_path / "web")
+        assert rules.ignored("web/cache", is_dir=True)
+        assert not rules.ignored("cache", is_dir=True)
+
+    def test_vendor_dirs(self, tmp_path):
+        assert IgnoreRules.load(tmp_path).ignored("app/node_modules", is_dir=True)
+        assert not IgnoreRules.load(tmp_path, vendor_dirs=set()).ignored("node_modules", is_dir=True)
+
+
+def test_is_binary():
+    assert is_binary(b"PK\x03\x04\x00\x00")
+    assert not is_binary("plain text — with unicode".encode())
@@ -0,0 +1,158 @@
+"""Test the shared markdown data file parsers."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate import (
+    generate_bookmarks,
+    generate_content_pipeline,
+    generate_implementation_backlog,
+    generate_intelligence_brief,
+    generate_projects,
+)
+from hubdata import (
+    format_bookmark,
+    insert_into_section,
+    load_json,
+    normalize_url,
+    parse_backlog,
+    parse_bookmarks,
+    project_dirs,
+    project_paths,
+    parse_brief,
+    parse_date,
+    parse_intake,
+    parse_pipeline,
+    parse_projects,
+    platform_for,
+)
+
+BOOKMARK = {
+    "topic": "Industry Trends",
+    "title": "Variable speed pump rebates",
+    "author": "Jane Doe",
+    "date": "2026-03-01",
+    "url": "https://x.com/janedoe/status/1",
+    "tags": "pumps, rebates",
+}
+
+
+class TestBookmarks:
+    def test_empty_template_has_no_entries(self, sample_config):
+        lines = generate_bookmarks(sample_config).splitlines()
+        assert list(parse_bookmarks(lines)) == []
+
+    def test_roundtrip_through_template(self, sample_config):
+        text = insert_into_section(generate_bookmarks(sample_config), "Industry Trends", format_bookmark(BOOKMARK))
+        entries = list(parse_bookmarks(text.splitlines()))
+        assert entries == [BOOKMARK]
+        assert "*(No bookmarks yet)*" in text  # Other topics keep their placeholder
+
+    def test_insert_replaces_placeholder(self, sample_config):
+        text = insert_into_section(generate_bookmarks(sample_config), "Industry Trends", format_bookmark(BOOKMARK))
+        section = text.split("## Industry Trends")[1].split("## ")[0]
+        assert "No bookmarks yet" not in section
+
+    def test_insert_creates_missing_section(self, sample_config):
+        text = insert_into_section(generate_bookmarks(sample_config), "New Topic", format_bookmark(BOOKMARK))
+        assert list(parse_bookmarks(text.splitlines()))[0]["topic"] == "New Topic"
+
+
+class TestBacklog:
+    def test_empty_template_has_no_rows(self, sample_config):
+        lines = generate_implementation_backlog(sample_config).splitlines()
+        assert list(parse_backlog(lines)) == []
+
+    def test_rows_tagged_with_kind(self, sample_config):
+        text = generate_implementation_backlog(sample_config).replace(
+            "## ADOPT\n\n| ID | Tool/Practice | Source | Status | Notes |\n|----|--------------|--------|--------|-------|\n",
+            "## ADOPT\n\n| ID | Tool/Practice | Source | Status | Notes |\n|----|--------------|--------|--------|-------|\n"
+            "| A-1 | Pump CRM | https://x.com/janedoe/status/1 | idea | |\n",
+        )
+        rows = list(parse_backlog(text.splitlines()))
+        assert rows == [{"id": "A-1", "tool/practice": "Pump CRM", "source": "https://x.com/janedoe/status/1",
+                         "status": "idea", "notes": "", "kind": "ADOPT"}]
+
+
+class TestIntake:
+    def test_parses_entries(self):
+        lines = [
+            "**Format:** `[YYYY-MM-DD HH:MM] | STATUS | Title | URL`",
+            "[2026-03-01 09:30] | processed | Pumps | rebates explained | https://example.com/a",
+            "[2026-03-02 10:00] | pending | Untitled | https://example.com/b",
+        ]
+        entries = list(parse_intake(lines))
+        assert len(entries) == 2
+        assert entries[0] == {"timestamp": "2026-03-01 09:30", "status": "processed",
+                              "title": "Pumps | rebates explained", "url": "https://example.com/a"}
+
+
+class TestProjects:
+    def test_parses_template_projects(self, sample_config):
+        projects = list(parse_projects(generate_projects(sample_config).splitlines()))
+        assert [p["name"] for p in projects] == ["Spring marketing push", "Hire second technician"]
+        assert projects[0]["tier"] == "ACTIVE"
+        assert projects[0]["status"] == "Not started"
+        assert projects[0]["next_actions"] == [{"done": False, "text": "*(add first action)*"}]
+
+    def test_parses_recommendations(self, sample_config):
+        text = generate_projects(sample_config).replace(
+            "| *(none yet)* | — | — | — | — |", "| 1 | Try SMS reminders | bookmarks | 2 | open |")
+        recs = [p for p in parse_projects(text.splitlines()) if p["tier"] == "Recommendations"]
+        assert recs == [{"tier": "Recommendations", "#": "1", "suggestion": "Try SMS reminders",
+                         "source": "bookmarks", "votes": "2", "status": "open"}]
+
+    def test_project_paths(self, sample_config):
+        text = generate_projects(sample_config).replace(
+            "- **Status:** Not started", "- **Status:** Not started\n- **Path:** `~/code/spring`", 1)
+        assert list(project_paths(text.splitlines())) == [("Spring marketing push", "~/code/spring")]
+
+    def test_project_dirs_resolve_against_hub(self, tmp_path, sample_config):
+        text = generate_projects(sample_config).replace(
+            "- **Status:** Not started", "- **Status:** Not started\n- **Path:** code/spring", 1)
+        (tmp_path / "data/portfolio").mkdir(parents=True)
+        (tmp_path / "data/portfolio/projects.md").write_text(text)
+        assert project_dirs(tmp_path) == [("Spring marketing push", tmp_path / "code/spring")]
+
+
+class TestTables:
+    def test_brief_rows_tagged_with_category(self, sample_config):
+        text = generate_intelligence_brief(sample_config).replace(
+            "| *(none yet)* | — | — | — |", "| Call supplier | x | High | open |", 1)
+        assert list(parse_brief(text.splitlines()))[0]["category"] == "Implement"
+
+    def test_pipeline_rows_tagged_with_platform(self, sample_config):
+        text = generate_content_pipeline(sample_config).replace(
+            "| *(none yet)* | — | — | — | — |", "| Spring promo | Draft | High | 2026-04-01 | |", 1)
+        rows = list(parse_pipeline(text.splitlines()))
+        assert rows[0]["platform"] == "Facebook"
+        assert rows[0]["stage"] == "Draft"
+
+
+class TestUrls:
+    def test_normalize_url(self):
+        assert normalize_url("https://www.Example.com/post/") == normalize_url("http://example.com/post")
+
+    def test_platform_for(self):
+        assert platform_for("https://www.youtube.com/watch?v=1") == "YouTube"
+        assert platform_for("https://blog.example.com/a") == "blog.example.com"
+
+
+class TestHelpers:
+    def test_parse_date(self):
+        assert parse_date("2026-03-01 09:30") == date(2026, 3, 1)
+        assert parse_date("soon") is None
+        assert parse_date(None) is None
+
+    def test_load_json_falls_back_to_empty(self, tmp_path):
+        path = tmp_path / "state.json"
+        assert load_json(path) == {}
+        path.write_text("{not json")
+        assert load_json(path) == {}
+        path.write_text("[1, 2]")
+        assert load_json(path) == {}
+        path.write_text('{"version": 1}')
+        assert load_json(path) == {"version": 1}
@@ -0,0 +1,179 @@
+"""Test advisory locking and the write-ahead journal."""
+
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from hubdata import parse_backlog, parse_intake
+from hublock import (
+    FileLock,
+    JournalError,
+    LockTimeout,
+    append,
+    journal_paths,
+    merge,
+    pending,
+    read_ops,
+    read_text,
+    record,
+    rejected,
+    text_hash,
+    update,
+)
+
+INTAKE = "data/research/intake-log.md"
+BACKLOG = "data/portfolio/implementation-backlog.md"
+
+
+def intake_entries(hub):
+    return list(parse_intake((hub / INTAKE).read_text().splitlines()))
+
+
+def backlog_rows(hub):
+    return list(parse_backlog((hub / BACKLOG).read_text().splitlines()))
+
+
+def _append_many(args):
+    hub, worker, count = args
+    for i in range(count):
+        append(Path(hub), "intake", f"[2026-03-01 09:{i:02d}] | pending | w{worker}-{i} | https://example.com/{worker}/{i}")
+
+
+class TestFileLock:
+    def test_exclusive_lock_times_out(self, tmp_path):
+        with FileLock(tmp_path / "x.lock"):
+            with pytest.raises(LockTimeout):
+                FileLock(tmp_path / "x.lock", timeout=0.1).acquire()
+
+    def test_shared_locks_coexist(self, tmp_path):
+        with FileLock(tmp_path / "x.lock", shared=True):
+            with FileLock(tmp_path / "x.lock", shared=True, timeout=0.1):
+                pass
+
+    def test_released_after_context(self, tmp_path):
+        with FileLock(tmp_path / "x.lock"):
+            pass
+        with FileLock(tmp_path / "x.lock", timeout=0.1):
+            pass
+
+
+class TestAppend:
+    def test_intake_newest_first(self, hub):
+        append(hub, "intake", "[2026-03-01 09:00] | pending | First | https://example.com/1")
+        append(hub, "intake", "[2026-03-02 09:00] | pending | Second | https://example.com/2")
+        assert [e["title"] for e in intake_entries(hub)] == ["Second", "First"]
+        assert "No entries yet" not in (hub / INTAKE).read_text()
+
+    def test_table_row_replaces_placeholder(self, hub):
+        append(hub, "backlog", "| B-1 | Rebate calculator | x | idea | |", section="BUILD")
+        append(hub, "backlog", "| B-2 | Pump quiz | x | idea | |", section="BUILD")
+        rows = backlog_rows(hub)
+        assert [r["id"] for r in rows] == ["B-1", "B-2"]
+        assert (hub / BACKLOG).read_text().count("*(none yet)*") == 2  # ADOPT and OFFER untouched
+
+    def test_journal_empty_after_merge(self, hub):
+        append(hub, "intake", "[2026-03-01 09:00] | pending | First | https://example.com/1")
+        assert pending(hub) == {}
+
+
+class TestUpdate:
+    def test_column_level_updates_merge(self, hub):
+        append(hub, "backlog", "| B-1 | Rebate calculator | x | idea | |", section="BUILD")
+        record(hub, "backlog", {"op": "update", "section": "BUILD", "key": "B-1", "set": {"status": "done"}})
+        record(hub, "backlog", {"op": "update", "section": "BUILD", "key": "B-1", "set": {"notes": "shipped"}})
+        assert merge(hub, "backlog") == 2
+        row = backlog_rows(hub)[0]
+        assert (row["status"], row["notes"]) == ("done", "shipped")
+
+    def test_short_row_is_padded(self, hub):
+        append(hub, "backlog", "| B-1 | Rebate calculator | x |", section="BUILD")
+        update(hub, "backlog", "BUILD", "B-1", {"notes": "shipped"})
+        append(hub, "backlog", "| B-2 | Pump quiz | x | idea | |", section="BUILD")
+        assert pending(hub) == {}
+        rows = backlog_rows(hub)
+        assert [r["id"] for r in rows] == ["B-1", "B-2"]
+        assert rows[0]["notes"] == "shipped"
+
+    def test_malformed_op_is_set_aside(self, hub):
+        bad_id = record(hub, "backlog", {"op": "append", "section": "BUILD", "text": None})
+        append(hub, "backlog", "| B-1 | Rebate calculator | x | idea | |", section="BUILD")
+        assert pending(hub) == {}
+        assert not journal_paths(hub, BACKLOG)["merging"].exists()
+        assert [r["id"] for r in backlog_rows(hub)] == ["B-1"]
+        assert rejected(hub) == {BACKLOG: 1}
+        assert read_ops(journal_paths(hub, BACKLOG)["rejected"])[0]["id"] == bad_id
+
+    def test_bad_update_fails_before_journaling(self, hub):
+        with pytest.raises(JournalError):
+            update(hub, "backlog", "BUILD", "missing", {"status": "done"})
+        assert pending(hub) == {}
+        assert rejected(hub) == {}
+
+    def test_bad_section_fails_before_journaling(self, hub):
+        with pytest.raises(JournalError):
+            append(hub, "backlog", "| B-1 | Rebate calculator | x | idea | |", section="BILD")
+        assert pending(hub) == {}
+        assert backlog_rows(hub) == []
+
+    def test_update_of_pending_row_is_accepted(self, hub):
+        with FileLock(journal_paths(hub, BACKLOG)["target_lock"]):
+            append(hub, "backlog", "| B-1 | Rebate calculator | x | idea | |", section="BUILD", timeout=0.1)
+            update(hub, "backlog", "BUILD", "B-1", {"status": "done"}, timeout=0.1)
+        merge(hub, "backlog")
+        assert backlog_rows(hub)[0]["status"] == "done"
+
+    def test_op_invalidated_by_concurrent_change_is_rejected(self, hub):
+        record(hub, "backlog", {"op": "update", "section": "BUILD", "key": "B-9", "set": {"status": "done"}})
+        assert merge(hub, "backlog") == 0
+        assert rejected(hub) == {BACKLOG: 1}
+
+
+class TestJournal:
+    def test_busy_lock_leaves_change_journaled(self, hub):
+        with FileLock(journal_paths(hub, INTAKE)["target_lock"]):
+            append(hub, "intake", "[2026-03-01 09:00] | pending | Queued | https://example.com/q", timeout=0.1)
+            assert pending(hub) == {INTAKE: 1}
+            assert "Queued" not in (hub / INTAKE).read_text()
+            assert "Queued" in read_text(hub, "intake", include_pending=True)
+        assert merge(hub, "intake") == 1
+        assert intake_entries(hub)[0]["title"] == "Queued"
+
+    def test_replays_crashed_merge_without_duplicates(self, hub):
+        line = "[2026-03-01 09:00] | pending | Once | https://example.com/1"
+        append(hub, "intake", line)
+        # Simulate a merge that swapped the file in but crashed before cleanup
+        paths = journal_paths(hub, INTAKE)
+        paths["merging"].write_text(json.dumps({"id": "x", "op": "append", "section": None, "text": line}) + "\n")
+        paths["applied"].write_text(json.dumps({"ids": ["x"], "sha256": text_hash((hub / INTAKE).read_text())}))
+        assert "Once" in read_text(hub, "intake", include_pending=True)
+        assert read_text(hub, "intake", include_pending=True).count("Once") == 1
+        merge(hub, "intake")
+        assert [e["title"] for e in intake_entries(hub)] == ["Once"]
+        assert not paths["merging"].exists()
+        assert not paths["applied"].exists()
+
+    def test_replays_merge_that_crashed_before_swap(self, hub):
+        line = "[2026-03-01 09:00] | pending | Lost | https://example.com/1"
+        paths = journal_paths(hub, INTAKE)
+        paths["merging"].parent.mkdir(parents=True, exist_ok=True)
+        paths["merging"].write_text(json.dumps({"id": "x", "op": "append", "section": None, "text": line}) + "\n")
+        paths["applied"].write_text(json.dumps({"ids": ["x"], "sha256": text_hash("something else")}))
+        assert merge(hub, "intake") == 1
+        assert [e["title"] for e in intake_entries(hub)] == ["Lost"]
+
+    def test_entry_that_prefixes_another_is_kept(self, hub):
+        append(hub, "intake", "[2026-03-01 09:00] | pending | Long | https://a.com/x-long")
+        append(hub, "intake", "[2026-03-01 09:00] | pending | Long | https://a.com/x")
+        assert [e["url"] for e in intake_entries(hub)] == ["https://a.com/x", "https://a.com/x-long"]
+
+    def test_concurrent_sessions_lose_nothing(self, hub):
+        workers, count = 4, 15
+        with multiprocessing.get_context("fork").Pool(workers) as pool:
+            pool.map(_append_many, [(str(hub), w, count) for w in range(workers)])
+        titles = {e["title"] for e in intake_entries(hub)}
+        assert titles == {f"w{w}-{i}" for w in range(workers) for i in range(count)}
@@ -0,0 +1,104 @@
+"""Test the lazy section-addressable markdown reader."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from mdreader import Entry, SectionReader, TableRow, build_index
+from synth import HubSize, generate_hub
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    SectionReader.clear_cache()
+    yield
+    SectionReader.clear_cache()
+
+
+class TestIndex:
+    def test_offsets_cover_sections(self, hub):
+        path = hub / "data/portfolio/projects.md"
+        data = path.read_bytes()
+        for heading in build_index(path):
+            assert data[heading.start:].startswith(b"#" * heading.level + b" " + heading.title.encode())
+
+    def test_nested_sections_and_parents(self, hub):
+        reader = SectionReader.open(hub / "data/research/intelligence-brief.md")
+        implement = reader.find("Implement")
+        assert implement.parent == "Action Items"
+        assert reader.find("Action Items").end >= implement.end
+
+    def test_find_by_parent_returns_first_match(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("## A\n\n### Notes\n\none\n\n## B\n\n### Notes\n\ntwo\n\n### Notes\n\nthree\n")
+        reader = SectionReader.open(path)
+        assert "one" in reader.read("Notes")
+        assert "two" in reader.read("Notes", parent="B")
+        assert reader.find("Notes", parent="C") is None
+
+    def test_ignores_headings_in_code_fences(self, tmp_path):
+        path = tmp_path / "doc.md"
+        path.write_text("## Real\n\n```\n## Not a heading\n```\n\n## Also real\n")
+        assert [h.title for h in build_index(path)] == ["Real", "Also real"]
+
+
+class TestReads:
+    def test_read_section_only(self, hub):
+        text = SectionReader.open(hub / "data/research/bookmarks.md").read("Marketing Ideas")
+        assert text.startswith("## Marketing Ideas")
+        assert "Industry Trends" not in text
+        assert "Competitor Intel" not in text
+
+    def test_missing_section_raises(self, hub):
+        with pytest.raises(KeyError):
+            SectionReader.open(hub / "data/research/bookmarks.md").read("Nope")
+
+    def test_table_rows_use_slots(self, tmp_path):
+        generate_hub(tmp_path, HubSize(backlog=9))
+        rows = list(SectionReader.open(tmp_path / "data/portfolio/implementation-backlog.md").rows("ADOPT"))
+        assert len(rows) == 3
+        assert all(isinstance(r, TableRow) and r.section == "ADOPT" for r in rows)
+        assert not hasattr(rows[0], "__dict__")
+        assert rows[0]["id"].startswith("A-")
+        assert rows[0].header is rows[1].header  # One header tuple per table
+
+    def test_entries(self, hub):
+        entries = list(SectionReader.open(hub / "data/portfolio/projects.md").entries("ACTIVE"))
+        assert [e.title for e in entries] == ["Spring marketing push", "Hire second technician"]
+        assert isinstance(entries[0], Entry)
+        assert entries[0].get("status") == "Not started"
+
+
+class TestInvalidation:
+    def test_reuses_index_until_file_changes(self, hub):
+        path = hub / "data/research/bookmarks.md"
+        reader = SectionReader.open(path)
+        headings = reader.headings
+        assert SectionReader.open(path).headings is headings
+
+        path.write_text(path.read_text() + "\n## Brand New\n\nhello\n")
+        assert "hello" in SectionReader.open(path).read("Brand New")
+
+    def test_disk_cache_survives_memory_cache(self, hub, tmp_path):
+        path = hub / "data/research/bookmarks.md"
+        cache_dir = tmp_path / "idx"
+        SectionReader.open(path, cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        SectionReader.clear_cache()
+        reader = SectionReader(path, cache_dir=cache_dir)
+        reader.refresh()
+        assert reader.find("Marketing Ideas") is not None
+
+    def test_stale_disk_cache_rebuilt(self, hub, tmp_path):
+        path = hub / "data/research/bookmarks.md"
+        cache_dir = tmp_path / "idx"
+        SectionReader.open(path, cache_dir=cache_dir)
+        SectionReader.clear_cache()
+        path.write_text("## Only\n")
+        os.utime(path, ns=(1, 1))
+        assert SectionReader.open(path, cache_dir=cache_dir).sections() == ["Only"]
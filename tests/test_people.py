@@ -0,0 +1,170 @@
+"""Test the incremental people-to-watch ranking."""
+
+import multiprocessing
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from archive import ARCHIVE_DIRS
+from archive import run as archive_run
+from hubdata import parse_bookmarks
+from hublock import FileLock
+from people import (
+    BACKLOG_PATH,
+    BOOKMARKS_PATH,
+    LOCK_PATH,
+    PEOPLE_PATH,
+    STATE_PATH,
+    PeopleIndex,
+    add_bookmark,
+    follow_priority,
+    rebuild,
+    write_people,
+)
+
+
+def bookmark(n, author="Jane Doe", day="2026-03-01", topic="Industry Trends"):
+    return {
+        "topic": topic,
+        "title": f"Post {n}",
+        "author": author,
+        "date": day,
+        "url": f"https://x.com/{author.split()[0].lower()}/status/{n}",
+    }
+
+
+def _add_many(args):
+    hub, worker, count = args
+    hub = Path(hub)
+    for n in range(count):
+        with FileLock(hub / LOCK_PATH):
+            index = PeopleIndex.load(hub / STATE_PATH)
+            add_bookmark(hub, index, bookmark(worker * 100 + n, author=f"Author {worker}"))
+            index.save()
+
+
+@pytest.fixture
+def index(hub):
+    return PeopleIndex(hub / "state.json")
+
+
+class TestPeopleIndex:
+    def test_record_aggregates(self, index):
+        index.record(bookmark(1))
+        index.record(bookmark(2, topic="Marketing Ideas"))
+        agg = index.authors["Jane Doe"]
+        assert agg["entries"] == 2
+        assert agg["platform"] == "X"
+        assert agg["topics"] == {"Industry Trends": 1, "Marketing Ideas": 1}
+
+    def test_record_skips_duplicates(self, index):
+        assert index.record(bookmark(1))
+        assert not index.record(bookmark(1))
+        assert index.authors["Jane Doe"]["entries"] == 1
+
+    def test_recency_decay(self, index):
+        index.record(bookmark(1, day="2026-01-01"))
+        index.record(bookmark(2, author="Sam Lee", day="2026-06-01"))
+        ranked = index.ranked(on=date(2026, 6, 1))
+        assert [r["name"] for r in ranked] == ["Sam Lee", "Jane Doe"]
+        assert ranked[1]["score"] == pytest.approx(0.5 ** (151 / 90))
+
+    def test_out_of_order_dates_match_in_order(self, hub):
+        forward = PeopleIndex(hub / "a.json")
+        backward = PeopleIndex(hub / "b.json")
+        days = ["2026-01-01", "2026-02-15", "2026-05-01"]
+        for n, day in enumerate(days):
+            forward.record(bookmark(n, day=day))
+        for n, day in reversed(list(enumerate(days))):
+            backward.record(bookmark(n, day=day))
+        on = date(2026, 6, 1)
+        assert forward.ranked(on)[0]["score"] == pytest.approx(backward.ranked(on)[0]["score"])
+
+    def test_save_and_load(self, index):
+        index.record(bookmark(1))
+        index.save()
+        loaded = PeopleIndex.load(index.path)
+        assert loaded.authors == index.authors
+        assert not loaded.record(bookmark(1))
+
+
+class TestActioned:
+    def test_counts_backlog_sources(self, hub, index):
+        index.record(bookmark(1))
+        backlog = hub / BACKLOG_PATH
+        backlog.write_text(backlog.read_text().replace(
+            "| *(none yet)* | — | — | — | — |",
+            "| B-1 | Rebate calculator | https://x.com/jane/status/1 | idea | |", 1,
+        ))
+        assert index.refresh_actioned(backlog)
+        assert index.authors["Jane Doe"]["actioned"] == 1
+
+    def test_counts_archived_rows(self, hub, index):
+        index.record(bookmark(1))
+        backlog = hub / BACKLOG_PATH
+        backlog.write_text(backlog.read_text().replace(
+            "| *(none yet)* | — | — | — | — |",
+            "| B-1 | Rebate calculator | https://x.com/jane/status/1 | done | 2025-06-01 |", 1,
+        ))
+        archive_run(hub, today=date(2026, 3, 1))
+        assert "B-1" not in backlog.read_text()
+        assert index.refresh_actioned(backlog, hub / ARCHIVE_DIRS["backlog"])
+        assert index.authors["Jane Doe"]["actioned"] == 1
+
+    def test_skips_unchanged_backlog(self, hub, index):
+        index.record(bookmark(1))
+        assert index.refresh_actioned(hub / BACKLOG_PATH)
+        assert not index.refresh_actioned(hub / BACKLOG_PATH)
+
+
+class TestFiles:
+    def test_add_bookmark_writes_and_records(self, hub, index):
+        assert add_bookmark(hub, index, bookmark(1))
+        assert not add_bookmark(hub, index, bookmark(1))
+        assert (hub / BOOKMARKS_PATH).read_text().count("### Post 1") == 1
+
+    def test_rebuild_matches_incremental(self, hub, index):
+        for n in range(3):
+            add_bookmark(hub, index, bookmark(n, author=["Jane Doe", "Sam Lee"][n % 2]))
+        rebuilt = rebuild(hub, hub / "rebuilt.json")
+        assert rebuilt.authors == index.authors
+
+    def test_concurrent_adds_lose_nothing(self, hub):
+        workers, count = 4, 10
+        with multiprocessing.get_context("fork").Pool(workers) as pool:
+            pool.map(_add_many, [(str(hub), w, count) for w in range(workers)])
+        titles = {e["title"] for e in parse_bookmarks((hub / BOOKMARKS_PATH).read_text().splitlines())}
+        assert len(titles) == workers * count
+        index = PeopleIndex.load(hub / STATE_PATH)
+        assert sum(agg["entries"] for agg in index.authors.values()) == workers * count
+
+    def test_write_people_keeps_header(self, hub, index):
+        index.record(bookmark(1))
+        write_people(hub, index, on=date(2026, 3, 1))
+        text = (hub / PEOPLE_PATH).read_text()
+        assert "Asheville Pool Pros" in text
+        assert "| Jane Doe | X | 1 bookmark; topics: Industry Trends; last seen 2026-03-01 | Low |" in text
+
+    def test_write_people_keeps_hand_added_rows(self, hub, index):
+        index.record(bookmark(1))
+        path = hub / PEOPLE_PATH
+        path.write_text(path.read_text() + "\n| Name | Platform | Why | Follow Priority |\n"
+                        "|------|----------|-----|-----------------|\n"
+                        "| Pat Smith | YouTube | Great pump teardown videos | High |\n"
+                        "| Jane Doe | X | stale hand row | Low |\n")
+        write_people(hub, index, on=date(2026, 3, 1))
+        write_people(hub, index, on=date(2026, 3, 2))
+        text = path.read_text()
+        assert text.count("| Pat Smith | YouTube | Great pump teardown videos | High |") == 1
+        assert "stale hand row" not in text
+        assert text.index("| Jane Doe |") < text.index("| Pat Smith |")
+
+
+def test_follow_priority():
+    assert follow_priority(5) == "High"
+    assert follow_priority(2) == "Medium"
+    assert follow_priority(0.1) == "Low"
@@ -0,0 +1,149 @@
+"""Test the content pipeline flow engine."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate import generate_all, generate_content_pipeline
+from hubdata import parse_pipeline
+from hublock import FileLock, LockTimeout, journal_paths
+from pipeline import (
+    PIPELINE_PATH,
+    Pipeline,
+    PipelineError,
+    cycle_times,
+    read_events,
+    render_report,
+    weekly_throughput,
+)
+
+
+@pytest.fixture
+def flow(hub, sample_config):
+    flow = Pipeline.load(hub, sample_config["platforms"])
+    flow.add("Facebook", "Spring promo", priority="Medium", due="2026-04-01")
+    flow.add("Facebook", "Pump tips", priority="Low", due="2026-03-15")
+    flow.add("Google Business Profile", "Opening special", priority="High", due="2026-04-01")
+    flow.add("Google Business Profile", "Someday post")
+    flow.save()
+    return Pipeline.load(hub, sample_config["platforms"])
+
+
+class TestQueue:
+    def test_next_up_orders_by_due_then_priority(self, flow):
+        titles = [item["title"] for item in flow.next_up(4)]
+        assert titles == ["Pump tips", "Opening special", "Spring promo", "Someday post"]
+
+    def test_next_up_is_non_destructive(self, flow):
+        assert flow.next_up(2) == flow.next_up(2)
+
+    def test_published_items_leave_queue(self, flow):
+        flow.move("Facebook", "Pump tips", "Published")
+        assert flow.peek()["title"] == "Opening special"
+
+    def test_reprioritized_item_requeued(self, flow):
+        flow.set_fields("Facebook", "Spring promo", due="2026-03-01")
+        assert flow.peek()["title"] == "Spring promo"
+        assert len(flow.next_up(10)) == 4
+
+    def test_unknown_stage_rejected(self, flow):
+        with pytest.raises(PipelineError):
+            flow.move("Facebook", "Pump tips", "Shipped")
+
+
+class TestSave:
+    def test_roundtrip_through_file(self, hub, flow):
+        rows = list(parse_pipeline((hub / PIPELINE_PATH).read_text().splitlines()))
+        assert len(rows) == 4
+        assert {r["platform"] for r in rows} == {"Facebook", "Google Business Profile"}
+
+    def test_only_changed_tables_rewritten(self, hub, flow):
+        path = hub / PIPELINE_PATH
+        # Hand-edit the other platform's table; a Facebook-only save must not touch it
+        text = path.read_text().replace("| Someday post |", "| Someday post (edited) |")
+        path.write_text(text)
+        flow.move("Facebook", "Spring promo", "Draft")
+        assert flow.save() == ["Facebook"]
+        saved = path.read_text()
+        assert "Someday post (edited)" in saved
+        assert "| Spring promo | Draft | Medium | 2026-04-01 |  |" in saved
+
+    def test_new_platform_section_created(self, tmp_path, minimal_config):
+        generate_all(minimal_config, tmp_path)
+        flow = Pipeline.load(tmp_path)
+        flow.add("Newsletter", "March issue")
+        flow.save()
+        text = (tmp_path / PIPELINE_PATH).read_text()
+        assert "No platforms configured" not in text
+        assert list(parse_pipeline(text.splitlines()))[0]["platform"] == "Newsletter"
+
+
+class TestMetrics:
+    def test_wip_per_stage(self, flow):
+        flow.move("Facebook", "Pump tips", "Draft")
+        wip = flow.wip()
+        assert wip["Idea"] == 3
+        assert wip["Draft"] == 1
+        assert "Published" not in wip
+
+    def test_cycle_time_and_throughput(self, hub, sample_config):
+        flow = Pipeline.load(hub, sample_config["platforms"])
+        flow.add("Facebook", "A", when=datetime(2026, 3, 2))
+        flow.move("Facebook", "A", "Draft", when=datetime(2026, 3, 4))
+        flow.move("Facebook", "A", "Published", when=datetime(2026, 3, 6))
+        flow.add("Facebook", "B", when=datetime(2026, 3, 3))
+        flow.move("Facebook", "B", "Published", when=datetime(2026, 3, 13))
+        assert read_events(hub) == []
+        flow.save()
+        events = read_events(hub)
+        assert cycle_times(events) == {"Facebook": [4.0, 10.0]}
+        assert weekly_throughput(events, sample_config["platforms"]) == {
+            "Facebook": {"2026-W10": 1, "2026-W11": 1}}
+        assert "| Facebook | 2 | 7.0 | 10.0 |" in render_report(flow, events, sample_config["platforms"])
+
+
+def test_template_loads_empty(tmp_path, sample_config):
+    (tmp_path / PIPELINE_PATH).parent.mkdir(parents=True)
+    (tmp_path / PIPELINE_PATH).write_text(generate_content_pipeline(sample_config))
+    flow = Pipeline.load(tmp_path, sample_config["platforms"])
+    assert flow.items == {}
+    assert flow.peek() is None
+
+
+def test_save_keeps_rows_added_by_other_sessions(hub, flow, sample_config):
+    other = Pipeline.load(hub, sample_config["platforms"])
+    other.add("Facebook", "From another session")
+    other.save()
+    flow.move("Facebook", "Pump tips", "Draft")
+    flow.save()
+    titles = {r["title"] for r in parse_pipeline((hub / PIPELINE_PATH).read_text().splitlines())}
+    assert "From another session" in titles
+
+
+def test_save_keeps_other_sessions_edits(hub, flow, sample_config):
+    other = Pipeline.load(hub, sample_config["platforms"])
+    flow.move("Facebook", "Pump tips", "Draft")
+    other.move("Facebook", "Spring promo", "Review")
+    other.set_fields("Facebook", "Pump tips", notes="from other")
+    flow.save()
+    other.save()
+    rows = {r["title"]: r for r in parse_pipeline((hub / PIPELINE_PATH).read_text().splitlines())}
+    assert rows["Pump tips"]["stage"] == "Draft"
+    assert rows["Pump tips"]["notes"] == "from other"
+    assert rows["Spring promo"]["stage"] == "Review"
+    assert other.get("Facebook", "Pump tips")["stage"] == "Draft"
+
+
+def test_locked_save_logs_no_events(hub, sample_config):
+    flow = Pipeline.load(hub, sample_config["platforms"])
+    flow.add("Facebook", "Busy")
+    with FileLock(journal_paths(hub, PIPELINE_PATH.as_posix())["target_lock"]):
+        with pytest.raises(LockTimeout):
+            flow.save(timeout=0.1)
+    assert read_events(hub) == []
+    flow.save()
+    assert [e["title"] for e in read_events(hub)] == ["Busy"]
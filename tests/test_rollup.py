@@ -0,0 +1,144 @@
+"""Test the cross-client rollup."""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from archive import run as archive_run
+from generate import generate_all
+from rollup import (
+    CACHE_NAME,
+    REPORT_JSON,
+    REPORT_MD,
+    collect,
+    discover_hubs,
+    reduce_summaries,
+    run_rollup,
+    summarize_hub,
+)
+
+
+def make_hub(root, name, sample_config, pending=1, done=0):
+    hub = root / name
+    config = {**sample_config, "business_name": name}
+    generate_all(config, hub)
+    (hub / "config.json").write_text(json.dumps(config))
+    intake = hub / "data/research/intake-log.md"
+    lines = [f"[2026-03-0{i + 1} 09:00] | pending | Link {i} | https://example.com/{i}" for i in range(pending)]
+    intake.write_text(intake.read_text() + "\n".join(lines) + "\n")
+    backlog = hub / "data/portfolio/implementation-backlog.md"
+    rows = "\n".join(f"| B-{i} | Idea {i} | x | done | |" for i in range(done))
+    backlog.write_text(backlog.read_text().replace("| *(none yet)* | — | — | — | — |", rows or "| *(none yet)* | — | — | — | — |", 1))
+    projects = hub / "data/portfolio/projects.md"
+    projects.write_text(projects.read_text().replace(
+        "| *(none yet)* | — | — | — | — |", "| 1 | Add SMS reminders | bookmarks | 3 | open |"))
+    return hub
+
+
+@pytest.fixture
+def clients(tmp_path, sample_config):
+    root = tmp_path / "clients"
+    make_hub(root, "Alpha Pools", sample_config, pending=2, done=1)
+    make_hub(root, "Beta Plumbing", sample_config, pending=1, done=3)
+    return root
+
+
+class TestDiscover:
+    def test_finds_hub_roots(self, clients):
+        assert [h.name for h in discover_hubs(clients)] == ["Alpha Pools", "Beta Plumbing"]
+
+    def test_ignores_dirs_without_data(self, clients):
+        (clients / "notes").mkdir()
+        (clients / "notes" / "config.json").write_text("{}")
+        assert len(discover_hubs(clients)) == 2
+
+
+class TestSummarize:
+    def test_summary_counts(self, clients):
+        summary = summarize_hub(clients / "Alpha Pools")
+        assert summary["business_name"] == "Alpha Pools"
+        assert summary["intake"]["by_status"] == {"pending": 2}
+        assert summary["backlog"]["by_status"] == {"done": 1}
+        assert summary["recommendations"][0]["votes"] == 3
+        assert len(summary["projects"]) == 2
+
+
+class TestCollect:
+    def test_unchanged_hubs_served_from_cache(self, clients, tmp_path):
+        hubs = discover_hubs(clients)
+        cache = tmp_path / "out" / CACHE_NAME
+        _, parsed = collect(hubs, cache, workers=2)
+        assert parsed == 2
+        _, parsed = collect(hubs, cache, workers=2)
+        assert parsed == 0
+
+    def test_changed_hub_reparsed(self, clients, tmp_path):
+        hubs = discover_hubs(clients)
+        cache = tmp_path / "out" / CACHE_NAME
+        collect(hubs, cache)
+        intake = clients / "Beta Plumbing/data/research/intake-log.md"
+        intake.write_text(intake.read_text() + "[2026-03-09 09:00] | pending | New | https://example.com/n\n")
+        summaries, parsed = collect(hubs, cache)
+        assert parsed == 1
+        assert summaries[1]["intake"]["by_status"]["pending"] == 2
+
+
+class TestReduce:
+    def test_totals_and_staleness(self, clients):
+        summaries = [summarize_hub(h) for h in discover_hubs(clients)]
+        last_touched = summaries[0]["projects"][0]["last_touched"]
+        on = date.fromisoformat(last_touched).replace(year=date.fromisoformat(last_touched).year + 1)
+        report = reduce_summaries(summaries, on=on)
+        assert report["totals"]["pending_intake"] == 3
+        assert report["totals"]["stale_projects"] == 4
+        assert report["totals"]["backlog_done"] == 4
+        assert report["hubs"][0]["backlog_throughput"] is None
+
+    def test_throughput_against_week_old_history(self, clients):
+        summaries = [summarize_hub(h) for h in discover_hubs(clients)]
+        history = {summaries[1]["hub"]: {"2026-02-20": 0, "2026-02-22": 1, "2026-02-28": 3}}
+        report = reduce_summaries(summaries, history, on=date(2026, 3, 1))
+        beta = next(h for h in report["hubs"] if h["client"] == "Beta Plumbing")
+        assert beta["baseline"] == "2026-02-22"
+        assert beta["backlog_throughput"] == 2
+        assert report["totals"]["backlog_throughput"] == 2
+        explicit = reduce_summaries(summaries, history, on=date(2026, 3, 1), since=date(2026, 2, 21))
+        assert explicit["totals"]["backlog_throughput"] == 3
+
+    def test_archived_rows_still_count(self, clients):
+        beta = clients / "Beta Plumbing"
+        before = summarize_hub(beta)["backlog"]
+        backlog = beta / "data/portfolio/implementation-backlog.md"
+        backlog.write_text(backlog.read_text().replace("| done | |", "| done | 2025-01-05 |"))
+        archive_run(beta, today=date(2026, 3, 1))
+        assert "| done |" not in backlog.read_text()
+        assert summarize_hub(beta)["backlog"] == before
+
+
+def test_rerun_keeps_throughput_baseline(clients, tmp_path):
+    out = tmp_path / "out"
+    run_rollup(clients, out, on=date(2026, 3, 1))
+    backlog = clients / "Beta Plumbing/data/portfolio/implementation-backlog.md"
+    backlog.write_text(backlog.read_text().replace(
+        "| B-0 | Idea 0 | x | done | |", "| B-0 | Idea 0 | x | done | |\n| B-9 | Idea 9 | x | done | |", 1))
+    run_rollup(clients, out, on=date(2026, 3, 8))
+    report, _ = run_rollup(clients, out, on=date(2026, 3, 8))
+    beta = next(h for h in report["hubs"] if h["client"] == "Beta Plumbing")
+    assert beta["baseline"] == "2026-03-01"
+    assert beta["backlog_throughput"] == 1
+    assert "+1 since 2026-03-01" in (out / REPORT_MD).read_text()
+
+
+def test_run_rollup_writes_reports(clients, tmp_path):
+    out = tmp_path / "out"
+    report, parsed = run_rollup(clients, out, workers=2)
+    assert parsed == 2
+    assert json.loads((out / REPORT_JSON).read_text())["totals"]["hubs"] == 2
+    md = (out / REPORT_MD).read_text()
+    assert "| Beta Plumbing | 1 |" in md
+    assert "Add SMS reminders" in md
@@ -0,0 +1,133 @@
+"""Test hub snapshot export and import."""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from generate import generate_all
+from snapshot import (
+    SCHEMA_VERSION,
+    SnapshotError,
+    export_snapshot,
+    import_snapshot,
+    iter_snapshot_records,
+)
+from transcripts import convert
+
+
+@pytest.fixture
+def hub(tmp_path, sample_config):
+    root = tmp_path / "hub"
+    generate_all(sample_config, root)
+    (root / "config.json").write_text(json.dumps(sample_config))
+    intake = root / "data/research/intake-log.md"
+    intake.write_text(intake.read_text() + "\n[2026-03-01 09:30] | processed | Pump rebates | https://example.com/a\n")
+    tools = root / "data/knowledge/tools"
+    tools.mkdir(parents=True)
+    (tools / "crm.md").write_text("# Pool CRM review\n\nSolid scheduling.\n")
+    (tools / "logo.bin").write_bytes(bytes(range(256)))
+    return root
+
+
+def all_files(root):
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in root.rglob("*")
+            if p.is_file() and "logs" not in p.parts}
+
+
+class TestExport:
+    def test_header_has_schema_version(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        with gzip.open(dest, "rt") as f:
+            assert json.loads(f.readline())["schema"] == SCHEMA_VERSION
+
+    def test_contains_parsed_records(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        end = export_snapshot(hub, dest)
+        intake = [r["data"] for r in iter_snapshot_records(dest, "intake")]
+        projects = [r["data"]["name"] for r in iter_snapshot_records(dest, "project")]
+        knowledge = [r["data"]["title"] for r in iter_snapshot_records(dest, "knowledge")]
+        assert intake[0]["title"] == "Pump rebates"
+        assert "Spring marketing push" in projects
+        assert "Pool CRM review" in knowledge
+        assert end["files"] == len(all_files(hub))
+
+    def test_packed_transcript_title(self, hub, tmp_path):
+        folder = hub / "data/knowledge/transcripts"
+        folder.mkdir(parents=True)
+        (folder / "talk.txt").write_text("# Pump install walkthrough\n[00:00:01] Hello\n")
+        convert(folder / "talk.txt")
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        titles = {r["data"]["name"]: r["data"]["title"] for r in iter_snapshot_records(dest, "knowledge")}
+        assert titles["talk.tsz"] == "Pump install walkthrough"
+
+
+class TestImport:
+    def test_roundtrip_is_byte_exact(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        restored_root = tmp_path / "restored"
+        restored = import_snapshot(dest, restored_root)
+        assert all_files(restored_root) == all_files(hub)
+        assert "data/knowledge/tools/logo.bin" in restored
+
+    def test_skips_existing_without_force(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        intake = hub / "data/research/intake-log.md"
+        intake.write_text("USER DATA HERE")
+
+        assert "data/research/intake-log.md" not in import_snapshot(dest, hub)
+        assert intake.read_text() == "USER DATA HERE"
+        import_snapshot(dest, hub, force=True)
+        assert "Pump rebates" in intake.read_text()
+
+    def test_rejects_unsafe_paths(self, tmp_path):
+        dest = tmp_path / "evil.jsonl.gz"
+        with gzip.open(dest, "wt") as f:
+            f.write(json.dumps({"type": "header", "schema": SCHEMA_VERSION}) + "\n")
+            f.write(json.dumps({"type": "file", "path": "../escape.txt", "size": 1, "mtime": 0}) + "\n")
+        with pytest.raises(SnapshotError):
+            import_snapshot(dest, tmp_path / "hub")
+        assert not (tmp_path / "escape.txt").exists()
+
+    def test_rejects_wrong_schema(self, tmp_path):
+        dest = tmp_path / "old.jsonl.gz"
+        with gzip.open(dest, "wt") as f:
+            f.write(json.dumps({"type": "header", "schema": 999}) + "\n")
+        with pytest.raises(SnapshotError):
+            import_snapshot(dest, tmp_path / "hub")
+
+    def test_truncated_snapshot_restores_nothing(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        dest.write_bytes(dest.read_bytes()[:dest.stat().st_size // 2])
+        restored_root = tmp_path / "restored"
+        with pytest.raises(SnapshotError, match="truncated"):
+            import_snapshot(dest, restored_root)
+        assert all_files(restored_root) == {}  # no restored files, no leftover .restore files
+
+    def test_missing_end_record_restores_nothing(self, hub, tmp_path):
+        dest = tmp_path / "snap.jsonl.gz"
+        export_snapshot(hub, dest)
+        with gzip.open(dest, "rt") as f:
+            lines = f.readlines()[:-1]
+        with gzip.open(dest, "wt") as f:
+            f.writelines(lines)
+        with pytest.raises(SnapshotError, match="no end record"):
+            import_snapshot(dest, tmp_path / "restored")
+        assert all_files(tmp_path / "restored") == {}
+
+    def test_corrupt_record_is_snapshot_error(self, tmp_path):
+        dest = tmp_path / "bad.jsonl.gz"
+        with gzip.open(dest, "wt") as f:
+            f.write(json.dumps({"type": "header", "schema": SCHEMA_VERSION}) + "\n")
+            f.write('{"type": "file", "path\n')
+        with pytest.raises(SnapshotError):
+            import_snapshot(dest, tmp_path / "hub")
@@ -0,0 +1,102 @@
+"""Test cached, parallel stack detection."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from stack_scan import dependency_stacks, match_marker, scan, summarize
+
+
+def write(path: Path, text: str = ""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    root = tmp_path / "mono"
+    write(root / "package.json", "{}")
+    write(root / "pnpm-lock.yaml")
+    write(root / ".gitignore", "generated/\n")
+    write(root / "apps/web/package.json", json.dumps({"dependencies": {"next": "14", "react": "18"}}))
+    write(root / "apps/web/next.config.mjs")
+    write(root / "apps/api/requirements.txt", "fastapi==0.110\nuvicorn\n")
+    write(root / "apps/api/Dockerfile")
+    write(root / "infra/main.tf")
+    write(root / "node_modules/vue/package.json", "{}")
+    write(root / "apps/web/.next/package.json", "{}")
+    write(root / "generated/Cargo.toml")
+    return root
+
+
+@pytest.fixture
+def hub(tmp_path):
+    return tmp_path / "hub"
+
+
+class TestMarkers:
+    def test_exact_and_glob(self):
+        assert match_marker("yarn.lock") == ("lockfile", "Yarn")
+        assert match_marker("vite.config.ts") == ("config", "Vite")
+        assert match_marker("App.csproj") == ("manifest", ".NET")
+        assert match_marker("README.md") is None
+
+    def test_dependencies(self, tmp_path):
+        write(tmp_path / "pyproject.toml", '[project]\ndependencies = ["Django>=5", "celery[redis]"]\n')
+        assert dependency_stacks(tmp_path / "pyproject.toml") == ["Celery", "Django"]
+        write(tmp_path / "package.json", "not json")
+        assert dependency_stacks(tmp_path / "package.json") == []
+
+
+class TestScan:
+    def test_detects_stack_and_prunes(self, hub, monorepo):
+        result = scan(hub, monorepo, workers=1)
+        assert result["stacks"]["Next.js"] == ["apps/web"]
+        assert result["stacks"]["Node.js"] == [".", "apps/web"]
+        assert {"pnpm", "Python", "FastAPI", "Docker", "Terraform", "React"} <= set(result["stacks"])
+        # node_modules, .next (vendor) and generated/ (gitignored) were never entered
+        assert "Vue" not in result["stacks"] and "Rust" not in result["stacks"]
+        assert not any("node_modules" in m["dir"] or "generated" in m["dir"] for m in result["markers"])
+        assert summarize(result).startswith("Node.js")
+
+    def test_parallel_matches_serial(self, hub, tmp_path, monorepo):
+        serial = scan(hub, monorepo, workers=1)
+        parallel = scan(tmp_path / "other-hub", monorepo, workers=2)
+        assert parallel["stacks"] == serial["stacks"]
+
+    def test_unchanged_tree_is_served_from_cache(self, hub, monorepo):
+        first = scan(hub, monorepo)
+        assert first["rescanned"] == first["dirs"]
+        again = scan(hub, monorepo)
+        assert again["rescanned"] == 0
+        assert again["stacks"] == first["stacks"]
+
+    def test_new_marker_rescans_only_its_directory(self, hub, monorepo):
+        scan(hub, monorepo)
+        write(monorepo / "apps/api/go.mod")
+        result = scan(hub, monorepo)
+        assert result["rescanned"] == 1
+        assert result["stacks"]["Go"] == ["apps/api"]
+
+    def test_edited_manifest_is_reread(self, hub, monorepo):
+        scan(hub, monorepo)
+        manifest = monorepo / "apps/web/package.json"
+        manifest.write_text(json.dumps({"dependencies": {"vue": "3"}}))
+        st = manifest.stat()
+        os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        stacks = scan(hub, monorepo)["stacks"]
+        assert "Vue" in stacks and "React" not in stacks
+
+    def test_gitignore_change_reprunes(self, hub, monorepo):
+        scan(hub, monorepo)
+        gitignore = monorepo / ".gitignore"
+        gitignore.write_text("infra/\n")
+        st = gitignore.stat()
+        os.utime(gitignore, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        stacks = scan(hub, monorepo)["stacks"]
+        assert "Terraform" not in stacks and "Rust" in stacks
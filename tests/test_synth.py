@@ -0,0 +1,91 @@
+"""Test the synthetic hub generator, plus scale tests that use it."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from hubdata import PARSERS, parse_backlog, parse_bookmarks, parse_intake, parse_projects
+from snapshot import export_snapshot, import_snapshot
+from synth import SIZES, HubSize, generate_hub, resolve_size
+
+
+def count(path, parser):
+    with open(path) as f:
+        return sum(1 for _ in parser(f))
+
+
+class TestGenerateHub:
+    def test_sizes_match_request(self, tmp_path):
+        size = HubSize(intake=500, bookmarks=120, backlog=30, projects=25)
+        generate_hub(tmp_path, size, seed=3)
+        assert count(tmp_path / "data/research/intake-log.md", parse_intake) == 500
+        assert count(tmp_path / "data/research/bookmarks.md", parse_bookmarks) == 120
+        assert count(tmp_path / "data/portfolio/implementation-backlog.md", parse_backlog) == 30
+        projects = count(tmp_path / "data/portfolio/projects.md", parse_projects)
+        assert projects == 25 + 2  # Plus one recommendation per ten projects
+
+    def test_reported_bytes_match_files(self, tmp_path):
+        written = generate_hub(tmp_path, HubSize(intake=50, bookmarks=20), seed=5)
+        for rel, size in written.items():
+            assert (tmp_path / rel).stat().st_size == size
+
+    def test_same_seed_same_hub(self, tmp_path):
+        generate_hub(tmp_path / "a", HubSize(), seed=7)
+        generate_hub(tmp_path / "b", HubSize(), seed=7)
+        for rel in PARSERS:
+            assert (tmp_path / "a" / rel).read_text() == (tmp_path / "b" / rel).read_text()
+
+    def test_different_seed_different_hub(self, tmp_path):
+        generate_hub(tmp_path / "a", HubSize(), seed=1)
+        generate_hub(tmp_path / "b", HubSize(), seed=2)
+        rel = "data/research/bookmarks.md"
+        assert (tmp_path / "a" / rel).read_text() != (tmp_path / "b" / rel).read_text()
+
+    def test_every_project_tier_populated(self, tmp_path):
+        generate_hub(tmp_path, HubSize(projects=10))
+        with open(tmp_path / "data/portfolio/projects.md") as f:
+            tiers = {p["tier"] for p in parse_projects(f)}
+        assert {"ACTIVE", "READY", "INCUBATING", "SUPPORTING", "DORMANT"} <= tiers
+
+    def test_backlog_cites_bookmark_urls(self, tmp_path):
+        generate_hub(tmp_path, HubSize())
+        with open(tmp_path / "data/research/bookmarks.md") as f:
+            urls = {b["url"] for b in parse_bookmarks(f)}
+        with open(tmp_path / "data/portfolio/implementation-backlog.md") as f:
+            assert all(row["source"] in urls for row in parse_backlog(f))
+
+    def test_writes_transcripts(self, tmp_path):
+        written = generate_hub(tmp_path, HubSize(transcripts=3, transcript_minutes=5))
+        transcripts = sorted((tmp_path / "data/knowledge/transcripts").glob("*.txt"))
+        assert len(transcripts) == 3
+        assert transcripts[0].read_text().splitlines()[2].startswith("[00:00:00]")
+        assert sum(written.values()) > 0
+
+
+def test_resolve_size_overrides():
+    size = resolve_size("medium", intake=10, bookmarks=None)
+    assert size.intake == 10
+    assert size.bookmarks == SIZES["medium"].bookmarks
+
+
+@pytest.mark.scale
+class TestScale:
+    def test_production_hub_parses(self, synthetic_hub):
+        hub = synthetic_hub("production", seed=1)
+        assert count(hub / "data/research/intake-log.md", parse_intake) == 1_000_000
+        assert count(hub / "data/research/bookmarks.md", parse_bookmarks) == 100_000
+        assert count(hub / "data/portfolio/implementation-backlog.md", parse_backlog) == 10_000
+
+    def test_snapshot_roundtrip_medium(self, synthetic_hub, tmp_path):
+        hub = synthetic_hub("medium", seed=1)
+        start = time.perf_counter()
+        export_snapshot(hub, tmp_path / "snap.jsonl.gz")
+        import_snapshot(tmp_path / "snap.jsonl.gz", tmp_path / "restored")
+        elapsed = time.perf_counter() - start
+        rel = "data/research/intake-log.md"
+        assert (tmp_path / "restored" / rel).read_bytes() == (hub / rel).read_bytes()
+        assert elapsed < 120
@@ -0,0 +1,84 @@
+"""Test the chunked, compressed transcript store."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synth import Synth, HubSize, write_transcript
+from transcripts import (TranscriptError, TranscriptReader, convert, convert_dir, open_transcript,
+                         parse_timestamp)
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "talk.txt"
+    write_transcript(path, Synth(7, HubSize(transcript_minutes=60), datetime(2026, 3, 1)))
+    return path
+
+
+class TestConvert:
+    @pytest.mark.parametrize("codec", ["zlib", "lzma"])
+    def test_round_trip_and_smaller(self, transcript, codec):
+        raw = transcript.read_bytes()
+        result = convert(transcript, codec=codec, chunk_size=8192)
+        assert not transcript.exists()
+        assert result["packed"] * 3 < result["raw"]
+        reader = open_transcript(transcript)
+        assert reader.read_bytes() == raw
+        assert len(reader.chunks) > 5
+
+    def test_keep_original(self, transcript):
+        convert(transcript, keep=True)
+        assert transcript.exists()
+        assert transcript.with_suffix(".tsz").exists()
+
+    def test_convert_dir_skips_current(self, transcript):
+        assert len(convert_dir(transcript.parent, keep=True)) == 1
+        assert convert_dir(transcript.parent, keep=True) == []
+
+    def test_rejects_non_store(self, tmp_path):
+        bogus = tmp_path / "x.tsz"
+        bogus.write_bytes(b"plain text, not a store")
+        with pytest.raises(TranscriptError):
+            TranscriptReader(bogus)
+
+
+class TestRandomAccess:
+    @pytest.fixture
+    def packed(self, transcript):
+        raw = transcript.read_bytes()
+        convert(transcript, chunk_size=4096)
+        return open_transcript(transcript), raw
+
+    def test_byte_range_spanning_chunks(self, packed):
+        reader, raw = packed
+        assert reader.read_bytes(3000, 20000) == raw[3000:20000]
+        assert reader.read_bytes(len(raw) - 10) == raw[-10:]
+
+    def test_time_range(self, packed):
+        reader, raw = packed
+        text = reader.read_time(parse_timestamp("00:30:00"), parse_timestamp("00:31:00"))
+        stamps = [parse_timestamp(line[1:9]) for line in text.splitlines()]
+        assert stamps == sorted(stamps)
+        # The passage already playing at 30:00, then everything up to 31:00
+        assert stamps[0] <= 1800 < stamps[1]
+        assert stamps[-1] <= 1860
+        assert text in raw.decode()
+
+    def test_time_lookup_touches_few_chunks(self, packed, monkeypatch):
+        reader, _ = packed
+        seen = []
+        original = reader.chunk
+        monkeypatch.setattr(reader, "chunk", lambda i: seen.append(i) or original(i))
+        reader.read_time(parse_timestamp("00:45:00"))
+        assert len(set(seen)) <= 3
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp("01:02:03") == 3723
+        assert parse_timestamp("02:03") == 123
+        with pytest.raises(TranscriptError):
+            parse_timestamp("soon")